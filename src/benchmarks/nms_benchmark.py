@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+NMS 마이크로 벤치마크
+
+밀집 장면(사람 다수 + 머리/몸통에 겹친 안전모/조끼 + 객체마다 여러 앵커)의
+합성 YOLOv8 출력으로 기존 클래스 무관 NMS와 PPEDetector의 클래스별 NMS
+(NMS 전 상위 후보 제한, 최대 감지 수 제한)를 비교한다.
+
+사용법:
+    python3 src/benchmarks/nms_benchmark.py
+    python3 src/benchmarks/nms_benchmark.py --persons 60 --anchors-per-object 40
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'components' / 'ppe_detector'))
+
+from ppe_model import PPEDetector, PPE_CLASSES  # noqa: E402
+from detection_delta import iou_matrix  # noqa: E402
+
+NUM_ANCHORS = 8400
+
+
+def make_detector(max_candidates: int, max_detections: int) -> PPEDetector:
+    """모델 로드 없이 후처리만 사용하는 PPEDetector 생성"""
+    detector = PPEDetector.__new__(PPEDetector)
+    detector.confidence_threshold = 0.5
+    detector.iou_threshold = 0.45
+    detector.input_size = (640, 640)
+    detector.classes = PPE_CLASSES
+    detector.max_candidates = max_candidates
+    detector.max_detections = max_detections
+    return detector
+
+
+def make_dense_outputs(persons: int, anchors_per_object: int, noise: int, seed: int):
+    """
+    밀집 장면 합성 출력 ([1, 4 + num_classes, 8400])
+
+    사람마다 사람/안전모/조끼 객체를 만들고 객체마다 흔들린 앵커 여러 개를
+    배치한다. 나머지 일부 앵커는 임계값을 겨우 넘는 배경 후보로 채운다.
+
+    Returns:
+        (출력 리스트, 실제 사람 박스 (P, 4) x1, y1, x2, y2)
+    """
+    rng = np.random.default_rng(seed)
+    num_classes = len(PPE_CLASSES)
+    output = np.zeros((4 + num_classes, NUM_ANCHORS), dtype=np.float32)
+    output[4:] = rng.uniform(0, 0.3, (num_classes, NUM_ANCHORS))
+
+    objects = []  # (cx, cy, w, h, class_id)
+    person_boxes = []
+    for _ in range(persons):
+        cx, top = rng.uniform(30, 610), rng.uniform(80, 380)
+        w, h = rng.uniform(30, 50), rng.uniform(120, 180)
+        objects.append((cx, top + h / 2, w, h, 0))                  # person
+        objects.append((cx, top + h * 0.12, w * 0.8, h * 0.25, 1))  # hardhat (머리)
+        objects.append((cx, top + h * 0.45, w, h * 0.5, 3))         # safety_vest (몸통)
+        person_boxes.append((cx - w / 2, top, cx + w / 2, top + h))
+
+    anchor = 0
+    for cx, cy, w, h, class_id in objects:
+        for _ in range(anchors_per_object):
+            if anchor >= NUM_ANCHORS:
+                break
+            jitter = rng.normal(0, 0.04, 4)
+            output[:4, anchor] = (cx + jitter[0] * w, cy + jitter[1] * h,
+                                  w * (1 + jitter[2]), h * (1 + jitter[3]))
+            output[4 + class_id, anchor] = rng.uniform(0.6, 0.95)
+            anchor += 1
+
+    # 배경 후보 (신뢰도 낮은 작은 박스)
+    end = min(anchor + noise, NUM_ANCHORS)
+    count = end - anchor
+    output[0, anchor:end] = rng.uniform(0, 640, count)
+    output[1, anchor:end] = rng.uniform(80, 560, count)
+    output[2, anchor:end] = rng.uniform(5, 30, count)
+    output[3, anchor:end] = rng.uniform(5, 30, count)
+    output[4 + rng.integers(0, num_classes, count), np.arange(anchor, end)] = rng.uniform(0.5, 0.55, count)
+
+    return [output[None]], np.array(person_boxes, dtype=np.float32)
+
+
+def agnostic_postprocess(detector: PPEDetector, output: np.ndarray, pad_w, pad_h, scale, img_w, img_h):
+    """기존 클래스 무관 NMS (비교 기준)"""
+    boxes, confidences, class_ids = detector._decode_candidates(output, pad_w, pad_h, scale, img_w, img_h)
+    if not boxes:
+        return []
+    indices = cv2.dnn.NMSBoxes(boxes, confidences, detector.confidence_threshold, detector.iou_threshold)
+    return [(boxes[i], class_ids[i]) for i in np.asarray(indices).flatten()]
+
+
+def timeit(func, repeat: int) -> float:
+    """평균 실행 시간 (ms)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NMS 마이크로 벤치마크 (밀집 장면)')
+    parser.add_argument('--persons', type=int, default=40, help='사람 수')
+    parser.add_argument('--anchors-per-object', type=int, default=25, help='객체당 앵커 수')
+    parser.add_argument('--noise', type=int, default=4000, help='배경 후보 수')
+    parser.add_argument('--max-candidates', type=int, default=3000, help='NMS 전 최대 후보 수')
+    parser.add_argument('--max-detections', type=int, default=300, help='최대 감지 수')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    outputs, person_boxes = make_dense_outputs(args.persons, args.anchors_per_object, args.noise, args.seed)
+    output = outputs[0][0].T
+
+    # 640x640 입력 그대로 (letterbox 없음)
+    pad_w = pad_h = 0
+    scale = 1.0
+    img_w = img_h = 640
+
+    uncapped = make_detector(0, 0)
+    capped = make_detector(args.max_candidates, args.max_detections)
+
+    candidates = len(uncapped._decode_candidates(output, pad_w, pad_h, scale, img_w, img_h)[0])
+    agnostic = agnostic_postprocess(uncapped, output, pad_w, pad_h, scale, img_w, img_h)
+    agnostic_persons = [
+        [x, y, x + w, y + h] for (x, y, w, h), c in agnostic if c == 0
+    ]
+    aware = uncapped._postprocess(outputs, 1.0, 1.0, pad_w, pad_h, scale, img_w, img_h)
+    aware_capped = capped._postprocess(outputs, 1.0, 1.0, pad_w, pad_h, scale, img_w, img_h)
+
+    agnostic_ms = timeit(
+        lambda: agnostic_postprocess(uncapped, output, pad_w, pad_h, scale, img_w, img_h), args.repeat
+    )
+    aware_ms = timeit(
+        lambda: uncapped._postprocess(outputs, 1.0, 1.0, pad_w, pad_h, scale, img_w, img_h), args.repeat
+    )
+    capped_ms = timeit(
+        lambda: capped._postprocess(outputs, 1.0, 1.0, pad_w, pad_h, scale, img_w, img_h), args.repeat
+    )
+
+    def person_recall(boxes) -> str:
+        """실제 사람 중 IoU 0.5 이상 사람 감지가 남은 비율"""
+        if not boxes:
+            return '0.0%'
+        ious = iou_matrix(person_boxes, np.array(boxes, dtype=np.float32))
+        return f"{np.mean(ious.max(axis=1) >= 0.5) * 100:.1f}%"
+
+    def person_detections(detections):
+        return [d['bbox'] for d in detections if d['class_id'] == 0]
+
+    print("=" * 64)
+    print("NMS 벤치마크 (밀집 장면)")
+    print("=" * 64)
+    print(f"사람: {len(person_boxes)}, NMS 전 후보: {candidates}")
+    print(f"{'방식':<26}{'시간(ms)':>10}{'감지':>8}{'사람 재현율':>12}")
+    print(f"{'클래스 무관 (기존)':<26}{agnostic_ms:>10.2f}{len(agnostic):>8}"
+          f"{person_recall(agnostic_persons):>12}")
+    print(f"{'클래스별':<26}{aware_ms:>10.2f}{len(aware):>8}"
+          f"{person_recall(person_detections(aware)):>12}")
+    print(f"{'클래스별 + 후보/감지 제한':<26}{capped_ms:>10.2f}{len(aware_capped):>8}"
+          f"{person_recall(person_detections(aware_capped)):>12}")
+
+
+if __name__ == "__main__":
+    main()
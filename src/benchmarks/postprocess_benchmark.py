@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+YOLOv8 후처리 마이크로 벤치마크
+
+PPEDetector._postprocess의 벡터화 디코딩을 기존 앵커 단위 Python 루프와
+비교한다. 모델 파일 없이 합성 출력([1, 4 + num_classes, num_anchors])을
+사용하므로 개발 PC와 라즈베리파이 어디서든 실행할 수 있다.
+
+사용법:
+    python3 src/benchmarks/postprocess_benchmark.py
+    python3 src/benchmarks/postprocess_benchmark.py --classes 80 --repeat 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'components' / 'ppe_detector'))
+
+from ppe_model import PPEDetector, PPE_CLASSES  # noqa: E402
+
+
+def make_detector(confidence_threshold: float, iou_threshold: float) -> PPEDetector:
+    """모델 로드 없이 후처리만 사용하는 PPEDetector 생성"""
+    detector = PPEDetector.__new__(PPEDetector)
+    detector.confidence_threshold = confidence_threshold
+    detector.iou_threshold = iou_threshold
+    detector.input_size = (640, 640)
+    detector.classes = PPE_CLASSES
+    detector.max_candidates = 0
+    detector.max_detections = 0
+    return detector
+
+
+def make_outputs(num_classes: int, num_anchors: int, positive_ratio: float, seed: int) -> list:
+    """합성 YOLOv8 출력 생성 ([1, 4 + num_classes, num_anchors])"""
+    rng = np.random.default_rng(seed)
+    output = np.zeros((1, 4 + num_classes, num_anchors), dtype=np.float32)
+
+    output[0, 0] = rng.uniform(0, 640, num_anchors)   # cx
+    output[0, 1] = rng.uniform(80, 560, num_anchors)  # cy
+    output[0, 2] = rng.uniform(10, 200, num_anchors)  # w
+    output[0, 3] = rng.uniform(10, 300, num_anchors)  # h
+    output[0, 4:] = rng.uniform(0, 0.3, (num_classes, num_anchors))
+
+    # 일부 앵커만 임계값을 넘도록 설정
+    positives = rng.random(num_anchors) < positive_ratio
+    cls = rng.integers(0, num_classes, num_anchors)
+    output[0, 4 + cls[positives], np.nonzero(positives)[0]] = rng.uniform(
+        0.5, 1.0, int(positives.sum())
+    )
+
+    return [output]
+
+
+def decode_loop(detector: PPEDetector, output: np.ndarray, pad_w, pad_h, scale, img_w, img_h):
+    """기존 앵커 단위 Python 루프 디코딩 (비교 기준)"""
+    boxes = []
+    confidences = []
+    class_ids = []
+
+    for i in range(output.shape[0]):
+        class_scores = output[i, 4:]
+        max_score = np.max(class_scores)
+        class_id = np.argmax(class_scores)
+
+        if max_score < detector.confidence_threshold:
+            continue
+
+        cx, cy, w, h = output[i, :4]
+
+        x1 = int(((cx - w/2) - pad_w) / scale)
+        y1 = int(((cy - h/2) - pad_h) / scale)
+        x2 = int(((cx + w/2) - pad_w) / scale)
+        y2 = int(((cy + h/2) - pad_h) / scale)
+
+        x1 = max(0, min(x1, img_w))
+        y1 = max(0, min(y1, img_h))
+        x2 = max(0, min(x2, img_w))
+        y2 = max(0, min(y2, img_h))
+
+        boxes.append([x1, y1, x2 - x1, y2 - y1])
+        confidences.append(float(max_score))
+        class_ids.append(int(class_id))
+
+    return boxes, confidences, class_ids
+
+
+def timeit(func, repeat: int) -> float:
+    """평균 실행 시간 (ms)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YOLOv8 후처리 마이크로 벤치마크')
+    parser.add_argument('--classes', type=int, default=len(PPE_CLASSES), help='클래스 수')
+    parser.add_argument('--anchors', type=int, default=8400, help='앵커 수 (640 입력 기준 8400)')
+    parser.add_argument('--positive-ratio', type=float, default=0.01,
+                        help='임계값을 넘는 앵커 비율')
+    parser.add_argument('--conf', type=float, default=0.5, help='Confidence threshold')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    detector = make_detector(args.conf, 0.45)
+    outputs = make_outputs(args.classes, args.anchors, args.positive_ratio, args.seed)
+
+    # 1920x1080 -> 640x360 letterbox 기준 파라미터
+    img_w, img_h = 1920, 1080
+    scale = min(640 / img_w, 640 / img_h)
+    pad_w = (640 - int(img_w * scale)) // 2
+    pad_h = (640 - int(img_h * scale)) // 2
+
+    output = outputs[0][0].T
+
+    # 결과 동일성 확인
+    expected = decode_loop(detector, output, pad_w, pad_h, scale, img_w, img_h)
+    actual = detector._decode_candidates(output, pad_w, pad_h, scale, img_w, img_h)
+    identical = expected == actual
+
+    loop_ms = timeit(
+        lambda: decode_loop(detector, output, pad_w, pad_h, scale, img_w, img_h), args.repeat
+    )
+    vector_ms = timeit(
+        lambda: detector._decode_candidates(output, pad_w, pad_h, scale, img_w, img_h), args.repeat
+    )
+    full_ms = timeit(
+        lambda: detector._postprocess(outputs, 1.0, 1.0, pad_w, pad_h, scale, img_w, img_h),
+        args.repeat
+    )
+
+    print("=" * 50)
+    print("YOLOv8 후처리 벤치마크")
+    print("=" * 50)
+    print(f"출력 형태: {outputs[0].shape}, 후보: {len(expected[0])}")
+    print(f"결과 동일: {identical}")
+    print(f"Python 루프 디코딩: {loop_ms:8.2f} ms")
+    print(f"벡터화 디코딩:      {vector_ms:8.2f} ms")
+    print(f"속도 향상:          {loop_ms / vector_ms:8.1f}x")
+    print(f"전체 _postprocess:  {full_ms:8.2f} ms (NMS 포함)")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Camera Scheduler
+여러 카메라 스트림이 감지 모델 1개를 공유하도록 추론 슬롯을 배분하는 모듈
+새 프레임이 있는 카메라 중에서 우선순위 가중 라운드 로빈으로 선택
+"""
+
+import logging
+import time
+from threading import Event, Semaphore
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('CameraScheduler')
+
+
+class CameraStream:
+    """카메라 1대의 스트림 리더와 카메라별 처리 상태"""
+
+    def __init__(self, camera_id: str, reader, priority: int = 1):
+        """
+        Args:
+            camera_id: 카메라 ID (메시지의 camera_id, 토픽 하위 경로)
+            reader: RTSPStreamReader 또는 ProcessStreamReader
+            priority: 스케줄링 가중치 (2면 1보다 추론 기회 2배)
+        """
+        self.camera_id = camera_id
+        self.reader = reader
+        self.priority = max(1, int(priority))
+
+        # 카메라별 처리 상태 (PPEDetectorComponent에서 설정)
+        self.motion_gate = None
+        self.tracker = None
+        self.violation_events = None
+        self.detection_delta = None
+        self.detection_batcher = None
+        self.detection_dropped = 0  # 변경분 모드에서 마지막으로 확인한 detection 큐 drop 수
+        self.latency = None        # 캡처 -> 발행 종단 지연 히스토그램
+        self.last_detections = []  # 움직임이 없을 때 재사용할 마지막 추론 결과
+        self.last_alerts = {}      # 클래스별 마지막 알림 시간
+        self.frames_captured = 0
+
+        # 스케줄러 상태
+        self.credit = 0  # 가중 라운드 로빈 누적 가중치
+
+        # 통계
+        self.stats = {
+            'scheduled': 0,
+            'inferred': 0,
+            'skipped': 0,
+            'detections': 0,
+            'alerts_sent': 0
+        }
+
+    def has_frame(self) -> bool:
+        """아직 가져가지 않은 새 프레임이 있는지 확인"""
+        return self.reader.is_connected() and self.reader.has_new_frame()
+
+    def get_stats(self) -> Dict:
+        """카메라별 통계 반환 (스트림 및 처리 모듈 통계 포함)"""
+        stats = self.stats.copy()
+        stats['priority'] = self.priority
+        stats['connected'] = self.reader.is_connected()
+        stats['stream'] = self.reader.get_stats()
+
+        for name in ('tracker', 'violation_events', 'motion_gate', 'detection_delta', 'latency'):
+            component = getattr(self, name)
+            if component:
+                stats[name] = component.get_stats()
+
+        if self.detection_batcher:
+            stats['detection_batching'] = self.detection_batcher.get_stats()
+
+        return stats
+
+
+class InferenceScheduler:
+    """
+    공유 감지 모델의 추론 슬롯 스케줄러
+
+    캡처 단계는 추론 슬롯을 먼저 확보한 뒤 프레임을 고르므로, 추론이 밀리면
+    캡처가 대기하고 그동안 각 리더의 링 버퍼에는 최신 프레임만 남는다.
+    카메라 선택은 새 프레임이 있는 카메라들에 대한 smooth weighted round robin
+    (우선순위가 모두 같으면 라운드 로빈)이다.
+    """
+
+    def __init__(self, cameras: List[CameraStream] = None, slots: int = 2, copy_frames: bool = True):
+        """
+        Args:
+            cameras: 카메라 목록 (add_camera()로 추가 가능)
+            slots: 동시에 전처리/추론 중일 수 있는 프레임 수
+            copy_frames: 리더 링 슬롯 복사 여부 (False면 슬롯을 그대로 반환,
+                처리 중 덮어쓰이지 않도록 링 슬롯 수가 추론 슬롯 수보다 커야 함)
+        """
+        self.cameras = list(cameras or [])
+        self.slot_count = max(1, slots)
+        self.copy_frames = copy_frames
+        self.slots = Semaphore(self.slot_count)
+
+        # 리더가 새 프레임을 게시하면 set (RTSPStreamReader의 frame_notify)
+        self.frame_ready = Event()
+
+        # 통계
+        self.stats = {
+            'scheduled': 0,
+            'slot_timeouts': 0,
+            'idle_timeouts': 0
+        }
+
+    def add_camera(self, camera: CameraStream):
+        """카메라 추가"""
+        self.cameras.append(camera)
+
+    def _select(self) -> Optional[CameraStream]:
+        """새 프레임이 있는 카메라 중 가중 라운드 로빈으로 선택"""
+        ready = [c for c in self.cameras if c.has_frame()]
+        if not ready:
+            return None
+
+        total = 0
+        for camera in ready:
+            camera.credit += camera.priority
+            total += camera.priority
+
+        selected = max(ready, key=lambda c: c.credit)
+        selected.credit -= total
+        return selected
+
+    def next_frame(self, timeout: float = 1.0) -> Optional[Tuple[CameraStream, np.ndarray, Optional[dict]]]:
+        """
+        추론 슬롯을 확보하고 다음 카메라의 최신 프레임 반환
+
+        반환된 프레임마다 처리가 끝나면 release()를 호출해야 한다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            (카메라, 프레임, 프레임 메타데이터) 또는 슬롯/프레임이 없으면 None
+        """
+        deadline = time.monotonic() + timeout
+
+        if not self.slots.acquire(timeout=timeout):
+            self.stats['slot_timeouts'] += 1
+            return None
+
+        while True:
+            camera = self._select()
+            if camera is not None:
+                frame = camera.reader.read_frame(timeout=0, copy=self.copy_frames)
+                if frame is not None:
+                    camera.stats['scheduled'] += 1
+                    self.stats['scheduled'] += 1
+                    return camera, frame, camera.reader.frame_info
+                continue  # 선택 직후 연결이 끊긴 경우 - 다시 선택
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.slots.release()
+                self.stats['idle_timeouts'] += 1
+                return None
+
+            self.frame_ready.clear()
+            if any(c.has_frame() for c in self.cameras):
+                continue  # clear() 직전에 게시된 프레임
+            self.frame_ready.wait(remaining)
+
+    def release(self):
+        """추론 슬롯 반환"""
+        self.slots.release()
+
+    def get_stats(self) -> Dict:
+        """통계 반환 (카메라별 추론 기회 비율 포함)"""
+        stats = self.stats.copy()
+        stats['slots'] = self.slot_count
+        scheduled = stats['scheduled']
+        stats['shares'] = {
+            c.camera_id: round(c.stats['scheduled'] / scheduled, 3) if scheduled else 0.0
+            for c in self.cameras
+        }
+        return stats
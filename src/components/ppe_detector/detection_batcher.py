@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Detection Batcher
+프레임별 감지 결과를 시간 윈도우 단위로 모아 MQTT 메시지로 묶는 모듈
+AWS IoT Core 페이로드 제한(128 KB)을 넘지 않도록 크기 기반으로 분할
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('DetectionBatcher')
+
+# AWS IoT Core 최대 페이로드 크기 (바이트)
+IOT_CORE_MAX_PAYLOAD = 128 * 1024
+
+# 윈도우 시작/종료 시각, 개수 등 가변 길이 필드를 위한 여유분 (바이트)
+ENVELOPE_HEADROOM = 256
+
+
+def _encoded_size(value: Any) -> int:
+    """MQTTPublisher와 동일한 방식으로 인코딩했을 때의 바이트 수"""
+    return len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+class DetectionBatcher:
+    """감지 결과 윈도우 배칭"""
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        max_payload_bytes: int = IOT_CORE_MAX_PAYLOAD,
+        envelope: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            window_seconds: 배치 윈도우 길이 (초). 첫 프레임 기준으로 경과하면 발행
+            max_payload_bytes: 배치 메시지 최대 크기 (바이트)
+            envelope: 모든 배치 메시지에 포함할 공통 필드 (thing_name 등)
+        """
+        self.window_seconds = window_seconds
+        self.max_payload_bytes = max_payload_bytes
+        self.envelope = envelope or {}
+
+        # 빈 배치 메시지 크기 (프레임 목록 제외)
+        self.envelope_bytes = _encoded_size(self._build([], 0)) + ENVELOPE_HEADROOM
+        if self.envelope_bytes >= max_payload_bytes:
+            raise ValueError(f"max_payload_bytes too small: {max_payload_bytes}")
+
+        self.frames: List[Dict] = []
+        self.frames_bytes = 0
+        self.detection_count = 0
+        self.window_start = None  # time.monotonic() 기준
+
+        # 통계
+        self.stats = {
+            'batches': 0,
+            'frames_batched': 0,
+            'size_splits': 0,
+            'truncated_frames': 0
+        }
+
+    def _build(self, frames: List[Dict], detection_count: int) -> Dict[str, Any]:
+        """배치 메시지 생성"""
+        message = {
+            'timestamp': frames[-1]['timestamp'] if frames else '',
+            **self.envelope,
+            'batch': True,
+            'window_start': frames[0]['timestamp'] if frames else '',
+            'window_end': frames[-1]['timestamp'] if frames else '',
+            'frame_count': len(frames),
+            'count': detection_count,
+            'frames': frames
+        }
+        return message
+
+    def add(self, timestamp: str, detections: list = None, fields: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        프레임 감지 결과 추가
+
+        Args:
+            timestamp: 프레임 시각 (ISO 8601)
+            detections: 감지 결과 목록
+            fields: 프레임 항목에 추가할 필드 (변경분 발행 시 added/removed 등)
+
+        Returns:
+            List[Dict]: 발행할 배치 메시지 (크기 초과 또는 윈도우 종료 시)
+        """
+        ready = []
+
+        frame = {'timestamp': timestamp}
+        if detections is not None:
+            frame['detections'] = detections
+            frame['count'] = len(detections)
+        if fields:
+            frame.update(fields)
+        frame_bytes = _encoded_size(frame)
+
+        # 단일 프레임이 제한을 넘으면 감지 결과를 잘라서 맞춤
+        budget = self.max_payload_bytes - self.envelope_bytes
+        if frame_bytes > budget and 'detections' in frame:
+            frame, frame_bytes = self._truncate(frame, budget)
+
+        # 추가하면 제한을 넘는 경우 현재 배치를 먼저 발행 (", " 구분자 포함)
+        if self.frames and self.envelope_bytes + self.frames_bytes + 2 + frame_bytes > self.max_payload_bytes:
+            self.stats['size_splits'] += 1
+            ready.append(self._take())
+
+        if not self.frames:
+            self.window_start = time.monotonic()
+            self.frames_bytes = frame_bytes
+        else:
+            self.frames_bytes += 2 + frame_bytes
+
+        self.frames.append(frame)
+        self.detection_count += frame.get('count', 0)
+
+        ready.extend(self.poll())
+        return ready
+
+    def _truncate(self, frame: Dict, budget: int):
+        """감지 결과를 신뢰도 순으로 남겨 크기 제한에 맞춤"""
+        detections = sorted(frame['detections'], key=lambda d: d.get('confidence', 0), reverse=True)
+        total = len(detections)
+
+        while detections:
+            detections = detections[:len(detections) // 2] if len(detections) > 1 else []
+            frame = {
+                **frame,
+                'detections': detections,
+                'count': len(detections),
+                'truncated_from': total
+            }
+            frame_bytes = _encoded_size(frame)
+            if frame_bytes <= budget:
+                break
+
+        self.stats['truncated_frames'] += 1
+        logger.warning(f"Frame with {total} detections exceeds payload limit, kept {len(detections)}")
+        return frame, frame_bytes
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        윈도우 종료 확인 (프레임이 들어오지 않을 때도 주기적으로 호출)
+
+        Returns:
+            List[Dict]: 윈도우가 끝났으면 배치 메시지 1개, 아니면 빈 목록
+        """
+        if self.frames and time.monotonic() - self.window_start >= self.window_seconds:
+            return [self._take()]
+        return []
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """남은 프레임을 모두 배치 메시지로 반환 (종료 시)"""
+        if self.frames:
+            return [self._take()]
+        return []
+
+    def _take(self) -> Dict[str, Any]:
+        """현재 배치를 메시지로 만들고 초기화"""
+        message = self._build(self.frames, self.detection_count)
+
+        self.stats['batches'] += 1
+        self.stats['frames_batched'] += len(self.frames)
+
+        self.frames = []
+        self.frames_bytes = 0
+        self.detection_count = 0
+        self.window_start = None
+        return message
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        stats = self.stats.copy()
+        stats['pending_frames'] = len(self.frames)
+        return stats
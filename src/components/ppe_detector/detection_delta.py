@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Detection Delta
+마지막으로 발행한 감지 결과와 비교하여 변경분(추가/제거/이동)만 발행하는 모듈
+클래스 + IoU 매칭, 주기적 전체 키프레임 지원
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger('DetectionDelta')
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    두 박스 집합 간 IoU 행렬
+
+    Args:
+        boxes_a: (N, 4) x1, y1, x2, y2
+        boxes_b: (M, 4) x1, y1, x2, y2
+
+    Returns:
+        np.ndarray: (N, M) IoU
+    """
+    x1 = np.maximum(boxes_a[:, None, 0], boxes_b[None, :, 0])
+    y1 = np.maximum(boxes_a[:, None, 1], boxes_b[None, :, 1])
+    x2 = np.minimum(boxes_a[:, None, 2], boxes_b[None, :, 2])
+    y2 = np.minimum(boxes_a[:, None, 3], boxes_b[None, :, 3])
+
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+
+    return np.where(union > 0, intersection / np.maximum(union, 1e-9), 0.0)
+
+
+class DetectionDelta:
+    """감지 결과 변경분 인코더"""
+
+    def __init__(
+        self,
+        keyframe_interval: float = 60.0,
+        match_iou: float = 0.3,
+        move_iou: float = 0.9,
+        move_pixels: int = 8
+    ):
+        """
+        Args:
+            keyframe_interval: 전체 감지 결과(키프레임) 발행 간격 (초)
+            match_iou: 같은 객체로 볼 최소 IoU (같은 클래스끼리만 매칭)
+            move_iou: 매칭된 객체의 IoU가 이 값보다 낮으면 이동으로 발행
+            move_pixels: 박스 모서리가 이 픽셀 수 이하로 움직이면 IoU와 관계없이
+                변화 없음으로 처리 (작은 박스의 몇 픽셀 흔들림 무시)
+        """
+        self.keyframe_interval = keyframe_interval
+        self.match_iou = match_iou
+        self.move_iou = move_iou
+        self.move_pixels = move_pixels
+
+        # 마지막으로 발행한 상태 (객체 ID 포함)
+        self.published: List[Dict[str, Any]] = []
+        self.next_id = 1
+        self.seq = 0
+        self.last_keyframe = None  # time.monotonic() 기준
+
+        # 통계
+        self.stats = {
+            'keyframes': 0,
+            'forced_keyframes': 0,
+            'deltas': 0,
+            'unchanged': 0,
+            'added': 0,
+            'removed': 0,
+            'moved': 0
+        }
+
+    def _match(self, detections: list):
+        """
+        현재 감지 결과와 발행 상태 매칭 (클래스가 같고 IoU가 높은 순으로 1:1)
+
+        Returns:
+            (매칭 목록 [(현재 인덱스, 발행 인덱스, IoU)], 미매칭 현재 인덱스, 미매칭 발행 인덱스)
+        """
+        if not detections or not self.published:
+            return [], list(range(len(detections))), list(range(len(self.published)))
+
+        current_boxes = np.array([d['bbox'] for d in detections], dtype=np.float32)
+        published_boxes = np.array([d['bbox'] for d in self.published], dtype=np.float32)
+        current_classes = np.array([d['class_id'] for d in detections])
+        published_classes = np.array([d['class_id'] for d in self.published])
+
+        ious = iou_matrix(current_boxes, published_boxes)
+        ious[current_classes[:, None] != published_classes[None, :]] = 0.0
+
+        # IoU가 높은 쌍부터 탐욕적 1:1 매칭
+        matches = []
+        used_current = set()
+        used_published = set()
+        rows, cols = np.nonzero(ious >= self.match_iou)
+        for k in np.argsort(-ious[rows, cols], kind='stable'):
+            i, j = int(rows[k]), int(cols[k])
+            if i in used_current or j in used_published:
+                continue
+            used_current.add(i)
+            used_published.add(j)
+            matches.append((i, j, float(ious[i, j])))
+
+        unmatched_current = [i for i in range(len(detections)) if i not in used_current]
+        unmatched_published = [j for j in range(len(self.published)) if j not in used_published]
+        return matches, unmatched_current, unmatched_published
+
+    @staticmethod
+    def _shift(current: dict, published: dict) -> int:
+        """박스 모서리의 최대 이동 픽셀 수"""
+        return max(abs(a - b) for a, b in zip(current['bbox'], published['bbox']))
+
+    def _with_id(self, detection: dict) -> dict:
+        """새 객체 ID 부여"""
+        item = {'id': self.next_id, **detection}
+        self.next_id += 1
+        return item
+
+    def force_keyframe(self):
+        """다음 update()를 키프레임으로 발행 (변경분 메시지가 발행 전에 버려진 경우)"""
+        if self.last_keyframe is not None:
+            self.last_keyframe = None
+            self.stats['forced_keyframes'] += 1
+
+    def update(self, detections: list) -> Optional[Dict[str, Any]]:
+        """
+        현재 감지 결과로 발행할 변경분 계산
+
+        Args:
+            detections: 현재 프레임 감지 결과
+
+        Returns:
+            키프레임 {'keyframe': True, 'seq', 'detections', 'count'},
+            변경분 {'keyframe': False, 'seq', 'added', 'removed', 'moved', 'count'},
+            또는 변경이 없으면 None
+        """
+        now = time.monotonic()
+        matches, added, removed = self._match(detections)
+
+        # 주기적 키프레임 - 구독 측이 놓친 변경분과 관계없이 전체 상태 복구
+        if self.last_keyframe is None or now - self.last_keyframe >= self.keyframe_interval:
+            ids = {i: self.published[j]['id'] for i, j, _ in matches}
+            self.published = [
+                {'id': ids[i], **d} if i in ids else self._with_id(d)
+                for i, d in enumerate(detections)
+            ]
+            self.last_keyframe = now
+            self.seq += 1
+            self.stats['keyframes'] += 1
+            return {
+                'keyframe': True,
+                'seq': self.seq,
+                'detections': list(self.published),
+                'count': len(self.published)
+            }
+
+        moved = [
+            (i, j) for i, j, iou in matches
+            if iou < self.move_iou and self._shift(detections[i], self.published[j]) > self.move_pixels
+        ]
+        if not added and not removed and not moved:
+            self.stats['unchanged'] += 1
+            return None
+
+        # 이동한 객체는 새 위치로, 변화 없는 객체는 발행한 위치 유지 (누적 오차 방지)
+        moved_items = []
+        for i, j in moved:
+            item = {'id': self.published[j]['id'], **detections[i]}
+            self.published[j] = item
+            moved_items.append({'id': item['id'], 'bbox': item['bbox'], 'confidence': item['confidence']})
+
+        added_items = [self._with_id(detections[i]) for i in added]
+        removed_ids = [self.published[j]['id'] for j in removed]
+
+        removed_set = set(removed)
+        self.published = [d for j, d in enumerate(self.published) if j not in removed_set] + added_items
+
+        self.seq += 1
+        self.stats['deltas'] += 1
+        self.stats['added'] += len(added_items)
+        self.stats['removed'] += len(removed_ids)
+        self.stats['moved'] += len(moved_items)
+
+        return {
+            'keyframe': False,
+            'seq': self.seq,
+            'added': added_items,
+            'removed': removed_ids,
+            'moved': moved_items,
+            'count': len(self.published)
+        }
+
+    def get_stats(self) -> Dict:
+        """통계 반환 (발행하지 않은 프레임 비율 포함)"""
+        stats = self.stats.copy()
+        total = stats['keyframes'] + stats['deltas'] + stats['unchanged']
+        stats['suppressed_ratio'] = round(stats['unchanged'] / total, 3) if total else 0.0
+        return stats
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Inference Engine
+PPEDetector가 사용하는 ONNX 추론 백엔드 모듈
+OpenCV DNN (기본)과 ONNX Runtime CPU 엔진 지원
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger('InferenceEngine')
+
+# ONNX Runtime (선택)
+ONNXRUNTIME_AVAILABLE = False
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    logger.debug("ONNX Runtime not available")
+
+
+class InferenceEngine:
+    """추론 엔진 기본 클래스"""
+
+    name = 'base'
+
+    def __init__(self, model_path: str):
+        """
+        Args:
+            model_path: ONNX 모델 파일 경로 (.onnx)
+        """
+        self.model_path = model_path
+
+    def load(self):
+        """모델 로드"""
+        raise NotImplementedError
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """
+        추론 실행
+
+        Args:
+            blob: NCHW float32 입력 blob
+
+        Returns:
+            List[np.ndarray]: 모델 출력 목록
+        """
+        raise NotImplementedError
+
+    def get_info(self) -> Dict:
+        """엔진 정보 반환"""
+        return {'engine': self.name}
+
+
+class OpenCVDNNEngine(InferenceEngine):
+    """OpenCV DNN 추론 엔진 (기본)"""
+
+    name = 'opencv'
+
+    def __init__(self, model_path: str, use_cuda: bool = False):
+        """
+        Args:
+            model_path: ONNX 모델 파일 경로 (.onnx)
+            use_cuda: CUDA 백엔드 사용 여부 (라즈베리파이에서는 False)
+        """
+        super().__init__(model_path)
+        self.use_cuda = use_cuda
+        self.net = None
+        self.output_layers = None
+
+    def load(self):
+        """OpenCV DNN으로 ONNX 모델 로드"""
+        self.net = cv2.dnn.readNetFromONNX(self.model_path)
+
+        # 백엔드 설정
+        if self.use_cuda and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            logger.info("Using CUDA backend")
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        else:
+            logger.info("Using CPU backend")
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+
+        # 출력 레이어 이름 가져오기
+        self.output_layers = self.net.getUnconnectedOutLayersNames()
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """OpenCV DNN 추론"""
+        self.net.setInput(blob)
+        return self.net.forward(self.output_layers)
+
+    def get_info(self) -> Dict:
+        """엔진 정보 반환"""
+        return {'engine': self.name, 'use_cuda': self.use_cuda}
+
+
+class ONNXRuntimeEngine(InferenceEngine):
+    """ONNX Runtime CPU 추론 엔진"""
+
+    name = 'onnxruntime'
+
+    # 그래프 최적화 레벨 이름 -> ORT 상수 이름
+    GRAPH_OPTIMIZATION_LEVELS = {
+        'disable': 'ORT_DISABLE_ALL',
+        'basic': 'ORT_ENABLE_BASIC',
+        'extended': 'ORT_ENABLE_EXTENDED',
+        'all': 'ORT_ENABLE_ALL',
+    }
+
+    def __init__(
+        self,
+        model_path: str,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        graph_optimization_level: str = 'all'
+    ):
+        """
+        Args:
+            model_path: ONNX 모델 파일 경로 (.onnx)
+            intra_op_threads: 연산자 내부 병렬 스레드 수 (0 = ORT 기본값)
+            inter_op_threads: 연산자 간 병렬 스레드 수 (0 = ORT 기본값)
+            graph_optimization_level: 그래프 최적화 레벨
+                (disable, basic, extended, all)
+        """
+        super().__init__(model_path)
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.graph_optimization_level = graph_optimization_level
+
+        if graph_optimization_level not in self.GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown graph optimization level: {graph_optimization_level} "
+                f"(choices: {list(self.GRAPH_OPTIMIZATION_LEVELS.keys())})"
+            )
+
+        self.session = None
+        self.input_name = None
+        self.output_names = None
+
+    def load(self):
+        """ONNX Runtime 세션 생성"""
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError(
+                "ONNX Runtime이 설치되지 않았습니다. pip install onnxruntime"
+            )
+
+        options = ort.SessionOptions()
+        if self.intra_op_threads > 0:
+            options.intra_op_num_threads = self.intra_op_threads
+        if self.inter_op_threads > 0:
+            options.inter_op_num_threads = self.inter_op_threads
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+        else:
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel,
+            self.GRAPH_OPTIMIZATION_LEVELS[self.graph_optimization_level]
+        )
+
+        self.session = ort.InferenceSession(
+            self.model_path,
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_names = [o.name for o in self.session.get_outputs()]
+
+        logger.info(
+            f"ONNX Runtime {ort.__version__} session created "
+            f"(intra_op={self.intra_op_threads}, inter_op={self.inter_op_threads}, "
+            f"graph_opt={self.graph_optimization_level})"
+        )
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """ONNX Runtime 추론"""
+        return self.session.run(self.output_names, {self.input_name: blob})
+
+    def get_info(self) -> Dict:
+        """엔진 정보 반환"""
+        return {
+            'engine': self.name,
+            'intra_op_threads': self.intra_op_threads,
+            'inter_op_threads': self.inter_op_threads,
+            'graph_optimization_level': self.graph_optimization_level,
+        }
+
+
+# 엔진 이름 -> 클래스
+ENGINES = {
+    OpenCVDNNEngine.name: OpenCVDNNEngine,
+    ONNXRuntimeEngine.name: ONNXRuntimeEngine,
+}
+
+
+def create_engine(
+    engine: str,
+    model_path: str,
+    options: Optional[Dict] = None
+) -> InferenceEngine:
+    """
+    추론 엔진 생성
+
+    Args:
+        engine: 엔진 이름 ('opencv', 'onnxruntime')
+        model_path: ONNX 모델 파일 경로
+        options: 엔진별 옵션 (생성자 키워드 인자)
+
+    Returns:
+        InferenceEngine: 로드되지 않은 엔진 인스턴스
+    """
+    engine = (engine or OpenCVDNNEngine.name).lower()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown inference engine: {engine} (choices: {list(ENGINES.keys())})")
+
+    return ENGINES[engine](model_path, **(options or {}))
+
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Inference Pool
+감지 모델을 별도 프로세스 N개에서 실행하는 추론 워커 풀 모듈
+프레임은 공유 메모리 슬롯으로 전달(피클링 없음)하고 결과는 작은 감지 배열로 반환
+메인 프로세스의 캡처/후처리/발행 스레드와 GIL을 다투지 않음
+"""
+
+import itertools
+import logging
+import multiprocessing as mp
+import signal
+import time
+from multiprocessing import shared_memory
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger('InferencePool')
+
+# 감지 배열 열: x1, y1, x2, y2, confidence, class_id
+DETECTION_COLUMNS = 6
+
+
+def pack_detections(detections: List[Dict]) -> np.ndarray:
+    """감지 결과 -> (N, 6) float32 배열 (프로세스 간 전달용)"""
+    array = np.empty((len(detections), DETECTION_COLUMNS), dtype=np.float32)
+    for i, d in enumerate(detections):
+        array[i, :4] = d['bbox']
+        array[i, 4] = d['confidence']
+        array[i, 5] = d['class_id']
+    return array
+
+
+def unpack_detections(array: np.ndarray, classes: Dict[int, str]) -> List[Dict]:
+    """(N, 6) 배열 -> 감지 결과 (PPEDetector.detect()와 같은 형식)"""
+    detections = []
+    for x1, y1, x2, y2, confidence, class_id in array.tolist():
+        class_id = int(class_id)
+        detections.append({
+            'class': classes.get(class_id, f'class_{class_id}'),
+            'class_id': class_id,
+            'confidence': round(confidence, 3),
+            'bbox': [int(x1), int(y1), int(x2), int(y2)]
+        })
+    return detections
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """워커에서 공유 메모리 연결 (생성한 부모 프로세스가 해제하므로 추적 제외)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.12 이하 - spawn 워커는 부모의 resource_tracker를 공유하므로
+        # 같은 이름이 다시 등록될 뿐이며, 부모가 unlink할 때 한 번 해제된다
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_main(worker_id: int, detector_options: dict, threads: int, task_queue, result_queue):
+    """
+    추론 워커 프로세스
+
+    작업: (task_id, 슬롯 인덱스, 공유 메모리 이름, 프레임 shape)
+    결과: (task_id, worker_id, 감지 배열 또는 None, 오류 메시지 또는 None)
+    """
+    # 종료는 부모가 작업 큐로 알림 (Ctrl+C 시 워커가 먼저 죽지 않도록)
+    # SIGTERM은 그대로 둔다 (부모 terminate() 및 인터프리터 종료 시 정리)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import cv2
+    from ppe_model import PPEDetector
+
+    cv2.setNumThreads(threads)
+
+    try:
+        detector = PPEDetector(**detector_options)
+    except Exception as e:
+        result_queue.put(('ready', worker_id, None, str(e)))
+        return
+    result_queue.put(('ready', worker_id, None, None))
+
+    attached: Dict[int, shared_memory.SharedMemory] = {}  # 슬롯 인덱스 -> 공유 메모리
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            task_id, slot, name, shape = task
+            try:
+                # 슬롯이 커지면 새 이름으로 재생성되므로 다시 연결
+                shm = attached.get(slot)
+                if shm is None or shm.name != name:
+                    if shm is not None:
+                        shm.close()
+                    shm = attached[slot] = _attach(name)
+
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                detections = pack_detections(detector.detect(frame))
+                del frame
+                result_queue.put((task_id, worker_id, detections, None))
+            except Exception as e:
+                result_queue.put((task_id, worker_id, None, str(e)))
+    finally:
+        for shm in attached.values():
+            shm.close()
+
+
+class InferenceTask:
+    """제출한 추론 작업 (결과 대기용)"""
+
+    def __init__(self, task_id: int, slot: int):
+        self.task_id = task_id
+        self.slot = slot
+        self.submitted = time.monotonic()
+        self.done = Event()
+        self.detections: Optional[np.ndarray] = None
+        self.error: Optional[str] = None
+
+    def result(self, timeout: float = None) -> np.ndarray:
+        """
+        감지 배열 반환 (완료까지 대기)
+
+        Raises:
+            TimeoutError: timeout 안에 결과가 오지 않은 경우
+            RuntimeError: 워커에서 추론이 실패한 경우
+        """
+        if not self.done.wait(timeout):
+            raise TimeoutError(f"Inference task {self.task_id} timed out")
+        if self.error:
+            raise RuntimeError(f"Inference worker error: {self.error}")
+        return self.detections
+
+
+class InferencePool:
+    """공유 메모리 프레임 전달 추론 워커 풀"""
+
+    def __init__(
+        self,
+        num_workers: int,
+        detector_options: dict,
+        threads_per_worker: int = 1,
+        slots: int = None,
+        start_timeout: float = 120.0
+    ):
+        """
+        Args:
+            num_workers: 워커 프로세스 수 (각자 PPEDetector 1개 로드)
+            detector_options: PPEDetector 생성 인자
+            threads_per_worker: 워커별 OpenCV 스레드 수 (cv2.setNumThreads)
+            slots: 공유 메모리 프레임 슬롯 수 (동시에 진행 중인 작업 수, 기본 num_workers + 1)
+            start_timeout: 워커 모델 로드 대기 시간 (초)
+        """
+        self.num_workers = max(1, num_workers)
+        self.detector_options = dict(detector_options)
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.slot_count = slots or self.num_workers + 1
+        self.start_timeout = start_timeout
+
+        # ONNX Runtime은 OpenCV 스레드 설정과 별도로 세션 스레드 수 지정
+        if self.detector_options.get('engine') == 'onnxruntime':
+            engine_options = dict(self.detector_options.get('engine_options') or {})
+            engine_options['intra_op_threads'] = self.threads_per_worker
+            self.detector_options['engine_options'] = engine_options
+
+        # 스레드가 있는 부모 프로세스를 fork하지 않도록 spawn 사용
+        self.context = mp.get_context('spawn')
+        self.task_queue = self.context.Queue()
+        self.result_queue = self.context.Queue()
+        self.workers: List[Optional[mp.Process]] = [None] * self.num_workers
+
+        # 공유 메모리 슬롯 (프레임 크기에 맞춰 생성, 더 큰 프레임이 오면 재생성)
+        self.shms: List[Optional[shared_memory.SharedMemory]] = [None] * self.slot_count
+        self.free_slots: Queue = Queue()
+        for slot in range(self.slot_count):
+            self.free_slots.put(slot)
+
+        self.task_ids = itertools.count(1)
+        self.pending: Dict[int, InferenceTask] = {}
+        self.lock = Lock()
+        self.running = Event()
+        self.result_thread = None
+
+        # 통계
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'errors': 0,
+            'no_slot': 0,
+            'abandoned': 0,
+            'restarts': 0,
+            'avg_ms': 0.0
+        }
+
+    def _spawn(self, worker_id: int) -> mp.Process:
+        """워커 프로세스 시작"""
+        process = self.context.Process(
+            target=_worker_main,
+            args=(worker_id, self.detector_options, self.threads_per_worker,
+                  self.task_queue, self.result_queue),
+            name=f"inference-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self.workers[worker_id] = process
+        return process
+
+    def start(self):
+        """
+        워커 시작 및 모델 로드 대기
+
+        Raises:
+            RuntimeError: 워커 모델 로드 실패 또는 시간 초과
+        """
+        for worker_id in range(self.num_workers):
+            self._spawn(worker_id)
+
+        deadline = time.monotonic() + self.start_timeout
+        ready = 0
+        while ready < self.num_workers:
+            try:
+                kind, worker_id, _, error = self.result_queue.get(
+                    timeout=max(0.1, deadline - time.monotonic())
+                )
+            except Empty:
+                self.stop()
+                raise RuntimeError("Inference workers did not start in time")
+            if kind != 'ready':
+                continue
+            if error:
+                self.stop()
+                raise RuntimeError(f"Inference worker {worker_id} failed to load model: {error}")
+            ready += 1
+
+        self.running.set()
+        self.result_thread = Thread(target=self._result_loop, name="inference-results", daemon=True)
+        self.result_thread.start()
+
+        logger.info(
+            f"Inference pool started: {self.num_workers} workers x {self.threads_per_worker} threads, "
+            f"{self.slot_count} shared memory slots"
+        )
+
+    def _slot_buffer(self, slot: int, nbytes: int) -> shared_memory.SharedMemory:
+        """슬롯 공유 메모리 (프레임보다 작으면 재생성)"""
+        shm = self.shms[slot]
+        if shm is None or shm.size < nbytes:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = self.shms[slot] = shared_memory.SharedMemory(create=True, size=nbytes)
+        return shm
+
+    def submit(self, frame: np.ndarray, timeout: float = 1.0) -> Optional[InferenceTask]:
+        """
+        프레임을 공유 메모리 슬롯에 복사하고 추론 작업 제출
+
+        Args:
+            frame: BGR uint8 프레임
+            timeout: 빈 슬롯 대기 시간 (초)
+
+        Returns:
+            InferenceTask 또는 빈 슬롯이 없으면 None
+        """
+        try:
+            slot = self.free_slots.get(timeout=timeout)
+        except Empty:
+            self.stats['no_slot'] += 1
+            return None
+
+        try:
+            shm = self._slot_buffer(slot, frame.nbytes)
+            np.ndarray(frame.shape, dtype=np.uint8, buffer=shm.buf)[...] = frame
+
+            task = InferenceTask(next(self.task_ids), slot)
+            with self.lock:
+                self.pending[task.task_id] = task
+            self.task_queue.put((task.task_id, slot, shm.name, frame.shape))
+        except Exception:
+            self.free_slots.put(slot)
+            raise
+
+        self.stats['submitted'] += 1
+        return task
+
+    def _result_loop(self):
+        """워커 결과 수신 (완료된 작업의 슬롯 반환)"""
+        while self.running.is_set():
+            try:
+                task_id, _, detections, error = self.result_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            except (EOFError, OSError):
+                break
+
+            if task_id == 'ready':
+                # 재시작한 워커의 모델 로드 결과
+                if error:
+                    logger.error(f"Restarted inference worker failed to load model: {error}")
+                continue
+
+            with self.lock:
+                task = self.pending.pop(task_id, None)
+            if task is None:
+                continue  # 포기한 작업
+
+            self.free_slots.put(task.slot)
+
+            if error:
+                self.stats['errors'] += 1
+            else:
+                self.stats['completed'] += 1
+                elapsed_ms = (time.monotonic() - task.submitted) * 1000
+                if self.stats['completed'] == 1:
+                    self.stats['avg_ms'] = elapsed_ms
+                else:
+                    self.stats['avg_ms'] += 0.1 * (elapsed_ms - self.stats['avg_ms'])
+
+            task.detections = detections
+            task.error = error
+            task.done.set()
+
+    def abandon(self, task: InferenceTask):
+        """결과가 오지 않는 작업 포기 (워커 종료 등) - 슬롯 반환"""
+        with self.lock:
+            if self.pending.pop(task.task_id, None) is None:
+                return
+        self.stats['abandoned'] += 1
+        self.free_slots.put(task.slot)
+
+    def maintain(self):
+        """종료된 워커 재시작 (모델 로드는 백그라운드로 진행)"""
+        for worker_id, process in enumerate(self.workers):
+            if process is not None and not process.is_alive():
+                logger.warning(f"Inference worker {worker_id} exited ({process.exitcode}), restarting")
+                self.stats['restarts'] += 1
+                self._spawn(worker_id)
+
+    def stop(self, timeout: float = 5.0):
+        """워커 종료 및 공유 메모리 해제"""
+        self.running.clear()
+
+        for process in self.workers:
+            if process is not None and process.is_alive():
+                self.task_queue.put(None)
+
+        deadline = time.monotonic() + timeout
+        for process in self.workers:
+            if process is None:
+                continue
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+            if process.is_alive():
+                # 네이티브 추론 호출 등에서 SIGTERM에 응답하지 않는 경우
+                logger.warning(f"Inference worker pid {process.pid} did not terminate, killing")
+                process.kill()
+                process.join(timeout=1.0)
+
+        if self.result_thread and self.result_thread.is_alive():
+            self.result_thread.join(timeout=1.0)
+
+        for slot, shm in enumerate(self.shms):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+                self.shms[slot] = None
+
+        logger.info(f"Inference pool stopped. Stats: {self.get_stats()}")
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        stats = self.stats.copy()
+        stats['avg_ms'] = round(stats['avg_ms'], 2)
+        stats['workers'] = self.num_workers
+        stats['alive'] = sum(1 for p in self.workers if p is not None and p.is_alive())
+        stats['in_flight'] = len(self.pending)
+        stats['slot_bytes'] = sum(shm.size for shm in self.shms if shm is not None)
+        return stats
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Latency Histogram
+캡처부터 발행까지 프레임 지연을 고정 버킷 히스토그램으로 집계하는 모듈
+메모리와 집계 비용이 샘플 수와 무관하며 p50/p95/p99는 버킷 내 선형 보간으로 추정
+"""
+
+import bisect
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+# 버킷 상한 (ms) - 마지막 버킷은 그 이상 전체
+DEFAULT_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램"""
+
+    def __init__(self, buckets_ms: Iterable[float] = DEFAULT_BUCKETS_MS, sla_ms: Optional[float] = None):
+        """
+        Args:
+            buckets_ms: 버킷 상한 목록 (ms, 오름차순)
+            sla_ms: 목표 지연 (ms) - 초과 건수를 별도로 집계 (None이면 집계 안 함)
+        """
+        self.bounds = sorted(buckets_ms)
+        self.sla_ms = sla_ms
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """집계 초기화"""
+        with self.lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
+            self.over_sla = 0
+
+    def record(self, seconds: float):
+        """지연 시간 1건 기록 (초)"""
+        ms = max(0.0, seconds * 1000)
+        with self.lock:
+            self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+            if self.sla_ms is not None and ms > self.sla_ms:
+                self.over_sla += 1
+
+    def percentile(self, q: float) -> float:
+        """
+        백분위 지연 추정 (ms)
+
+        q 순위가 속한 버킷 안에서 선형 보간한다. 마지막 버킷(상한 초과)은
+        최대값까지 보간한다.
+
+        Args:
+            q: 0-100
+        """
+        with self.lock:
+            return self._percentile(q)
+
+    def _percentile(self, q: float) -> float:
+        """percentile() 본체 (lock 보유 상태)"""
+        if self.count == 0:
+            return 0.0
+
+        rank = q / 100 * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max_ms
+                upper = min(upper, self.max_ms)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+
+        return self.max_ms
+
+    def get_stats(self) -> Dict:
+        """통계 반환 (백분위, 최대, 평균, 버킷별 건수)"""
+        with self.lock:
+            stats = {
+                'count': self.count,
+                'p50_ms': round(self._percentile(50), 1),
+                'p95_ms': round(self._percentile(95), 1),
+                'p99_ms': round(self._percentile(99), 1),
+                'max_ms': round(self.max_ms, 1),
+                'mean_ms': round(self.total_ms / self.count, 1) if self.count else 0.0,
+                'buckets': {
+                    (f'le_{bound}' if i < len(self.bounds) else f'gt_{self.bounds[-1]}'): count
+                    for i, (bound, count) in enumerate(zip(self.bounds + [None], self.counts))
+                }
+            }
+            if self.sla_ms is not None:
+                stats['sla_ms'] = self.sla_ms
+                stats['over_sla'] = self.over_sla
+
+        return stats
+
+
+class LatencyTracker:
+    """
+    단계별 지연 히스토그램 모음
+
+    프레임 작업에 기록한 단계 시각(monotonic)으로 단계 간 지연과
+    캡처 -> 발행 종단 지연을 기록한다.
+    """
+
+    def __init__(self, stages: Iterable[str], sla_seconds: Optional[float] = None):
+        """
+        Args:
+            stages: 캡처 이후 단계 이름 (순서대로, 예: scheduled, preprocess, ...)
+            sla_seconds: 종단 지연 목표 (초) - end_to_end/alert 초과 건수 집계
+        """
+        self.stages = list(stages)
+        sla_ms = sla_seconds * 1000 if sla_seconds else None
+        self.histograms = {stage: LatencyHistogram() for stage in self.stages}
+        self.histograms['end_to_end'] = LatencyHistogram(sla_ms=sla_ms)
+        self.histograms['alert'] = LatencyHistogram(sla_ms=sla_ms)
+
+    def record_stages(self, captured: float, stamps: Dict[str, float]) -> float:
+        """
+        단계별 지연과 종단 지연 기록
+
+        Args:
+            captured: 캡처 시각 (monotonic)
+            stamps: 단계 이름 -> 단계 완료 시각 (monotonic)
+
+        Returns:
+            float: 종단 지연 (초, 캡처 -> 마지막 단계)
+        """
+        previous = captured
+        for stage in self.stages:
+            stamp = stamps.get(stage)
+            if stamp is None:
+                continue
+            self.histograms[stage].record(stamp - previous)
+            previous = stamp
+
+        end_to_end = previous - captured
+        self.histograms['end_to_end'].record(end_to_end)
+        return end_to_end
+
+    def record(self, name: str, seconds: float):
+        """이름으로 지연 기록 (예: alert)"""
+        self.histograms[name].record(seconds)
+
+    def get_stats(self) -> Dict:
+        """히스토그램별 통계 반환"""
+        return {name: histogram.get_stats() for name, histogram in self.histograms.items()}
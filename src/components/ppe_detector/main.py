@@ -12,6 +12,7 @@ import sys
 import time
 import traceback
 from datetime import datetime
+from queue import Queue, Empty
 from threading import Event
 
 # 로깅 설정
@@ -34,8 +35,19 @@ except ImportError:
     GREENGRASS_IPC_AVAILABLE = False
 
 from rtsp_stream import RTSPStreamReader
-from ppe_model import PPEDetector
-from mqtt_publisher import MQTTPublisher
+from process_stream import ProcessStreamReader
+from ppe_model import PPEDetector, PPEComplianceChecker, PPE_CLASSES
+from mqtt_publisher import MQTTPublisher, PRIORITY_ALERT, PRIORITY_STATUS, PRIORITY_DETECTION
+from detection_batcher import DetectionBatcher, IOT_CORE_MAX_PAYLOAD
+from payload_codec import PayloadCodec
+from detection_delta import DetectionDelta
+from motion_gate import MotionGate
+from tracker import ByteTracker
+from violation_events import ViolationEventEngine, EVENT_OPENED
+from camera_scheduler import CameraStream, InferenceScheduler
+from inference_pool import InferencePool, unpack_detections
+from pipeline import DetectionPipeline
+from latency import LatencyHistogram, LatencyTracker
 
 
 class PPEDetectorComponent:
@@ -46,9 +58,24 @@ class PPEDetectorComponent:
         self.config = self._load_config()
 
         # 컴포넌트 초기화
-        self.stream_reader = None
+        self.cameras = []           # 카메라별 스트림 리더와 처리 상태 (CameraStream)
+        self.scheduler = None       # 공유 감지 모델 추론 슬롯 스케줄러
+        self.multi_camera = False   # CAMERAS 설정 시 detection 토픽에 카메라 ID 추가
         self.ppe_detector = None
+        self.inference_pool = None  # 추론 워커 프로세스 풀 (INFERENCE_WORKERS > 0)
         self.mqtt_publisher = None
+        self.detection_codec = None
+        self.compliance_checker = None
+        self.pipeline = None
+
+        # 파이프라인 단계 상태
+        self.blob_pool = None       # 전처리 -> 추론 blob 버퍼 풀
+
+        # 캡처 -> 발행 단계별 지연 (scheduled = 캡처 후 추론 슬롯을 받기까지)
+        self.latency = LatencyTracker(
+            ['scheduled', 'preprocess', 'infer', 'postprocess', 'publish'],
+            sla_seconds=self.config['latency_sla']
+        )
 
         # 통계
         self.stats = {
@@ -68,25 +95,100 @@ class PPEDetectorComponent:
             # RTSP 설정
             'rtsp_url': os.environ.get('RTSP_URL', 'rtsp://192.168.1.100:554/stream'),
             'rtsp_timeout': int(os.environ.get('RTSP_TIMEOUT', '30')),
-            'rtsp_reconnect_delay': int(os.environ.get('RTSP_RECONNECT_DELAY', '5')),
+            'rtsp_reconnect_delay': int(os.environ.get('RTSP_RECONNECT_DELAY', '5')),  # 첫 재연결 대기 (실패마다 2배)
+            'rtsp_backoff_max': float(os.environ.get('RTSP_BACKOFF_MAX', '60')),  # 최대 재연결 대기 (초)
+            'rtsp_stall_timeout': float(os.environ.get('RTSP_STALL_TIMEOUT', '10')),  # 프레임 없이 이 시간이 지나면 재연결
+            'camera_id': os.environ.get('CAMERA_ID', 'camera-1'),
+            # 디코더 실행 방식 (thread = 메인 프로세스 스레드, process = 카메라별 디코더 프로세스 + 공유 메모리)
+            'capture_mode': os.environ.get('CAPTURE_MODE', 'thread').lower(),
+
+            # 멀티 카메라 (JSON 배열, 비어 있으면 RTSP_URL 단일 카메라)
+            # 예: [{"id": "dock-1", "url": "rtsp://...", "priority": 2}, {"id": "dock-2", "url": "rtsp://..."}]
+            'cameras': os.environ.get('CAMERAS', '').strip(),
+            'inference_slots': int(os.environ.get('INFERENCE_SLOTS', '2')),  # 동시 전처리/추론 프레임 수
 
             # 모델 설정 (OpenCV DNN + ONNX)
             'model_path': os.environ.get('MODEL_PATH', '/opt/ppe-detector/models/yolov8n.onnx'),
             'confidence_threshold': float(os.environ.get('CONFIDENCE_THRESHOLD', '0.5')),
+            # NMS 전 후보 수 / NMS 후 감지 수 상한 (0이면 제한 없음)
+            'nms_max_candidates': int(os.environ.get('NMS_MAX_CANDIDATES', '3000')),
+            'nms_max_detections': int(os.environ.get('NMS_MAX_DETECTIONS', '300')),
             'use_cuda': os.environ.get('USE_CUDA', 'false').lower() == 'true',  # GPU 사용 여부
 
+            # 추론 엔진 설정 (opencv | onnxruntime)
+            'inference_engine': os.environ.get('INFERENCE_ENGINE', 'opencv').lower(),
+            'ort_intra_op_threads': int(os.environ.get('ORT_INTRA_OP_THREADS', '0')),  # 0 = ORT 기본값
+            'ort_inter_op_threads': int(os.environ.get('ORT_INTER_OP_THREADS', '0')),
+            'ort_graph_opt_level': os.environ.get('ORT_GRAPH_OPT_LEVEL', 'all').lower(),  # disable|basic|extended|all
+
+            # 추론 워커 프로세스 (0 = 메인 프로세스에서 추론, N = 워커 N개가 각자 모델 로드)
+            'inference_workers': int(os.environ.get('INFERENCE_WORKERS', '0')),
+            'inference_worker_threads': int(os.environ.get('INFERENCE_WORKER_THREADS', '1')),  # 워커별 OpenCV 스레드
+            'inference_worker_timeout': float(os.environ.get('INFERENCE_WORKER_TIMEOUT', '30')),  # 결과 대기 (초)
+
             # 처리 설정
             'process_interval': float(os.environ.get('PROCESS_INTERVAL', '1.0')),  # 초
             'skip_frames': int(os.environ.get('SKIP_FRAMES', '5')),  # 프레임 건너뛰기
+            'pipeline_queue_size': int(os.environ.get('PIPELINE_QUEUE_SIZE', '2')),  # 단계 간 큐 크기
+            'latency_sla': float(os.environ.get('LATENCY_SLA', '2.0')),  # 캡처 -> 알림 발행 목표 (초)
+
+            # 객체 추적 (감지기는 detect_interval 프레임마다 실행, 사이 프레임은 추적 예측)
+            'tracker': os.environ.get('TRACKER', 'false').lower() == 'true',
+            'detect_interval': int(os.environ.get('DETECT_INTERVAL', '1')),  # 감지기 실행 간격 (프레임)
+            'track_max_age': float(os.environ.get('TRACK_MAX_AGE', '3.0')),  # 미매칭 추적 유지 시간 (초)
+            'track_min_hits': int(os.environ.get('TRACK_MIN_HITS', '2')),  # 예측 박스 발행 최소 매칭 수
+            'track_low_threshold': float(os.environ.get('TRACK_LOW_THRESHOLD', '0.1')),  # 2차 매칭 최소 신뢰도
+
+            # 움직임 게이트 (움직임이 없으면 추론을 건너뛰고 이전 결과 재사용)
+            'motion_gate': os.environ.get('MOTION_GATE', 'true').lower() == 'true',
+            'motion_pixel_threshold': int(os.environ.get('MOTION_PIXEL_THRESHOLD', '25')),  # 0-255
+            'motion_ratio': float(os.environ.get('MOTION_RATIO', '0.002')),  # 변화 픽셀 비율
+            'motion_max_skip': float(os.environ.get('MOTION_MAX_SKIP', '10')),  # 최대 건너뛰기 시간 (초)
+            'motion_downscale_width': int(os.environ.get('MOTION_DOWNSCALE_WIDTH', '160')),
 
             # MQTT 설정
             'alert_topic': os.environ.get('ALERT_TOPIC', 'ppe/alerts'),
             'status_topic': os.environ.get('STATUS_TOPIC', 'ppe/status'),
             'detection_topic': os.environ.get('DETECTION_TOPIC', 'ppe/detections'),
+            'mqtt_async': os.environ.get('MQTT_ASYNC', 'true').lower() == 'true',  # 비동기 발행
+            'mqtt_max_in_flight': int(os.environ.get('MQTT_MAX_IN_FLIGHT', '8')),  # 동시 진행 발행 수
+            'mqtt_queue_size': int(os.environ.get('MQTT_QUEUE_SIZE', '1000')),  # detection 송신 큐 크기
+            'mqtt_detection_drop_policy': os.environ.get('MQTT_DETECTION_DROP_POLICY', 'drop_oldest'),
+            'mqtt_alert_queue_size': int(os.environ.get('MQTT_ALERT_QUEUE_SIZE', '500')),  # alert 송신 큐 크기
+            'mqtt_alert_drop_policy': os.environ.get('MQTT_ALERT_DROP_POLICY', 'drop_newest'),
+            'mqtt_status_queue_size': int(os.environ.get('MQTT_STATUS_QUEUE_SIZE', '10')),  # status 송신 큐 크기
+            'mqtt_status_drop_policy': os.environ.get('MQTT_STATUS_DROP_POLICY', 'drop_oldest'),
+            'mqtt_publish_timeout': float(os.environ.get('MQTT_PUBLISH_TIMEOUT', '10')),  # 초
+            'detection_batch_window': float(os.environ.get('DETECTION_BATCH_WINDOW', '0')),  # 초, 0 = 프레임별 발행
+            'mqtt_rate_limit': float(os.environ.get('MQTT_RATE_LIMIT', '50')),  # 전체 메시지/초, 0 = 제한 없음
+            'mqtt_rate_burst': float(os.environ.get('MQTT_RATE_BURST', '100')),
+            'mqtt_detection_rate': float(os.environ.get('MQTT_DETECTION_RATE', '5')),  # detection 토픽 메시지/초
+            'mqtt_detection_overflow': os.environ.get('MQTT_DETECTION_OVERFLOW', 'coalesce'),  # queue|coalesce|drop
+            'mqtt_alert_rate': float(os.environ.get('MQTT_ALERT_RATE', '10')),  # alert 토픽 메시지/초
+            'mqtt_alert_overflow': os.environ.get('MQTT_ALERT_OVERFLOW', 'queue'),
+            'mqtt_latency_target': float(os.environ.get('MQTT_LATENCY_TARGET', '2.0')),  # 초, 넘으면 자동 감속
+            'detection_delta': os.environ.get('DETECTION_DELTA', 'false').lower() == 'true',  # 변경분만 발행
+            'detection_keyframe_interval': float(os.environ.get('DETECTION_KEYFRAME_INTERVAL', '60')),  # 초
+            'detection_move_iou': float(os.environ.get('DETECTION_MOVE_IOU', '0.9')),  # 미만이면 이동으로 발행
+            'detection_move_pixels': int(os.environ.get('DETECTION_MOVE_PIXELS', '8')),  # 이하 흔들림 무시
+            'detection_encoding': os.environ.get('DETECTION_ENCODING', 'json').lower(),  # json|cjson|cbor|msgpack
+            'detection_compress': os.environ.get('DETECTION_COMPRESS', 'false').lower() == 'true',  # zlib 압축
+            'detection_batch_max_bytes': int(os.environ.get('DETECTION_BATCH_MAX_BYTES', str(IOT_CORE_MAX_PAYLOAD))),
+            'mqtt_spool_dir': os.environ.get('MQTT_SPOOL_DIR', '/opt/ppe-detector/spool'),  # 빈 값이면 사용 안 함
+            'mqtt_spool_max_mb': int(os.environ.get('MQTT_SPOOL_MAX_MB', '50')),
+            'mqtt_spool_eviction': os.environ.get('MQTT_SPOOL_EVICTION', 'drop_oldest'),  # drop_oldest, drop_newest
+            'mqtt_replay_rate': float(os.environ.get('MQTT_REPLAY_RATE', '5')),  # 재전송 메시지/초
 
             # 알림 설정
             'alert_cooldown': int(os.environ.get('ALERT_COOLDOWN', '30')),  # 동일 알림 최소 간격 (초)
-            'required_ppe': os.environ.get('REQUIRED_PPE', 'hardhat,safety_vest').split(','),
+            # 사람별 미착용 이벤트 (추적기 필요, 사용하면 alert_cooldown 대신 이벤트 상태 전이마다 발행)
+            # 알림 메시지 형식이 바뀌므로 기본은 끔 (alert_type 'ppe_violation', missing_ppe 목록, message 없음)
+            'violation_events': os.environ.get('VIOLATION_EVENTS', 'false').lower() == 'true',
+            'violation_open_frames': int(os.environ.get('VIOLATION_OPEN_FRAMES', '3')),  # 연속 미착용 프레임
+            'violation_close_frames': int(os.environ.get('VIOLATION_CLOSE_FRAMES', '3')),  # 연속 착용 프레임
+            'violation_lost_timeout': float(os.environ.get('VIOLATION_LOST_TIMEOUT', '5.0')),  # 초
+            'required_ppe': [p.strip() for p in os.environ.get('REQUIRED_PPE', 'hardhat,safety_vest').split(',') if p.strip()],
+            'ppe_min_overlap': float(os.environ.get('PPE_MIN_OVERLAP', '0.3')),
 
             # Thing 이름
             'thing_name': os.environ.get('AWS_IOT_THING_NAME', 'RaspberryPi5-PPE'),
@@ -104,88 +206,249 @@ class PPEDetectorComponent:
         """컴포넌트 초기화"""
         logger.info("Initializing PPE Detector Component...")
 
-        # RTSP 스트림 리더 초기화
-        self.stream_reader = RTSPStreamReader(
-            rtsp_url=self.config['rtsp_url'],
-            timeout=self.config['rtsp_timeout'],
-            reconnect_delay=self.config['rtsp_reconnect_delay']
-        )
+        # PPE 감지 모델 초기화 (모든 카메라가 공유) (OpenCV DNN / ONNX Runtime + ONNX)
+        engine_options = None
+        if self.config['inference_engine'] == 'onnxruntime':
+            engine_options = {
+                'intra_op_threads': self.config['ort_intra_op_threads'],
+                'inter_op_threads': self.config['ort_inter_op_threads'],
+                'graph_optimization_level': self.config['ort_graph_opt_level'],
+            }
 
-        # PPE 감지 모델 초기화 (OpenCV DNN + ONNX)
-        self.ppe_detector = PPEDetector(
-            model_path=self.config['model_path'],
-            confidence_threshold=self.config['confidence_threshold'],
-            use_cuda=self.config['use_cuda']
-        )
+        # 추적기 사용 시 감지기는 낮은 임계값으로 실행하여 2차 매칭에 낮은 신뢰도 감지를 공급
+        # (CONFIDENCE_THRESHOLD는 새 추적 생성과 발행 결과에만 적용)
+        detector_threshold = self.config['confidence_threshold']
+        if self.config['tracker']:
+            detector_threshold = min(detector_threshold, self.config['track_low_threshold'])
+
+        detector_options = {
+            'model_path': self.config['model_path'],
+            'confidence_threshold': detector_threshold,
+            'use_cuda': self.config['use_cuda'],
+            'engine': self.config['inference_engine'],
+            'engine_options': engine_options,
+            'max_candidates': self.config['nms_max_candidates'],
+            'max_detections': self.config['nms_max_detections']
+        }
+
+        if self.config['inference_workers'] > 0:
+            # 워커 프로세스마다 모델 로드 (메인 프로세스는 모델을 로드하지 않음)
+            # 워커가 모두 바쁘게 돌도록 추론 슬롯은 워커 수 + 1 이상
+            self.config['inference_slots'] = max(
+                self.config['inference_slots'], self.config['inference_workers'] + 1
+            )
+            self.inference_pool = InferencePool(
+                num_workers=self.config['inference_workers'],
+                detector_options=detector_options,
+                threads_per_worker=self.config['inference_worker_threads'],
+                slots=self.config['inference_slots']
+            )
+            self.inference_pool.start()
+        else:
+            self.ppe_detector = PPEDetector(**detector_options)
+
+        if self.config['detection_delta'] and self.config['mqtt_detection_overflow'] != 'queue':
+            # 변경분은 누적되므로 coalesce/drop으로 하나라도 빠지면 구독 측 상태가 어긋남
+            logger.warning("DETECTION_DELTA requires MQTT_DETECTION_OVERFLOW=queue, overriding")
+            self.config['mqtt_detection_overflow'] = 'queue'
 
         # MQTT 퍼블리셔 초기화
         self.mqtt_publisher = MQTTPublisher(
             thing_name=self.config['thing_name'],
-            use_greengrass_ipc=GREENGRASS_IPC_AVAILABLE
+            use_greengrass_ipc=GREENGRASS_IPC_AVAILABLE,
+            async_mode=self.config['mqtt_async'],
+            max_in_flight=self.config['mqtt_max_in_flight'],
+            queue_size=self.config['mqtt_queue_size'],
+            publish_timeout=self.config['mqtt_publish_timeout'],
+            lanes={
+                PRIORITY_ALERT: {
+                    'queue_size': self.config['mqtt_alert_queue_size'],
+                    'drop_policy': self.config['mqtt_alert_drop_policy']
+                },
+                PRIORITY_STATUS: {
+                    'queue_size': self.config['mqtt_status_queue_size'],
+                    'drop_policy': self.config['mqtt_status_drop_policy']
+                },
+                PRIORITY_DETECTION: {
+                    'drop_policy': self.config['mqtt_detection_drop_policy']
+                }
+            },
+            spool_dir=self.config['mqtt_spool_dir'] or None,
+            spool_max_bytes=self.config['mqtt_spool_max_mb'] * 1024 * 1024,
+            spool_eviction=self.config['mqtt_spool_eviction'],
+            replay_rate=self.config['mqtt_replay_rate'],
+            rate_limit=self.config['mqtt_rate_limit'],
+            rate_burst=self.config['mqtt_rate_burst'],
+            topic_rate_limits={
+                self.config['detection_topic']: {
+                    'rate': self.config['mqtt_detection_rate'],
+                    'overflow': self.config['mqtt_detection_overflow']
+                },
+                self.config['alert_topic']: {
+                    'rate': self.config['mqtt_alert_rate'],
+                    'overflow': self.config['mqtt_alert_overflow']
+                }
+            },
+            latency_target=self.config['mqtt_latency_target']
         )
 
-        logger.info("PPE Detector Component initialized successfully")
+        # 사람 <-> PPE 할당 (머리/몸통 영역 규칙)
+        self.compliance_checker = PPEComplianceChecker(
+            required_ppe=self.config['required_ppe'],
+            min_overlap=self.config['ppe_min_overlap']
+        )
 
-    def run(self):
-        """메인 실행 루프"""
-        logger.info("Starting PPE detection loop...")
-        self.stats['start_time'] = datetime.now()
+        if not self.config['tracker'] and self.config['detect_interval'] > 1:
+            logger.warning("DETECT_INTERVAL requires TRACKER=true, running detector on every frame")
+            self.config['detect_interval'] = 1
 
-        # 상태 메시지 발행
-        self._publish_status("RUNNING")
+        if self.config['violation_events'] and not self.config['tracker']:
+            logger.warning("VIOLATION_EVENTS requires TRACKER=true, using per-class alert cooldown")
+
+        # 감지 결과 페이로드 인코딩 (json이 아니면 토픽에 인코딩 태그 추가)
+        if self.config['detection_encoding'] != 'json' or self.config['detection_compress']:
+            self.detection_codec = PayloadCodec(
+                encoding=self.config['detection_encoding'],
+                compress=self.config['detection_compress']
+            )
+            logger.info(
+                f"Detection payload encoding: {self.detection_codec.name} "
+                f"(topic {self.detection_codec.topic(self.config['detection_topic'])})"
+            )
 
-        last_process_time = 0
-        frame_count = 0
-        last_alerts = {}  # 클래스별 마지막 알림 시간
+        # 카메라별 스트림 리더 (감지 모델 1개를 스케줄러가 배분)
+        self.multi_camera = bool(self.config['cameras'])
+        # process 모드는 공유 메모리 링 슬롯을 복사 없이 그대로 파이프라인에 전달
+        self.scheduler = InferenceScheduler(
+            slots=self.config['inference_slots'],
+            copy_frames=self.config['capture_mode'] != 'process'
+        )
+        for camera_config in self._camera_configs():
+            camera = self._create_camera(camera_config)
+            self.cameras.append(camera)
+            self.scheduler.add_camera(camera)
 
-        try:
-            # 스트림 연결
-            if not self.stream_reader.connect():
-                logger.error("Failed to connect to RTSP stream")
-                self._publish_status("ERROR", "RTSP connection failed")
-                return
+        logger.info(
+            f"Cameras: {', '.join(f'{c.camera_id} (priority {c.priority})' for c in self.cameras)}"
+        )
 
-            while not self.shutdown_event.is_set():
-                # 프레임 읽기
-                frame = self.stream_reader.read_frame()
-                if frame is None:
-                    logger.warning("Failed to read frame, attempting reconnection...")
-                    time.sleep(self.config['rtsp_reconnect_delay'])
-                    self.stream_reader.reconnect()
-                    continue
+        logger.info("PPE Detector Component initialized successfully")
+
+    def _camera_configs(self) -> list:
+        """카메라 목록 - CAMERAS(JSON 배열)가 없으면 RTSP_URL 단일 카메라"""
+        if not self.config['cameras']:
+            return [{'id': self.config['camera_id'], 'url': self.config['rtsp_url'], 'priority': 1}]
+
+        cameras = []
+        for index, camera in enumerate(json.loads(self.config['cameras'])):
+            if isinstance(camera, str):
+                camera = {'url': camera}
+            cameras.append({
+                'id': str(camera.get('id') or f'camera-{index + 1}'),
+                'url': camera['url'],
+                'priority': int(camera.get('priority', 1))
+            })
+
+        ids = [c['id'] for c in cameras]
+        if not cameras or len(set(ids)) != len(ids):
+            raise ValueError(f"CAMERAS must be a non-empty list with unique ids: {ids}")
+
+        return cameras
+
+    def _create_camera(self, camera_config: dict) -> CameraStream:
+        """카메라 1대의 스트림 리더와 카메라별 처리 상태 생성"""
+        reader_options = {}
+        reader_class = RTSPStreamReader
+        if self.config['capture_mode'] == 'process':
+            # 파이프라인이 슬롯을 복사 없이 쓰므로 처리 중인 프레임보다 링을 넉넉히
+            reader_class = ProcessStreamReader
+            reader_options['buffer_size'] = self.config['inference_slots'] + 1
+
+        reader = reader_class(
+            rtsp_url=camera_config['url'],
+            timeout=self.config['rtsp_timeout'],
+            reconnect_delay=self.config['rtsp_reconnect_delay'],
+            backoff_max=self.config['rtsp_backoff_max'],
+            stall_timeout=self.config['rtsp_stall_timeout'],
+            # 처리할 프레임만 디코드 (나머지는 grab()으로 건너뜀)
+            frame_stride=self.config['skip_frames'],
+            sample_interval=self.config['process_interval'],
+            frame_notify=self.scheduler.frame_ready,
+            **reader_options
+        )
+        camera = CameraStream(camera_config['id'], reader, priority=camera_config['priority'])
+        camera.latency = LatencyHistogram(sla_ms=self.config['latency_sla'] * 1000)
+
+        # 객체 추적기
+        if self.config['tracker']:
+            camera.tracker = ByteTracker(
+                high_threshold=self.config['confidence_threshold'],
+                low_threshold=self.config['track_low_threshold'],
+                min_hits=self.config['track_min_hits'],
+                max_age=self.config['track_max_age'],
+                frame_interval=self.config['process_interval']  # 카메라별 처리 프레임 간격
+            )
+
+            # 사람별 미착용 이벤트 엔진 (추적 ID 기준)
+            if self.config['violation_events']:
+                camera.violation_events = ViolationEventEngine(
+                    open_frames=self.config['violation_open_frames'],
+                    close_frames=self.config['violation_close_frames'],
+                    lost_timeout=self.config['violation_lost_timeout']
+                )
+
+        # 움직임 게이트
+        if self.config['motion_gate']:
+            camera.motion_gate = MotionGate(
+                downscale_width=self.config['motion_downscale_width'],
+                pixel_threshold=self.config['motion_pixel_threshold'],
+                motion_ratio=self.config['motion_ratio'],
+                max_skip_seconds=self.config['motion_max_skip']
+            )
+
+        # 감지 결과 변경분 발행 (추가/제거/이동 + 주기적 키프레임)
+        if self.config['detection_delta']:
+            camera.detection_delta = DetectionDelta(
+                keyframe_interval=self.config['detection_keyframe_interval'],
+                move_iou=self.config['detection_move_iou'],
+                move_pixels=self.config['detection_move_pixels']
+            )
 
-                frame_count += 1
+        # 감지 결과 배칭 (윈도우 단위로 묶어 메시지 수 절감)
+        if self.config['detection_batch_window'] > 0:
+            camera.detection_batcher = DetectionBatcher(
+                window_seconds=self.config['detection_batch_window'],
+                max_payload_bytes=self.config['detection_batch_max_bytes'],
+                envelope={'thing_name': self.config['thing_name'], 'camera_id': camera.camera_id}
+            )
 
-                # 프레임 건너뛰기
-                if frame_count % self.config['skip_frames'] != 0:
-                    continue
+        return camera
 
-                # 처리 간격 체크
-                current_time = time.time()
-                if current_time - last_process_time < self.config['process_interval']:
-                    continue
+    def run(self):
+        """메인 실행 루프 - 단계별 파이프라인 시작 후 종료 대기"""
+        logger.info("Starting PPE detection pipeline...")
+        self.stats['start_time'] = datetime.now()
 
-                last_process_time = current_time
+        # 상태 메시지 발행
+        self._publish_status("RUNNING")
 
-                # PPE 감지 수행
-                detections = self.ppe_detector.detect(frame)
-                self.stats['frames_processed'] += 1
+        try:
+            # 카메라별 연결 관리 스레드 시작 (비차단)
+            # 연결 실패/정지한 카메라는 각자 백오프하며 재연결하고, 그동안 다른 카메라는 계속 처리
+            for camera in self.cameras:
+                camera.reader.start()
 
-                if detections:
-                    self.stats['detections'] += len(detections)
+            self.pipeline = self._build_pipeline()
+            self.pipeline.start()
 
-                    # 감지 결과 발행
-                    self._publish_detection(detections)
+            while not self.shutdown_event.is_set():
+                self.shutdown_event.wait(1.0)
 
-                    # PPE 미착용 확인 및 알림
-                    alerts = self._check_ppe_compliance(detections, last_alerts, current_time)
-                    if alerts:
-                        self._publish_alerts(alerts)
-                        last_alerts.update({a['class']: current_time for a in alerts})
+                if not self.pipeline.is_alive():
+                    raise RuntimeError("Pipeline stage stopped unexpectedly")
 
-                # 주기적 상태 보고 (1분마다)
-                if self.stats['frames_processed'] % 60 == 0:
-                    self._publish_status("RUNNING")
+                if self.inference_pool:
+                    self.inference_pool.maintain()
 
         except Exception as e:
             logger.error(f"Error in main loop: {e}")
@@ -193,28 +456,277 @@ class PPEDetectorComponent:
             self._publish_status("ERROR", str(e))
 
         finally:
+            if self.pipeline:
+                self.pipeline.stop()
             self.cleanup()
 
-    def _check_ppe_compliance(self, detections: list, last_alerts: dict, current_time: float) -> list:
-        """PPE 착용 규정 준수 확인"""
-        alerts = []
+    def _build_pipeline(self) -> DetectionPipeline:
+        """
+        캡처 -> 전처리 -> 추론 -> 후처리 -> 발행 파이프라인 구성
+
+        각 단계는 별도 스레드에서 실행되며, 프레임 N 추론 중에 N+1 전처리와
+        N-1 발행이 동시에 진행된다. 단계 사이 큐가 가득 차면 가장 오래된
+        항목을 버린다.
+        """
+        queue_size = self.config['pipeline_queue_size']
+
+        if self.inference_pool:
+            # 워커 풀 모드 - 전처리 단계에서 제출, 추론 단계에서 결과 대기
+            # 진행 중인 작업이 큐에서 버려지지 않도록 큐 크기를 슬롯 수 이상으로
+            queue_size = max(queue_size, self.scheduler.slot_count)
+        else:
+            # 전처리 -> 추론 사이 blob 버퍼 풀 (큐에 queue_size개 + 전처리/추론 중 각 1개)
+            self.blob_pool = Queue()
+            for _ in range(max(queue_size, self.scheduler.slot_count) + 2):
+                self.blob_pool.put(self.ppe_detector.new_blob_buffer())
+
+        pipeline = DetectionPipeline(queue_size=queue_size)
+        pipeline.add_stage('capture', self._capture_stage, source=self._next_frame)
+        pipeline.add_stage('preprocess', self._stamped('preprocess', self._preprocess_stage), on_drop=self._release_job)
+        pipeline.add_stage('infer', self._stamped('infer', self._infer_stage), on_drop=self._release_job)
+        pipeline.add_stage('postprocess', self._stamped('postprocess', self._postprocess_stage))
+        # 알림/이벤트가 있는 작업은 발행 큐에서 버리지 않음 (알림 유실 및 쿨다운으로 인한 재알림 지연 방지)
+        pipeline.add_stage(
+            'publish', self._publish_stage,
+            keep=lambda job: bool(job['alerts'] or job['events']),
+            on_enqueue=self._commit_alerts
+        )
 
-        # 감지된 사람 수
-        persons = [d for d in detections if d['class'] == 'person']
+        return pipeline
+
+    @staticmethod
+    def _stamped(name: str, stage):
+        """단계 완료 시각(monotonic)을 작업의 stages에 기록하는 단계 함수 래퍼"""
+        def run(job: dict):
+            result = stage(job)
+            if result is not None:
+                result['stages'][name] = time.monotonic()
+            return result
+        return run
+
+    def _next_frame(self):
+        """
+        캡처 단계 입력 - 스케줄러가 고른 카메라의 최신 프레임 읽기
+
+        추론 슬롯을 확보한 뒤 카메라를 고르므로 추론이 밀리면 여기서 대기한다
+        (이 대기는 캡처 단계 처리 시간에 포함되지 않음).
+        """
+        # 샘플링 간격보다 길게 대기 (끊긴 카메라는 리더가 백그라운드에서 재연결)
+        return self.scheduler.next_frame(timeout=self.config['process_interval'] + 1.0)
+
+    def _capture_stage(self, scheduled: tuple):
+        """
+        캡처 단계 - 스케줄된 프레임으로 작업 생성 (추적 간격, 움직임 게이트)
+
+        프레임 건너뛰기(skip_frames)와 처리 간격(process_interval)은 스트림
+        리더가 grab()/retrieve()로 적용하므로 읽은 프레임은 모두 처리한다.
+        """
+        camera, frame, frame_info = scheduled
+        now = time.monotonic()
+        if frame_info is None:
+            # 메타데이터를 읽는 도중 슬롯이 덮어쓰인 경우 - 스케줄 시각으로 대체
+            frame_info = {'seq': None, 'captured_mono': now, 'captured_at': time.time(), 'pts_ms': None}
+
+        job = {
+            'camera': camera,
+            'frame': frame,
+            'frame_info': frame_info,
+            'stages': {'scheduled': now},  # 단계 완료 시각 (monotonic)
+            'timestamp': time.time(),
+            'slot': True
+        }
 
-        for person in persons:
-            person_box = person['bbox']
+        try:
+            camera.frames_captured += 1
+
+            # 감지기 실행 프레임이 아니면 추적 예측만 수행
+            if camera.frames_captured % self.config['detect_interval'] != 0:
+                job['skip_inference'] = 'interval'
+
+            # 움직임이 없으면 추론 건너뛰기 (후처리 단계에서 이전 결과 재사용)
+            elif camera.motion_gate and not camera.motion_gate.check(frame):
+                job['skip_inference'] = 'static'
+        except Exception:
+            self._release_job(job)
+            raise
+
+        return job
+
+    def _preprocess_stage(self, job: dict):
+        """전처리 단계 - 풀에서 꺼낸 blob 버퍼에 letterbox/정규화 (워커 풀 모드에서는 작업 제출)"""
+        if job.get('skip_inference'):
+            job.pop('frame')
+            self._release_slot(job)
+            return job
+
+        if self.inference_pool:
+            # 프레임을 공유 메모리 슬롯에 복사 - 전처리/추론/후처리는 워커 프로세스에서 수행
+            try:
+                task = self.inference_pool.submit(job.pop('frame'), timeout=1.0)
+            except Exception:
+                self._release_slot(job)
+                raise
+            if task is None:
+                logger.warning("No free shared memory slot, dropping frame")
+                self._release_slot(job)
+                return None
+            job['task'] = task
+            return job
+
+        try:
+            blob = self.blob_pool.get(timeout=1.0)
+        except Empty:
+            logger.warning("No free blob buffer, dropping frame")
+            self._release_slot(job)
+            return None
 
-            # 해당 사람 영역 내 PPE 확인
-            detected_ppe = set()
-            for d in detections:
-                if d['class'] in self.config['required_ppe']:
-                    # 바운딩 박스 겹침 확인 (간단한 IoU)
-                    if self._boxes_overlap(person_box, d['bbox']):
-                        detected_ppe.add(d['class'])
+        job['blob'] = blob
+        try:
+            job['blob'], job['params'] = self.ppe_detector.preprocess(job.pop('frame'), blob)
+        except Exception:
+            self._release_job(job)
+            raise
+
+        return job
+
+    def _infer_stage(self, job: dict):
+        """추론 단계 (워커 풀 모드에서는 결과 대기)"""
+        if job.get('skip_inference'):
+            return job
+
+        if self.inference_pool:
+            task = job.pop('task')
+            try:
+                job['pool_detections'] = unpack_detections(
+                    task.result(timeout=self.config['inference_worker_timeout']), PPE_CLASSES
+                )
+            except TimeoutError:
+                # 워커가 종료된 경우 등 - 슬롯 회수 (워커는 감시 루프에서 재시작)
+                self.inference_pool.abandon(task)
+                raise
+            finally:
+                self._release_slot(job)
+            return job
+
+        try:
+            job['outputs'] = self.ppe_detector.infer(job['blob'])
+        finally:
+            self._release_job(job)
+
+        return job
+
+    def _release_blob(self, job: dict):
+        """blob 버퍼를 풀에 반환 (추론 완료 또는 큐에서 버려진 경우)"""
+        blob = job.pop('blob', None)
+        if blob is not None:
+            self.blob_pool.put(blob)
+
+    def _release_slot(self, job: dict):
+        """스케줄러 추론 슬롯 반환 (작업당 한 번)"""
+        if job.pop('slot', False):
+            self.scheduler.release()
+
+    def _release_job(self, job: dict):
+        """작업이 점유한 blob 버퍼와 추론 슬롯 반환"""
+        self._release_blob(job)
+        self._release_slot(job)
+
+    def _postprocess_stage(self, job: dict):
+        """후처리 단계 - 감지 결과 디코딩 및 PPE 규정 준수 확인 (카메라별 상태 사용)"""
+        camera = job['camera']
+        skip = job.get('skip_inference')
+        if skip == 'interval':
+            # 감지기를 실행하지 않은 프레임 - 추적 예측 박스
+            detections = camera.tracker.predict(job['timestamp'])
+        elif skip == 'static':
+            # 움직임 없음 - 마지막 감지 결과 재사용 (추적이 만료되지 않도록 다시 입력)
+            detections = list(camera.last_detections)
+            if camera.tracker:
+                detections = camera.tracker.update(detections, job['timestamp'])
+        else:
+            if 'pool_detections' in job:
+                camera.last_detections = job.pop('pool_detections')
+            else:
+                camera.last_detections = self.ppe_detector.postprocess(job.pop('outputs'), job['params'])
+            detections = camera.last_detections
+            if camera.tracker:
+                detections = camera.tracker.update(detections, job['timestamp'])
+        self.stats['frames_processed'] += 1
+        camera.stats['skipped' if skip else 'inferred'] += 1
+
+        job['frame_index'] = self.stats['frames_processed']
+        job['detections'] = detections
+        job['alerts'] = []
+        job['events'] = []
+
+        if detections:
+            self.stats['detections'] += len(detections)
+            camera.stats['detections'] += len(detections)
+
+        if camera.violation_events:
+            # 사람별 이벤트 상태 전이 (사람이 없는 프레임도 반영하여 이벤트 종료)
+            persons = [
+                {**person, 'missing_ppe': missing}
+                for person, missing in self._find_missing_ppe(detections)
+            ]
+            job['events'] = camera.violation_events.update(persons, job['timestamp'])
+
+        elif detections:
+            # PPE 미착용 확인
+            alerts = self._check_ppe_compliance(detections, camera.last_alerts, job['timestamp'])
+            if alerts:
+                # 쿨다운 시각은 발행 큐에 들어간 뒤 기록 (_commit_alerts)
+                job['alerts'] = alerts
+
+        return job
+
+    def _commit_alerts(self, job: dict):
+        """발행 큐에 들어간 작업의 알림 쿨다운 시각 기록"""
+        if job['alerts']:
+            job['camera'].last_alerts.update({a['class']: job['timestamp'] for a in job['alerts']})
+
+    def _publish_stage(self, job: dict):
+        """발행 단계 - 감지 결과/알림/주기적 상태 발행"""
+        camera = job['camera']
+
+        # 알림 먼저 발행 (detection보다 우선)
+        if job['alerts']:
+            self._publish_alerts(camera, job['alerts'], job['frame_info'])
+
+        if job['events']:
+            self._publish_violation_events(camera, job['events'], job['frame_info'])
+
+        # 감지 결과 발행 (변경분 모드에서는 감지가 없어도 제거 발행을 위해 호출)
+        if job['detections'] or camera.detection_delta:
+            self._publish_detection(camera, job['detections'])
+
+        # 배칭 윈도우 종료 확인 (감지가 없는 프레임에서도 확인)
+        if camera.detection_batcher:
+            self._publish_detection_batches(camera, camera.detection_batcher.poll())
+
+        # 캡처 -> 발행 지연 기록
+        job['stages']['publish'] = time.monotonic()
+        camera.latency.record(self.latency.record_stages(job['frame_info']['captured_mono'], job['stages']))
+
+        # 주기적 상태 보고 (1분마다)
+        if job['frame_index'] % 60 == 0:
+            self._publish_status("RUNNING")
+
+        return job
+
+    def _find_missing_ppe(self, detections: list) -> list:
+        """사람별 누락된 PPE 확인 - [(사람 감지 결과, 누락 PPE 집합)]"""
+        return [
+            (result['person'], result['missing'])
+            for result in self.compliance_checker.check_persons(detections)
+        ]
+
+    def _check_ppe_compliance(self, detections: list, last_alerts: dict, current_time: float) -> list:
+        """PPE 착용 규정 준수 확인 (클래스별 쿨다운)"""
+        alerts = []
 
-            # 누락된 PPE 확인
-            missing_ppe = set(self.config['required_ppe']) - detected_ppe
+        for person, missing_ppe in self._find_missing_ppe(detections):
+            person_box = person['bbox']
 
             for ppe in missing_ppe:
                 # 쿨다운 체크
@@ -232,41 +744,87 @@ class PPEDetectorComponent:
 
         return alerts
 
-    def _boxes_overlap(self, box1: list, box2: list, threshold: float = 0.3) -> bool:
-        """두 바운딩 박스의 겹침 여부 확인"""
-        x1 = max(box1[0], box2[0])
-        y1 = max(box1[1], box2[1])
-        x2 = min(box1[2], box2[2])
-        y2 = min(box1[3], box2[3])
-
-        if x2 <= x1 or y2 <= y1:
-            return False
-
-        intersection = (x2 - x1) * (y2 - y1)
-        box2_area = (box2[2] - box2[0]) * (box2[3] - box2[1])
+    def _detection_topic(self, camera: CameraStream) -> str:
+        """감지 결과 토픽 (멀티 카메라 모드에서는 카메라별 하위 토픽 - 카메라별 coalesce)"""
+        if self.multi_camera:
+            return f"{self.config['detection_topic']}/{camera.camera_id}"
+        return self.config['detection_topic']
+
+    def _publish_detection(self, camera: CameraStream, detections: list):
+        """감지 결과 MQTT 발행 (배칭 모드에서는 윈도우에 추가)"""
+        timestamp = datetime.now().isoformat()
+
+        # 변경분 모드 - 변화가 없으면 발행하지 않음
+        fields = None
+        if camera.detection_delta:
+            fields = camera.detection_delta.update(detections)
+            if fields is None:
+                return
+            detections = None
 
-        return (intersection / box2_area) > threshold if box2_area > 0 else False
+        if camera.detection_batcher:
+            self._publish_detection_batches(camera, camera.detection_batcher.add(timestamp, detections, fields))
+            return
 
-    def _publish_detection(self, detections: list):
-        """감지 결과 MQTT 발행"""
         message = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'thing_name': self.config['thing_name'],
-            'detections': detections,
-            'count': len(detections)
+            'camera_id': camera.camera_id
         }
-
-        self.mqtt_publisher.publish(
-            topic=self.config['detection_topic'],
-            payload=message
+        if fields:
+            message.update(fields)
+        else:
+            message['detections'] = detections
+            message['count'] = len(detections)
+
+        self._publish_detection_message(camera, message)
+
+    def _publish_detection_batches(self, camera: CameraStream, batches: list):
+        """배치 감지 결과 MQTT 발행"""
+        for batch in batches:
+            self._publish_detection_message(camera, batch)
+
+    def _publish_detection_message(self, camera: CameraStream, payload: dict):
+        """
+        감지 결과 메시지 1건 발행
+
+        변경분 모드에서 메시지가 거부되거나 detection 큐가 drop 정책으로 메시지를
+        버렸으면 다음 발행을 키프레임으로 전환한다. 큐는 카메라가 공유하므로
+        다른 카메라의 메시지가 버려져도 키프레임으로 복구한다 (보수적).
+        """
+        accepted = self.mqtt_publisher.publish(
+            topic=self._detection_topic(camera),
+            payload=payload,
+            priority=PRIORITY_DETECTION,
+            codec=self.detection_codec
         )
 
-    def _publish_alerts(self, alerts: list):
+        if camera.detection_delta:
+            dropped = self.mqtt_publisher.dropped_count(PRIORITY_DETECTION)
+            if not accepted or dropped != camera.detection_dropped:
+                camera.detection_dropped = dropped
+                camera.detection_delta.force_keyframe()
+
+    def _frame_latency_fields(self, frame_info: dict) -> dict:
+        """
+        알림 메시지의 프레임 캡처 시각과 캡처 -> 발행 지연 필드
+
+        알림 지연 히스토그램(latency.alert)에도 기록한다.
+        """
+        latency = time.monotonic() - frame_info['captured_mono']
+        self.latency.record('alert', latency)
+        return {
+            'captured_at': datetime.fromtimestamp(frame_info['captured_at']).isoformat(),
+            'latency_ms': round(latency * 1000, 1)
+        }
+
+    def _publish_alerts(self, camera: CameraStream, alerts: list, frame_info: dict):
         """알림 MQTT 발행"""
         for alert in alerts:
             message = {
                 'timestamp': datetime.now().isoformat(),
                 'thing_name': self.config['thing_name'],
+                'camera_id': camera.camera_id,
                 'alert_type': alert['type'],
                 'missing_ppe': alert['class'],
                 'message': alert['message'],
@@ -275,14 +833,65 @@ class PPEDetectorComponent:
                     'bbox': alert.get('person_bbox', [])
                 }
             }
+            message.update(self._frame_latency_fields(frame_info))
 
             self.mqtt_publisher.publish(
                 topic=self.config['alert_topic'],
-                payload=message
+                payload=message,
+                priority=PRIORITY_ALERT
             )
 
             self.stats['alerts_sent'] += 1
-            logger.warning(f"ALERT: {alert['message']}")
+            camera.stats['alerts_sent'] += 1
+            logger.warning(f"ALERT [{camera.camera_id}]: {alert['message']}")
+
+    def _publish_violation_events(self, camera: CameraStream, events: list, frame_info: dict = None):
+        """
+        사람별 미착용 이벤트 상태 전이 MQTT 발행 (전이당 1건)
+
+        frame_info가 없으면 (종료 시 일괄 종료 등) 캡처 시각을 넣지 않는다.
+        """
+        for event in events:
+            message = {
+                'timestamp': datetime.now().isoformat(),
+                'thing_name': self.config['thing_name'],
+                'camera_id': camera.camera_id,
+                'alert_type': 'ppe_violation',
+                'event': event['event'],
+                'event_id': event['event_id'],
+                'track_id': event['track_id'],
+                'missing_ppe': event['missing_ppe'],
+                'severity': 'HIGH',
+                'location': {
+                    'bbox': event['person_bbox']
+                },
+                'opened_at': datetime.fromtimestamp(event['opened_at']).isoformat(),
+                'duration_seconds': event['duration']
+            }
+            if 'closed_at' in event:
+                message['closed_at'] = datetime.fromtimestamp(event['closed_at']).isoformat()
+                message['close_reason'] = event['close_reason']
+            if frame_info:
+                message.update(self._frame_latency_fields(frame_info))
+
+            self.mqtt_publisher.publish(
+                topic=self.config['alert_topic'],
+                payload=message,
+                priority=PRIORITY_ALERT
+            )
+
+            self.stats['alerts_sent'] += 1
+            camera.stats['alerts_sent'] += 1
+            if event['event'] == EVENT_OPENED:
+                logger.warning(
+                    f"VIOLATION [{camera.camera_id}] #{event['event_id']} opened: track {event['track_id']} "
+                    f"missing {', '.join(event['missing_ppe'])}"
+                )
+            else:
+                logger.info(
+                    f"VIOLATION [{camera.camera_id}] #{event['event_id']} {event['event']}: "
+                    f"{', '.join(event['missing_ppe'])}"
+                )
 
     def _publish_status(self, status: str, error_message: str = None):
         """상태 MQTT 발행"""
@@ -299,12 +908,35 @@ class PPEDetectorComponent:
             }
         }
 
+        if self.cameras:
+            # 카메라별 스트림/추적/이벤트/발행 통계
+            message['cameras'] = {camera.camera_id: camera.get_stats() for camera in self.cameras}
+
+        if self.scheduler:
+            message['scheduler'] = self.scheduler.get_stats()
+
+        if self.inference_pool:
+            message['inference_pool'] = self.inference_pool.get_stats()
+
+        if self.mqtt_publisher:
+            message['mqtt'] = self.mqtt_publisher.get_stats()
+
+        # 캡처 -> 발행 지연 히스토그램 (단계별, 종단, 알림)
+        message['latency'] = self.latency.get_stats()
+
+        if self.pipeline:
+            message['pipeline'] = {
+                'stages': self.pipeline.get_stats(),
+                'bottleneck': self.pipeline.get_bottleneck()
+            }
+
         if error_message:
             message['error'] = error_message
 
         self.mqtt_publisher.publish(
             topic=self.config['status_topic'],
-            payload=message
+            payload=message,
+            priority=PRIORITY_STATUS
         )
 
         logger.info(f"Status: {status}, Stats: {self.stats}")
@@ -313,11 +945,26 @@ class PPEDetectorComponent:
         """리소스 정리"""
         logger.info("Cleaning up resources...")
 
-        if self.stream_reader:
-            self.stream_reader.release()
+        for camera in self.cameras:
+            camera.reader.release()
+
+            # 진행 중인 미착용 이벤트 종료 발행
+            if camera.violation_events and self.mqtt_publisher:
+                self._publish_violation_events(camera, camera.violation_events.close_all(time.time()))
+
+            # 배칭 중인 감지 결과 발행
+            if camera.detection_batcher and self.mqtt_publisher:
+                self._publish_detection_batches(camera, camera.detection_batcher.flush())
+
+        if self.inference_pool:
+            self.inference_pool.stop()
 
         self._publish_status("STOPPED")
 
+        # 남은 메시지 송신 후 연결 종료
+        if self.mqtt_publisher:
+            self.mqtt_publisher.disconnect()
+
         logger.info("Cleanup completed")
 
 
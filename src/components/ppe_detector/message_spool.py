@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Message Spool
+업링크 장애 시 발행하지 못한 MQTT 메시지를 디스크에 보관하는 모듈
+append-only 세그먼트 파일, fsync 배치, 용량 상한 및 eviction 지원
+"""
+
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('MessageSpool')
+
+# 레코드 헤더: payload 길이, CRC32, 저장 시각, QoS, 토픽 길이
+RECORD_HEADER = struct.Struct('<IIdBH')
+
+SEGMENT_SUFFIX = '.seg'
+CURSOR_FILE = 'cursor.json'
+
+
+class MessageSpool:
+    """디스크 기반 store-and-forward 메시지 스풀"""
+
+    EVICTION_POLICIES = ('drop_oldest', 'drop_newest')
+
+    def __init__(
+        self,
+        spool_dir: str,
+        max_bytes: int = 50 * 1024 * 1024,
+        segment_bytes: int = 1024 * 1024,
+        fsync_interval: float = 5.0,
+        fsync_batch: int = 100,
+        eviction: str = 'drop_oldest'
+    ):
+        """
+        Args:
+            spool_dir: 스풀 디렉토리
+            max_bytes: 스풀 전체 최대 크기 (바이트)
+            segment_bytes: 세그먼트 파일 최대 크기 (바이트)
+            fsync_interval: fsync 최대 간격 (초) - SD 카드 마모 방지를 위해 배치 처리
+            fsync_batch: 이 개수만큼 레코드가 쌓이면 간격과 무관하게 fsync
+            eviction: 용량 초과 시 정책
+                drop_oldest: 가장 오래된 세그먼트 삭제
+                drop_newest: 새 메시지 거부
+        """
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction} (choices: {self.EVICTION_POLICIES})")
+
+        self.spool_dir = Path(spool_dir)
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        self.eviction = eviction
+
+        self.lock = Lock()
+
+        self.segments: List[int] = []  # 세그먼트 ID (오래된 순)
+        self.segment_sizes: Dict[int, int] = {}
+        self.write_file = None
+        self.unsynced = 0
+        self.last_fsync = time.monotonic()
+
+        # 재전송 커서 (읽기 세그먼트, 오프셋)
+        self.read_segment = None
+        self.read_offset = 0
+        self.peeked = None  # (레코드, 다음 오프셋)
+
+        # 통계
+        self.stats = {
+            'spooled': 0,
+            'replayed': 0,
+            'evicted_segments': 0,
+            'rejected': 0,
+            'corrupt': 0,
+            'fsyncs': 0
+        }
+
+        self._open()
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.spool_dir / f"{segment_id:010d}{SEGMENT_SUFFIX}"
+
+    def _open(self):
+        """기존 세그먼트와 커서를 읽고 새 쓰기 세그먼트 생성"""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+        for path in sorted(self.spool_dir.glob(f"*{SEGMENT_SUFFIX}")):
+            segment_id = int(path.stem)
+            self.segments.append(segment_id)
+            self.segment_sizes[segment_id] = path.stat().st_size
+
+        cursor_path = self.spool_dir / CURSOR_FILE
+        if cursor_path.exists():
+            try:
+                cursor = json.loads(cursor_path.read_text())
+                if cursor['segment'] in self.segment_sizes:
+                    self.read_segment = cursor['segment']
+                    self.read_offset = cursor['offset']
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Invalid spool cursor, replaying from start: {e}")
+
+        if self.read_segment is None and self.segments:
+            self.read_segment = self.segments[0]
+            self.read_offset = 0
+
+        # 재시작 후에는 항상 새 세그먼트에 기록 (잘린 꼬리 레코드 위에 덧붙이지 않음)
+        self._rotate()
+
+        if self.pending_bytes() > 0:
+            logger.info(
+                f"Spool opened with {len(self.segments) - 1} segment(s), "
+                f"{self.pending_bytes()} bytes pending replay"
+            )
+
+    def _rotate(self):
+        """현재 쓰기 세그먼트를 닫고 새 세그먼트 생성"""
+        if self.write_file:
+            self._fsync()
+            self.write_file.close()
+
+        segment_id = (self.segments[-1] + 1) if self.segments else 1
+        self.write_file = open(self._segment_path(segment_id), 'ab')
+        self.segments.append(segment_id)
+        self.segment_sizes[segment_id] = 0
+
+        if self.read_segment is None:
+            self.read_segment = segment_id
+            self.read_offset = 0
+
+    def _fsync(self):
+        """버퍼를 디스크에 반영하고 커서 저장"""
+        if self.write_file and self.unsynced:
+            self.write_file.flush()
+            os.fsync(self.write_file.fileno())
+            self.stats['fsyncs'] += 1
+        self.unsynced = 0
+        self.last_fsync = time.monotonic()
+        self._save_cursor()
+
+    def _save_cursor(self):
+        """재전송 커서를 원자적으로 저장"""
+        cursor_path = self.spool_dir / CURSOR_FILE
+        temp_path = cursor_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps({'segment': self.read_segment, 'offset': self.read_offset}))
+        os.replace(temp_path, cursor_path)
+
+    def _maybe_fsync(self):
+        """fsync 배치 조건 확인"""
+        if (self.unsynced >= self.fsync_batch or
+                time.monotonic() - self.last_fsync >= self.fsync_interval):
+            self._fsync()
+
+    def total_bytes(self) -> int:
+        """디스크에 있는 세그먼트 전체 크기"""
+        return sum(self.segment_sizes.values())
+
+    def pending_bytes(self) -> int:
+        """아직 재전송하지 않은 바이트 수"""
+        if self.read_segment is None:
+            return 0
+        return sum(
+            size for segment_id, size in self.segment_sizes.items()
+            if segment_id >= self.read_segment
+        ) - self.read_offset
+
+    def has_pending(self) -> bool:
+        """재전송할 메시지 존재 여부"""
+        with self.lock:
+            return self.pending_bytes() > 0
+
+    def append(self, topic: str, payload: bytes, qos: int = 1) -> bool:
+        """
+        메시지 기록
+
+        Args:
+            topic: MQTT 토픽
+            payload: 인코딩된 페이로드
+            qos: QoS 레벨
+
+        Returns:
+            bool: 기록 여부 (drop_newest 정책으로 거부되면 False)
+        """
+        topic_bytes = topic.encode('utf-8')
+        crc = zlib.crc32(payload, zlib.crc32(topic_bytes))
+        record = RECORD_HEADER.pack(len(payload), crc, time.time(), qos, len(topic_bytes))
+        record += topic_bytes + payload
+
+        with self.lock:
+            if not self._make_room(len(record)):
+                self.stats['rejected'] += 1
+                return False
+
+            if self.segment_sizes[self.segments[-1]] + len(record) > self.segment_bytes:
+                self._rotate()
+
+            self.write_file.write(record)
+            self.write_file.flush()
+            self.segment_sizes[self.segments[-1]] += len(record)
+            self.stats['spooled'] += 1
+            self.unsynced += 1
+            self._maybe_fsync()
+
+        return True
+
+    def _make_room(self, record_size: int) -> bool:
+        """용량 상한 적용 (eviction 정책)"""
+        while self.total_bytes() + record_size > self.max_bytes:
+            if self.eviction == 'drop_newest' or len(self.segments) <= 1:
+                return False
+            self._evict_oldest()
+        return True
+
+    def _evict_oldest(self):
+        """가장 오래된 세그먼트 삭제 (읽는 중이면 다음 세그먼트로 커서 이동)"""
+        segment_id = self.segments.pop(0)
+        size = self.segment_sizes.pop(segment_id)
+
+        # 아직 재전송하지 않은 메시지 수는 알 수 없으므로 세그먼트 단위로 기록
+        if self.read_segment is not None and segment_id >= self.read_segment:
+            self.stats['evicted_segments'] += 1
+            logger.warning(f"Spool full, evicted segment {segment_id} ({size} bytes)")
+
+        if self.read_segment == segment_id:
+            self.read_segment = self.segments[0]
+            self.read_offset = 0
+            self.peeked = None
+
+        self._segment_path(segment_id).unlink(missing_ok=True)
+
+    def peek(self) -> Optional[Dict]:
+        """
+        다음 재전송 메시지 조회 (커서는 advance()에서 이동)
+
+        Returns:
+            {'topic', 'payload', 'qos', 'spooled_at'} 또는 None
+        """
+        with self.lock:
+            if self.peeked is None:
+                self.peeked = self._read_next()
+            return self.peeked[0] if self.peeked else None
+
+    def advance(self):
+        """peek()한 메시지를 전송 완료로 표시"""
+        with self.lock:
+            if self.peeked is None:
+                return
+            _, (segment_id, offset) = self.peeked
+            self.read_segment = segment_id
+            self.read_offset = offset
+            self.peeked = None
+            self.stats['replayed'] += 1
+            self._release_consumed()
+            self._maybe_fsync()
+
+    def _read_next(self):
+        """커서 위치의 레코드 읽기 (세그먼트 끝이면 다음 세그먼트로)"""
+        while self.read_segment is not None:
+            segment_id = self.read_segment
+            size = self.segment_sizes.get(segment_id, 0)
+
+            if self.read_offset < size:
+                if segment_id == self.segments[-1]:
+                    self.write_file.flush()
+
+                with open(self._segment_path(segment_id), 'rb') as f:
+                    f.seek(self.read_offset)
+                    header = f.read(RECORD_HEADER.size)
+                    if len(header) == RECORD_HEADER.size:
+                        length, crc, spooled_at, qos, topic_len = RECORD_HEADER.unpack(header)
+                        body = f.read(topic_len + length)
+                        if len(body) == topic_len + length:
+                            topic_bytes, payload = body[:topic_len], body[topic_len:]
+                            if zlib.crc32(payload, zlib.crc32(topic_bytes)) == crc:
+                                next_offset = self.read_offset + RECORD_HEADER.size + len(body)
+                                record = {
+                                    'topic': topic_bytes.decode('utf-8'),
+                                    'payload': payload,
+                                    'qos': qos,
+                                    'spooled_at': spooled_at
+                                }
+                                return record, (segment_id, next_offset)
+
+                # 잘렸거나 손상된 레코드 - 세그먼트 나머지 폐기
+                logger.warning(f"Corrupt spool record in segment {segment_id} at {self.read_offset}")
+                self.stats['corrupt'] += 1
+                self.read_offset = size
+
+            # 세그먼트 끝 - 쓰기 중인 세그먼트면 대기
+            if segment_id == self.segments[-1]:
+                return None
+
+            next_index = self.segments.index(segment_id) + 1
+            self.read_segment = self.segments[next_index]
+            self.read_offset = 0
+            self._release_consumed()
+
+        return None
+
+    def _release_consumed(self):
+        """재전송이 끝난 세그먼트 파일 삭제"""
+        while self.segments[0] != self.read_segment and self.segments[0] != self.segments[-1]:
+            segment_id = self.segments.pop(0)
+            self.segment_sizes.pop(segment_id)
+            self._segment_path(segment_id).unlink(missing_ok=True)
+
+    def close(self):
+        """스풀 닫기 (남은 데이터 fsync)"""
+        with self.lock:
+            if self.write_file:
+                self._fsync()
+                self.write_file.close()
+                self.write_file = None
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        with self.lock:
+            stats = self.stats.copy()
+            stats['pending_bytes'] = self.pending_bytes()
+            stats['disk_bytes'] = self.total_bytes()
+            stats['segments'] = len(self.segments)
+        return stats
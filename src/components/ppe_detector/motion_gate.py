@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Motion Gate
+축소 그레이스케일 프레임 차분으로 움직임이 없는 프레임의 추론을 건너뛰는 모듈
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger('MotionGate')
+
+
+class MotionGate:
+    """프레임 차분 기반 추론 게이트"""
+
+    def __init__(
+        self,
+        downscale_width: int = 160,
+        pixel_threshold: int = 25,
+        motion_ratio: float = 0.002,
+        max_skip_seconds: float = 10.0
+    ):
+        """
+        Args:
+            downscale_width: 비교용 축소 프레임 너비 (높이는 비율 유지)
+            pixel_threshold: 픽셀 밝기 차이가 이 값보다 크면 변화로 판단 (0-255)
+            motion_ratio: 변화 픽셀 비율이 이 값 이상이면 움직임으로 판단
+            max_skip_seconds: 움직임이 없어도 이 시간이 지나면 추론 실행
+        """
+        self.downscale_width = downscale_width
+        self.pixel_threshold = pixel_threshold
+        self.motion_ratio = motion_ratio
+        self.max_skip_seconds = max_skip_seconds
+
+        # 해상도별로 재사용하는 버퍼
+        self._size: Optional[tuple] = None
+        self._small = None
+        self._gray = None
+        self._diff = None
+        self._reference = None  # 마지막으로 추론한 프레임
+        self.last_inference = None  # time.monotonic() 기준
+
+        # 통계
+        self.stats = {
+            'frames': 0,
+            'inferred': 0,
+            'skipped': 0,
+            'forced': 0,
+            'last_score': 0.0
+        }
+
+    def _prepare(self, frame: np.ndarray):
+        """입력 해상도에 맞춰 축소 버퍼 할당 (해상도가 바뀌면 기준 프레임 초기화)"""
+        h, w = frame.shape[:2]
+        width = min(self.downscale_width, w)
+        size = (width, max(1, round(h * width / w)))
+
+        if size != self._size:
+            self._size = size
+            self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._gray = np.empty((size[1], size[0]), dtype=np.uint8)
+            self._diff = np.empty((size[1], size[0]), dtype=np.uint8)
+            self._reference = None
+
+    def score(self, frame: np.ndarray) -> float:
+        """
+        기준 프레임 대비 변화 픽셀 비율 계산 (self._gray에 현재 축소 프레임 저장)
+
+        Returns:
+            float: 변화 픽셀 비율 (기준 프레임이 없으면 1.0)
+        """
+        self._prepare(frame)
+        cv2.resize(frame, self._size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        # 센서 노이즈 억제
+        cv2.GaussianBlur(self._gray, (5, 5), 0, dst=self._gray)
+
+        if self._reference is None:
+            return 1.0
+
+        cv2.absdiff(self._gray, self._reference, dst=self._diff)
+        cv2.threshold(self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+        return cv2.countNonZero(self._diff) / self._diff.size
+
+    def check(self, frame: np.ndarray) -> bool:
+        """
+        프레임 추론 여부 판단
+
+        기준 프레임은 마지막으로 추론한 프레임이므로 천천히 누적되는 변화도
+        감지된다. 추론하기로 한 경우 현재 프레임을 새 기준으로 저장한다.
+
+        Args:
+            frame: BGR 프레임
+
+        Returns:
+            bool: True면 추론 실행, False면 이전 결과 재사용
+        """
+        now = time.monotonic()
+        score = self.score(frame)
+
+        self.stats['frames'] += 1
+        self.stats['last_score'] = score
+
+        moved = score >= self.motion_ratio
+        expired = self.last_inference is None or now - self.last_inference >= self.max_skip_seconds
+
+        if not moved and not expired:
+            self.stats['skipped'] += 1
+            return False
+
+        if not moved:
+            self.stats['forced'] += 1
+
+        self.stats['inferred'] += 1
+        self.last_inference = now
+
+        if self._reference is None:
+            self._reference = self._gray.copy()
+        else:
+            np.copyto(self._reference, self._gray)
+
+        return True
+
+    def get_stats(self) -> Dict:
+        """통계 반환 (추론 건너뛴 비율 포함)"""
+        stats = self.stats.copy()
+        stats['last_score'] = round(stats['last_score'], 4)
+        stats['skip_rate'] = round(stats['skipped'] / stats['frames'], 3) if stats['frames'] else 0.0
+        return stats
@@ -5,13 +5,18 @@ AWS IoT Core로 메시지를 발행하는 모듈
 Greengrass IPC와 직접 MQTT 연결 모두 지원
 """
 
+import itertools
 import json
 import logging
 import os
 import time
-from threading import Lock
+from collections import deque
+from threading import Lock, Condition, Event, Thread
 from typing import Dict, Any, Optional
 
+from message_spool import MessageSpool
+from rate_limiter import RateLimiter
+
 logger = logging.getLogger('MQTTPublisher')
 
 # Greengrass IPC 클라이언트
@@ -41,6 +46,62 @@ try:
 except ImportError:
     logger.warning("AWS IoT SDK not available")
 
+# 발행 우선순위 (앞쪽이 높음)
+PRIORITY_ALERT = 'alert'
+PRIORITY_STATUS = 'status'
+PRIORITY_DETECTION = 'detection'
+PRIORITIES = (PRIORITY_ALERT, PRIORITY_STATUS, PRIORITY_DETECTION)
+
+# 우선순위별 기본 큐 설정
+DEFAULT_LANES = {
+    PRIORITY_ALERT: {'queue_size': 500, 'drop_policy': 'drop_newest'},
+    PRIORITY_STATUS: {'queue_size': 10, 'drop_policy': 'drop_oldest'},
+    PRIORITY_DETECTION: {'queue_size': 1000, 'drop_policy': 'drop_oldest'},
+}
+
+
+class PriorityLane:
+    """우선순위별 송신 큐 (크기 상한과 drop 정책을 개별 적용)"""
+
+    DROP_POLICIES = ('drop_oldest', 'drop_newest')
+
+    def __init__(self, name: str, queue_size: int, drop_policy: str = 'drop_oldest'):
+        """
+        Args:
+            name: 우선순위 이름
+            queue_size: 최대 메시지 수
+            drop_policy: 가득 찼을 때 정책
+                drop_oldest: 가장 오래된 메시지 제거 후 추가
+                drop_newest: 새 메시지 거부
+        """
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy} (choices: {self.DROP_POLICIES})")
+
+        self.name = name
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.queue = deque()
+        self.dropped = 0
+
+    def put(self, message: Dict) -> bool:
+        """메시지 추가 (거부되면 False)"""
+        if len(self.queue) >= self.queue_size:
+            self.dropped += 1
+            if self.drop_policy == 'drop_newest':
+                return False
+            self.queue.popleft()
+
+        self.queue.append(message)
+        return True
+
+    def coalesce(self, message: Dict) -> bool:
+        """같은 토픽의 가장 최근 대기 메시지를 새 메시지로 교체 (교체했으면 True)"""
+        for i in range(len(self.queue) - 1, -1, -1):
+            if self.queue[i]['topic'] == message['topic']:
+                self.queue[i] = message
+                return True
+        return False
+
 
 class MQTTPublisher:
     """MQTT 메시지 퍼블리셔"""
@@ -54,7 +115,27 @@ class MQTTPublisher:
         cert_path: str = None,
         key_path: str = None,
         ca_path: str = None,
-        client_id: str = None
+        client_id: str = None,
+        # 비동기 발행 옵션
+        async_mode: bool = False,
+        max_in_flight: int = 8,
+        queue_size: int = 1000,
+        publish_timeout: float = 10.0,
+        lanes: Dict[str, Dict] = None,
+        reserved_alert_slots: int = 1,
+        # 디스크 스풀 옵션 (업링크 장애 시 store-and-forward)
+        spool_dir: str = None,
+        spool_max_bytes: int = 50 * 1024 * 1024,
+        spool_segment_bytes: int = 1024 * 1024,
+        spool_fsync_interval: float = 5.0,
+        spool_eviction: str = 'drop_oldest',
+        replay_rate: float = 5.0,
+        replay_probe_interval: float = 5.0,
+        # 발행 속도 제한 옵션
+        rate_limit: float = 0.0,
+        rate_burst: float = None,
+        topic_rate_limits: Dict[str, Dict] = None,
+        latency_target: float = 2.0
     ):
         """
         Args:
@@ -65,19 +146,92 @@ class MQTTPublisher:
             key_path: 프라이빗 키 경로 (직접 연결용)
             ca_path: CA 인증서 경로 (직접 연결용)
             client_id: MQTT 클라이언트 ID (직접 연결용)
+            async_mode: 비동기 발행 (publish()는 큐에 넣고 즉시 반환)
+            max_in_flight: 비동기 모드에서 동시에 진행 중인 최대 발행 수
+            queue_size: 비동기 detection 큐 크기 (가득 차면 오래된 메시지 제거)
+            publish_timeout: 발행 완료 대기 시간 (초)
+            lanes: 우선순위별 큐 설정 덮어쓰기
+                {'alert': {'queue_size': 500, 'drop_policy': 'drop_newest'}, ...}
+            reserved_alert_slots: alert 전용으로 남겨 둘 in-flight 슬롯 수
+            spool_dir: 발행 실패 메시지를 보관할 스풀 디렉토리 (None이면 사용 안 함)
+            spool_max_bytes: 스풀 최대 크기 (바이트)
+            spool_segment_bytes: 스풀 세그먼트 파일 크기 (바이트)
+            spool_fsync_interval: 스풀 fsync 간격 (초)
+            spool_eviction: 스풀 용량 초과 정책 (drop_oldest, drop_newest)
+            replay_rate: 업링크 복구 후 스풀 재전송 속도 (메시지/초)
+            replay_probe_interval: 업링크 장애 중 재전송 재시도 간격 (초)
+            rate_limit: 전체 발행 속도 상한 (메시지/초, 0이면 제한 없음)
+            rate_burst: 전체 버스트 크기 (None이면 rate_limit * 2)
+            topic_rate_limits: 토픽별 제한 {토픽: {'rate', 'burst', 'overflow'}}
+                overflow: queue (대기), coalesce (최신 메시지로 교체), drop (폐기)
+            latency_target: 목표 발행 지연 (초). 넘으면 발행 속도 자동 감속
         """
         self.thing_name = thing_name or os.environ.get('AWS_IOT_THING_NAME', 'unknown')
         self.use_greengrass_ipc = use_greengrass_ipc and GREENGRASS_IPC_AVAILABLE
 
         self.lock = Lock()
+        self.stats_lock = Lock()
         self.ipc_client = None
         self.mqtt_connection = None
 
+        # 비동기 송신 큐 및 in-flight 윈도우
+        self.async_mode = async_mode
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.publish_timeout = publish_timeout
+        self.queue_cond = Condition()
+        self.lanes = {}  # 우선순위 순서 유지
+        for name in PRIORITIES:
+            lane_config = dict(DEFAULT_LANES[name])
+            if name == PRIORITY_DETECTION:
+                lane_config['queue_size'] = queue_size
+            lane_config.update((lanes or {}).get(name, {}))
+            self.lanes[name] = PriorityLane(name, **lane_config)
+        # alert 외 메시지가 사용할 수 있는 in-flight 슬롯 수
+        self.bulk_window = max(1, max_in_flight - reserved_alert_slots)
+        self.in_flight = {}  # 작업 ID -> (시작 시간, 메시지)
+        self.op_ids = itertools.count(1)
+        self.running = Event()
+        self.sender_thread = None
+
+        # 디스크 스풀 및 재전송
+        self.spool = None
+        self.replay_rate = replay_rate
+        self.replay_probe_interval = replay_probe_interval
+        self.replay_thread = None
+        self.replay_wakeup = Event()
+        self.link_up = True  # 마지막 발행 결과 기준 업링크 상태
+        if spool_dir:
+            try:
+                self.spool = MessageSpool(
+                    spool_dir,
+                    max_bytes=spool_max_bytes,
+                    segment_bytes=spool_segment_bytes,
+                    fsync_interval=spool_fsync_interval,
+                    eviction=spool_eviction
+                )
+            except OSError as e:
+                logger.error(f"Failed to open message spool {spool_dir}: {e}")
+
+        # 발행 속도 제한 (토큰 버킷 + 지연 기반 적응형 감속)
+        self.rate_limiter = None
+        if rate_limit > 0 or topic_rate_limits:
+            self.rate_limiter = RateLimiter(
+                global_rate=rate_limit,
+                global_burst=rate_burst,
+                topic_limits=topic_rate_limits,
+                latency_target=latency_target
+            )
+
         # 통계
         self.stats = {
             'messages_published': 0,
             'messages_failed': 0,
-            'bytes_sent': 0
+            'bytes_sent': 0,
+            'queue_dropped': 0,
+            'timeouts': 0,
+            'messages_spooled': 0,
+            'messages_replayed': 0
         }
 
         # Greengrass IPC 또는 직접 MQTT 연결 초기화
@@ -88,6 +242,12 @@ class MQTTPublisher:
         else:
             logger.warning("No MQTT backend available. Messages will be logged only.")
 
+        if self.async_mode:
+            self._start_sender()
+
+        if self.spool:
+            self._start_replay()
+
     def _init_greengrass_ipc(self):
         """Greengrass IPC 클라이언트 초기화"""
         try:
@@ -144,90 +304,376 @@ class MQTTPublisher:
         self,
         topic: str,
         payload: Dict[str, Any],
-        qos: int = 1
+        qos: int = 1,
+        priority: str = PRIORITY_STATUS,
+        codec=None
     ) -> bool:
         """
         메시지 발행
 
+        비동기 모드에서는 우선순위 큐에 넣고 즉시 반환하며, 실제 결과는
+        송신 스레드가 완료 콜백으로 통계에 반영한다. 송신 스레드는 항상
+        높은 우선순위 큐부터 꺼내므로 alert는 쌓인 detection을 기다리지 않는다.
+
         Args:
             topic: MQTT 토픽
             payload: 메시지 페이로드 (딕셔너리)
             qos: QoS 레벨 (0, 1)
+            priority: 우선순위 (alert, status, detection)
+            codec: 페이로드 인코더 (PayloadCodec). 지정하면 인코딩 태그를
+                토픽 접미사로 붙임. None이면 JSON
 
         Returns:
-            bool: 발행 성공 여부
+            bool: 발행 성공 여부 (비동기 모드에서는 큐 등록 여부)
         """
         try:
-            # 페이로드를 JSON 문자열로 변환
-            message_json = json.dumps(payload, ensure_ascii=False)
-            message_bytes = message_json.encode('utf-8')
+            if codec is not None:
+                # 압축 인코딩 (토픽에 인코딩 표시)
+                message_bytes = codec.encode(payload)
+                topic = codec.topic(topic)
+            else:
+                # 페이로드를 JSON 문자열로 변환
+                message_json = json.dumps(payload, ensure_ascii=False)
+                message_bytes = message_json.encode('utf-8')
+
+        except Exception as e:
+            logger.error(f"Publish error: {e}")
+            with self.stats_lock:
+                self.stats['messages_failed'] += 1
+            return False
+
+        message = {'topic': topic, 'payload': message_bytes, 'qos': qos, 'priority': priority}
+
+        if self.async_mode:
+            return self._enqueue(message)
+
+        if self.rate_limiter and not self._acquire_sync(topic):
+            return False
 
+        started = time.monotonic()
+        try:
             with self.lock:
-                if self.use_greengrass_ipc and self.ipc_client:
-                    success = self._publish_via_ipc(topic, message_json, qos)
-                elif self.mqtt_connection:
-                    success = self._publish_via_direct(topic, message_json, qos)
-                else:
-                    # 백엔드 없음 - 로그만 출력
-                    logger.info(f"[DRY RUN] Topic: {topic}, Payload: {message_json[:200]}...")
-                    success = True
+                future = self._start_publish(topic, message_bytes, qos)
+            if future is not None:
+                future.result(timeout=self.publish_timeout)
+
+            self._record_result(message, True, time.monotonic() - started)
+            return True
+
+        except Exception as e:
+            logger.error(f"Publish error: {e}")
+            self._record_result(message, False, time.monotonic() - started)
+            return False
+
+    def _acquire_sync(self, topic: str) -> bool:
+        """동기 발행 속도 제한 (queue 정책이면 토큰 대기, 그 외에는 폐기)"""
+        if self.rate_limiter.try_acquire(topic):
+            return True
+
+        policy = self.rate_limiter.overflow_policy(topic)
+        if policy != 'queue':
+            # 동기 모드에서는 교체할 대기 메시지가 없으므로 폐기
+            self.rate_limiter.record_overflow('drop')
+            return False
+
+        self.rate_limiter.record_overflow('queue')
+        return self.rate_limiter.acquire(topic, timeout=self.publish_timeout)
+
+    def _start_publish(self, topic: str, message: bytes, qos: int):
+        """
+        발행 시작 (완료를 기다리지 않음)
+
+        Returns:
+            완료 future 또는 None (백엔드 없음 - 로그만 출력)
+        """
+        if self.use_greengrass_ipc and self.ipc_client:
+            return self._publish_via_ipc(topic, message, qos)
+        elif self.mqtt_connection:
+            return self._publish_via_direct(topic, message, qos)
+
+        # 백엔드 없음 - 로그만 출력
+        logger.info(f"[DRY RUN] Topic: {topic}, Payload: {message[:200].decode('utf-8', 'replace')}...")
+        return None
+
+    def _publish_via_ipc(self, topic: str, message: bytes, qos: int):
+        """Greengrass IPC를 통한 발행 (응답 future 반환)"""
+        # IoT Core로 발행
+        request = PublishToIoTCoreRequest(
+            topic_name=topic,
+            qos=QOS.AT_LEAST_ONCE if qos >= 1 else QOS.AT_MOST_ONCE,
+            payload=message
+        )
 
+        operation = self.ipc_client.new_publish_to_iot_core()
+        operation.activate(request)
+        return operation.get_response()
+
+    def _publish_via_direct(self, topic: str, message: bytes, qos: int):
+        """직접 MQTT 연결을 통한 발행 (완료 future 반환)"""
+        # QoS 매핑
+        mqtt_qos = mqtt.QoS.AT_LEAST_ONCE if qos >= 1 else mqtt.QoS.AT_MOST_ONCE
+
+        # 발행
+        publish_future, packet_id = self.mqtt_connection.publish(
+            topic=topic,
+            payload=message,
+            qos=mqtt_qos
+        )
+
+        return publish_future
+
+    def _record_result(self, message: Dict, success: bool, latency: float = None):
+        """발행 결과를 통계에 반영 (실패 시 스풀에 보관)"""
+        self.link_up = success
+
+        if self.rate_limiter and latency is not None:
+            self.rate_limiter.record_latency(latency, success)
+
+        with self.stats_lock:
             if success:
                 self.stats['messages_published'] += 1
-                self.stats['bytes_sent'] += len(message_bytes)
-                logger.debug(f"Published to {topic}: {len(message_bytes)} bytes")
+                self.stats['bytes_sent'] += len(message['payload'])
             else:
                 self.stats['messages_failed'] += 1
 
-            return success
+        if success:
+            logger.debug(f"Published to {message['topic']}: {len(message['payload'])} bytes")
+            return
 
-        except Exception as e:
-            logger.error(f"Publish error: {e}")
-            self.stats['messages_failed'] += 1
-            return False
+        # 업링크 장애 - 스풀에 보관 후 복구 시 재전송
+        if self.spool and self.spool.append(message['topic'], message['payload'], message['qos']):
+            with self.stats_lock:
+                self.stats['messages_spooled'] += 1
+            self.replay_wakeup.set()
+
+    def _start_sender(self):
+        """비동기 송신 스레드 시작"""
+        self.running.set()
+        self.sender_thread = Thread(target=self._sender_loop, name='mqtt-sender', daemon=True)
+        self.sender_thread.start()
+        logger.info(
+            f"Async sender started (max_in_flight={self.max_in_flight}, lanes="
+            + ', '.join(f"{l.name}:{l.queue_size}/{l.drop_policy}" for l in self.lanes.values())
+            + ")"
+        )
 
-    def _publish_via_ipc(self, topic: str, message: str, qos: int) -> bool:
-        """Greengrass IPC를 통한 발행"""
-        try:
-            # IoT Core로 발행
-            request = PublishToIoTCoreRequest(
-                topic_name=topic,
-                qos=QOS.AT_LEAST_ONCE if qos >= 1 else QOS.AT_MOST_ONCE,
-                payload=message.encode('utf-8')
-            )
+    def _enqueue(self, message: Dict) -> bool:
+        """우선순위 큐에 메시지 추가 (가득 찼을 때는 큐별 drop 정책 적용)"""
+        lane = self.lanes.get(message['priority'], self.lanes[PRIORITY_DETECTION])
+
+        # 속도 초과 시 토픽별 정책 적용
+        if self.rate_limiter and self.rate_limiter.is_limited(message['topic']):
+            policy = self.rate_limiter.overflow_policy(message['topic'])
+            if policy == 'drop':
+                self.rate_limiter.record_overflow(policy)
+                return False
+            if policy == 'coalesce':
+                with self.queue_cond:
+                    coalesced = lane.coalesce(message)
+                if coalesced:
+                    self.rate_limiter.record_overflow(policy)
+                    return True
+
+        with self.queue_cond:
+            dropped = lane.dropped
+            accepted = lane.put(message)
+            dropped = lane.dropped - dropped
+            if accepted:
+                self.queue_cond.notify()
+
+        if dropped:
+            with self.stats_lock:
+                self.stats['queue_dropped'] += dropped
+
+        return accepted
+
+    def dropped_count(self, priority: str) -> int:
+        """우선순위 큐가 drop 정책으로 버린 메시지 수"""
+        with self.queue_cond:
+            return self.lanes[priority].dropped
+
+    def _queued_count(self) -> int:
+        """모든 우선순위 큐의 대기 메시지 수"""
+        return sum(len(lane.queue) for lane in self.lanes.values())
+
+    def _next_message(self):
+        """
+        송신할 메시지 선택 (queue_cond 보유 상태에서 호출)
 
-            operation = self.ipc_client.new_publish_to_iot_core()
-            operation.activate(request)
-            future_response = operation.get_response()
-            future_response.result(timeout=10)
+        가장 높은 우선순위 큐부터 확인하며, alert 외 메시지는 예약 슬롯을
+        제외한 in-flight 윈도우 안에서만 송신한다. 속도 제한에 걸린 큐는
+        건너뛰고 다음 우선순위 큐를 확인한다.
 
-            return True
+        Returns:
+            (메시지 또는 None, 다음 토큰까지 대기 시간 또는 None)
+        """
+        in_flight = len(self.in_flight)
+        wait = None
+        for lane in self.lanes.values():
+            if not lane.queue:
+                continue
+            window = self.max_in_flight if lane.name == PRIORITY_ALERT else self.bulk_window
+            if in_flight >= window:
+                continue
+
+            message = lane.queue[0]
+            if self.rate_limiter and not self.rate_limiter.try_acquire(message['topic']):
+                if not message.get('throttled'):
+                    message['throttled'] = True
+                    self.rate_limiter.record_overflow('queue')
+                delay = self.rate_limiter.wait_time(message['topic'])
+                wait = delay if wait is None else min(wait, delay)
+                continue
+
+            return lane.queue.popleft(), None
+        return None, wait
+
+    def _sender_loop(self):
+        """송신 루프 - in-flight 윈도우 내에서 우선순위 순으로 발행"""
+        while self.running.is_set():
+            with self.queue_cond:
+                message, wait = self._next_message()
+                if message is None:
+                    # 새 메시지, in-flight 완료 또는 속도 제한 토큰 대기
+                    self.queue_cond.wait(min(0.5, wait) if wait else 0.5)
+
+            if message is None:
+                self._expire_in_flight()
+                continue
+
+            self._dispatch(message)
+
+    def _dispatch(self, message: Dict):
+        """메시지 발행 시작 및 완료 콜백 등록"""
+        op_id = next(self.op_ids)
+        with self.stats_lock:
+            self.in_flight[op_id] = (time.monotonic(), message)
 
+        try:
+            with self.lock:
+                future = self._start_publish(message['topic'], message['payload'], message['qos'])
         except Exception as e:
-            logger.error(f"IPC publish error: {e}")
-            return False
+            logger.error(f"Async publish error: {e}")
+            self._complete(op_id, False)
+            return
 
-    def _publish_via_direct(self, topic: str, message: str, qos: int) -> bool:
-        """직접 MQTT 연결을 통한 발행"""
+        if future is None:
+            self._complete(op_id, True)
+            return
+
+        future.add_done_callback(lambda f, op_id=op_id: self._on_done(op_id, f))
+
+    def _on_done(self, op_id: int, future):
+        """발행 완료 콜백 (IPC/MQTT 스레드에서 호출)"""
         try:
-            # QoS 매핑
-            mqtt_qos = mqtt.QoS.AT_LEAST_ONCE if qos >= 1 else mqtt.QoS.AT_MOST_ONCE
+            error = future.exception()
+        except BaseException as e:  # 취소된 future
+            error = e
 
-            # 발행
-            publish_future, packet_id = self.mqtt_connection.publish(
-                topic=topic,
-                payload=message,
-                qos=mqtt_qos
-            )
+        if error is not None:
+            logger.error(f"Async publish error: {error}")
 
-            # 결과 대기
-            publish_future.result(timeout=10)
+        self._complete(op_id, error is None)
 
-            return True
+    def _complete(self, op_id: int, success: bool):
+        """in-flight 작업 완료 처리 (타임아웃으로 이미 처리된 작업은 무시)"""
+        with self.stats_lock:
+            entry = self.in_flight.pop(op_id, None)
 
-        except Exception as e:
-            logger.error(f"Direct MQTT publish error: {e}")
-            return False
+        if entry is None:
+            return
+
+        # in-flight 슬롯 반환 - 송신 스레드 깨우기
+        with self.queue_cond:
+            self.queue_cond.notify()
+        self._record_result(entry[1], success, time.monotonic() - entry[0])
+
+    def _expire_in_flight(self):
+        """publish_timeout을 넘긴 in-flight 작업을 실패로 처리"""
+        deadline = time.monotonic() - self.publish_timeout
+        with self.stats_lock:
+            expired = [op_id for op_id, (started, _) in self.in_flight.items() if started < deadline]
+
+        for op_id in expired:
+            with self.stats_lock:
+                self.stats['timeouts'] += 1
+            logger.warning(f"Publish timed out after {self.publish_timeout}s")
+            self._complete(op_id, False)
+
+    def _start_replay(self):
+        """스풀 재전송 스레드 시작"""
+        self.running.set()
+        self.replay_thread = Thread(target=self._replay_loop, name='mqtt-replay', daemon=True)
+        self.replay_thread.start()
+        logger.info(f"Spool replay started ({self.replay_rate} msg/s)")
+
+    def _replay_loop(self):
+        """
+        스풀 재전송 루프
+
+        업링크가 살아 있으면 스풀 메시지를 저장 순서대로 replay_rate 속도로
+        재전송한다. 장애 중에는 replay_probe_interval마다 한 건씩 시도하여
+        복구를 감지한다. 새 메시지는 스풀을 거치지 않고 바로 발행된다.
+        """
+        interval = 1.0 / self.replay_rate if self.replay_rate > 0 else 0
+        last_attempt = 0.0
+
+        while self.running.is_set():
+            record = self.spool.peek()
+            if record is None:
+                self.replay_wakeup.wait(1.0)
+                self.replay_wakeup.clear()
+                continue
+
+            if not self.link_up and time.monotonic() - last_attempt < self.replay_probe_interval:
+                self.replay_wakeup.wait(0.5)
+                self.replay_wakeup.clear()
+                continue
+
+            # 재전송도 전체 발행 속도 제한에 포함
+            if self.rate_limiter and not self.rate_limiter.try_acquire(record['topic']):
+                time.sleep(min(1.0, self.rate_limiter.wait_time(record['topic'])))
+                continue
+
+            last_attempt = time.monotonic()
+            try:
+                # 완료 대기는 lock 밖에서 (장애 중 probe가 송신 스레드/알림 발행을 막지 않도록)
+                with self.lock:
+                    future = self._start_publish(record['topic'], record['payload'], record['qos'])
+                if future is not None:
+                    future.result(timeout=self.publish_timeout)
+            except Exception as e:
+                logger.warning(f"Spool replay failed, uplink still down: {e}")
+                self.link_up = False
+                continue
+
+            self.spool.advance()
+            self.link_up = True
+            with self.stats_lock:
+                self.stats['messages_replayed'] += 1
+                self.stats['bytes_sent'] += len(record['payload'])
+
+            if interval:
+                time.sleep(interval)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        송신 큐와 in-flight 작업이 비워질 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 모두 완료되었는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.stats_lock:
+                pending = self._queued_count() + len(self.in_flight)
+            if pending == 0:
+                return True
+            time.sleep(0.05)
+        return False
 
     def publish_local(
         self,
@@ -274,8 +720,27 @@ class MQTTPublisher:
             return False
 
     def disconnect(self):
-        """연결 종료"""
+        """연결 종료 (비동기 모드에서는 남은 메시지 송신 후 종료)"""
         try:
+            if self.async_mode and self.sender_thread:
+                if not self.flush(timeout=self.publish_timeout):
+                    logger.warning(f"Disconnecting with {self._queued_count()} queued messages")
+
+            self.running.clear()
+            self.replay_wakeup.set()
+            for thread in (self.sender_thread, self.replay_thread):
+                if thread and thread.is_alive():
+                    thread.join(timeout=2)
+
+            if self.spool:
+                # 송신하지 못한 큐 메시지는 다음 실행 시 재전송
+                with self.queue_cond:
+                    for lane in self.lanes.values():
+                        while lane.queue:
+                            message = lane.queue.popleft()
+                            self.spool.append(message['topic'], message['payload'], message['qos'])
+                self.spool.close()
+
             if self.mqtt_connection:
                 disconnect_future = self.mqtt_connection.disconnect()
                 disconnect_future.result(timeout=10)
@@ -286,7 +751,20 @@ class MQTTPublisher:
 
     def get_stats(self) -> Dict:
         """통계 반환"""
-        return self.stats.copy()
+        with self.stats_lock:
+            stats = self.stats.copy()
+            if self.async_mode:
+                stats['queued'] = self._queued_count()
+                stats['in_flight'] = len(self.in_flight)
+                stats['lanes'] = {
+                    lane.name: {'queued': len(lane.queue), 'dropped': lane.dropped}
+                    for lane in self.lanes.values()
+                }
+        if getattr(self, 'spool', None):
+            stats['spool'] = self.spool.get_stats()
+        if getattr(self, 'rate_limiter', None):
+            stats['rate_limiter'] = self.rate_limiter.get_stats()
+        return stats
 
 
 class MockMQTTPublisher(MQTTPublisher):
@@ -299,14 +777,24 @@ class MockMQTTPublisher(MQTTPublisher):
             'messages_failed': 0,
             'bytes_sent': 0
         }
+        self.stats_lock = Lock()
+        self.async_mode = False
         self.thing_name = kwargs.get('thing_name', 'test-device')
 
-    def publish(self, topic: str, payload: Dict[str, Any], qos: int = 1) -> bool:
+    def publish(
+        self,
+        topic: str,
+        payload: Dict[str, Any],
+        qos: int = 1,
+        priority: str = PRIORITY_STATUS,
+        codec=None
+    ) -> bool:
         """메시지를 리스트에 저장"""
         message = {
             'topic': topic,
             'payload': payload,
             'qos': qos,
+            'priority': priority,
             'timestamp': time.time()
         }
         self.published_messages.append(message)
@@ -336,6 +824,10 @@ if __name__ == "__main__":
                         help='Test message')
     parser.add_argument('--mock', action='store_true',
                         help='Use mock publisher')
+    parser.add_argument('--async-mode', action='store_true',
+                        help='Use non-blocking publisher with background sender')
+    parser.add_argument('--spool-dir', type=str, default=None,
+                        help='Spool failed messages to this directory for replay')
     args = parser.parse_args()
 
     # 퍼블리셔 생성
@@ -344,7 +836,9 @@ if __name__ == "__main__":
     else:
         publisher = MQTTPublisher(
             thing_name='RaspberryPi5-PPE',
-            use_greengrass_ipc=True
+            use_greengrass_ipc=True,
+            async_mode=args.async_mode,
+            spool_dir=args.spool_dir
         )
 
     # 테스트 메시지 발행
@@ -355,6 +849,8 @@ if __name__ == "__main__":
     }
 
     success = publisher.publish(args.topic, test_payload)
+    if args.async_mode and not args.mock:
+        publisher.flush()
     print(f"Publish result: {'Success' if success else 'Failed'}")
     print(f"Stats: {publisher.get_stats()}")
 
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Payload Codec
+감지 결과 MQTT 페이로드 압축 인코딩 모듈
+열 기반(columnar) 짧은 키 JSON, CBOR/MessagePack 바이너리, zlib 압축 지원
+인코딩은 토픽 접미사로 표시 (예: ppe/detections/cbor-z)
+"""
+
+import json
+import logging
+import math
+import struct
+import time
+import zlib
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger('PayloadCodec')
+
+# MessagePack (선택)
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    logger.debug("msgpack not available")
+
+# 긴 키 -> 짧은 키
+SHORT_KEYS = {
+    'timestamp': 'ts',
+    'thing_name': 'tn',
+    'detections': 'd',
+    'count': 'n',
+    'class': 'c',
+    'class_id': 'ci',
+    'confidence': 'p',
+    'bbox': 'b',
+    'batch': 'bt',
+    'window_start': 'ws',
+    'window_end': 'we',
+    'frame_count': 'fc',
+    'frames': 'f',
+    'truncated_from': 'tf',
+    'keyframe': 'kf',
+    'seq': 'sq',
+    'added': 'a',
+    'removed': 'r',
+    'moved': 'm',
+    'track_id': 'tid',
+    'predicted': 'pr',
+}
+LONG_KEYS = {v: k for k, v in SHORT_KEYS.items()}
+
+# 열 기반 표현에서 confidence 열은 천분율 정수로 저장 (소수점 3자리까지 무손실)
+CONFIDENCE_SCALE = 1000
+CONFIDENCE_COLUMN = 'pm'
+
+# 인코딩 이름 -> 토픽 태그
+ENCODINGS = {
+    'json': 'json',
+    'cjson': 'cj',
+    'cbor': 'cbor',
+    'msgpack': 'mp',
+}
+
+
+# ============================================
+# 열 기반 변환
+# ============================================
+
+def to_columnar(value: Any) -> Any:
+    """
+    짧은 키 + 열 기반 구조로 변환
+
+    같은 키를 가진 딕셔너리 목록(감지 결과 등)은 키별 열 목록으로 바꾼다.
+    예: [{'class': 'person', 'bbox': [..]}, ...] -> {'c': ['person', ..], 'b': [[..], ..]}
+    """
+    if isinstance(value, dict):
+        return {SHORT_KEYS.get(k, k): to_columnar(v) for k, v in value.items()}
+
+    if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        keys = list(value[0].keys())
+        if all(list(v.keys()) == keys for v in value):
+            columns = {}
+            for key in keys:
+                column = [to_columnar(v[key]) for v in value]
+                if key == 'confidence' and all(isinstance(c, (int, float)) for c in column):
+                    columns[CONFIDENCE_COLUMN] = [int(round(c * CONFIDENCE_SCALE)) for c in column]
+                else:
+                    columns[SHORT_KEYS.get(key, key)] = column
+            # 열 기반 목록 표시 (빈 열 목록과 구분)
+            columns['#'] = len(value)
+            return columns
+
+    if isinstance(value, list):
+        return [to_columnar(v) for v in value]
+
+    return value
+
+
+def from_columnar(value: Any) -> Any:
+    """to_columnar()의 역변환"""
+    if isinstance(value, dict):
+        if '#' in value:
+            rows = [{} for _ in range(value['#'])]
+            for key, column in value.items():
+                if key == '#':
+                    continue
+                if key == CONFIDENCE_COLUMN:
+                    name, column = 'confidence', [c / CONFIDENCE_SCALE for c in column]
+                else:
+                    name = LONG_KEYS.get(key, key)
+                for row, item in zip(rows, column):
+                    row[name] = from_columnar(item)
+            return rows
+        return {LONG_KEYS.get(k, k): from_columnar(v) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return [from_columnar(v) for v in value]
+
+    return value
+
+
+# ============================================
+# CBOR (RFC 8949 부분 구현 - 외부 의존성 없음)
+# ============================================
+
+def _cbor_head(major: int, length: int) -> bytes:
+    """CBOR 헤더 (major type + 길이/값)"""
+    if length < 24:
+        return bytes([(major << 5) | length])
+    if length < 0x100:
+        return bytes([(major << 5) | 24, length])
+    if length < 0x10000:
+        return bytes([(major << 5) | 25]) + struct.pack('>H', length)
+    if length < 0x100000000:
+        return bytes([(major << 5) | 26]) + struct.pack('>I', length)
+    return bytes([(major << 5) | 27]) + struct.pack('>Q', length)
+
+
+def _cbor_encode(value: Any, out: bytearray):
+    """값을 CBOR로 인코딩하여 out에 추가"""
+    if value is None:
+        out.append(0xf6)
+    elif value is True:
+        out.append(0xf5)
+    elif value is False:
+        out.append(0xf4)
+    elif isinstance(value, int):
+        if value >= 0:
+            out += _cbor_head(0, value)
+        else:
+            out += _cbor_head(1, -1 - value)
+    elif isinstance(value, float):
+        # float32로 무손실 표현 가능하면 4바이트 사용
+        packed = struct.pack('>f', value)
+        if math.isnan(value) or struct.unpack('>f', packed)[0] == value:
+            out.append(0xfa)
+            out += packed
+        else:
+            out.append(0xfb)
+            out += struct.pack('>d', value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        out += _cbor_head(3, len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        out += _cbor_head(2, len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += _cbor_head(4, len(value))
+        for item in value:
+            _cbor_encode(item, out)
+    elif isinstance(value, dict):
+        out += _cbor_head(5, len(value))
+        for key, item in value.items():
+            _cbor_encode(key, out)
+            _cbor_encode(item, out)
+    else:
+        raise TypeError(f"Unsupported type for CBOR: {type(value).__name__}")
+
+
+def cbor_dumps(value: Any) -> bytes:
+    """CBOR 인코딩"""
+    out = bytearray()
+    _cbor_encode(value, out)
+    return bytes(out)
+
+
+def _cbor_decode(data: bytes, pos: int) -> Tuple[Any, int]:
+    """pos 위치의 CBOR 값 디코딩 (값, 다음 위치)"""
+    initial = data[pos]
+    major, info = initial >> 5, initial & 0x1f
+    pos += 1
+
+    if major == 7:
+        if info == 20:
+            return False, pos
+        if info == 21:
+            return True, pos
+        if info == 22:
+            return None, pos
+        if info == 25:
+            return struct.unpack('>e', data[pos:pos + 2])[0], pos + 2
+        if info == 26:
+            return struct.unpack('>f', data[pos:pos + 4])[0], pos + 4
+        if info == 27:
+            return struct.unpack('>d', data[pos:pos + 8])[0], pos + 8
+        raise ValueError(f"Unsupported CBOR simple value: {info}")
+
+    if info < 24:
+        length = info
+    elif info in (24, 25, 26, 27):
+        size = 1 << (info - 24)
+        length = int.from_bytes(data[pos:pos + size], 'big')
+        pos += size
+    else:
+        raise ValueError(f"Unsupported CBOR length encoding: {info}")
+
+    if major == 0:
+        return length, pos
+    if major == 1:
+        return -1 - length, pos
+    if major == 2:
+        return bytes(data[pos:pos + length]), pos + length
+    if major == 3:
+        return data[pos:pos + length].decode('utf-8'), pos + length
+    if major == 4:
+        items = []
+        for _ in range(length):
+            item, pos = _cbor_decode(data, pos)
+            items.append(item)
+        return items, pos
+    if major == 5:
+        result = {}
+        for _ in range(length):
+            key, pos = _cbor_decode(data, pos)
+            result[key], pos = _cbor_decode(data, pos)
+        return result, pos
+
+    raise ValueError(f"Unsupported CBOR major type: {major}")
+
+
+def cbor_loads(data: bytes) -> Any:
+    """CBOR 디코딩"""
+    value, _ = _cbor_decode(data, 0)
+    return value
+
+
+# ============================================
+# 코덱
+# ============================================
+
+class PayloadCodec:
+    """MQTT 페이로드 인코더"""
+
+    def __init__(self, encoding: str = 'json', compress: bool = False, compress_level: int = 6):
+        """
+        Args:
+            encoding: 인코딩 (json, cjson, cbor, msgpack)
+                json: 기존 JSON (변환 없음)
+                cjson: 열 기반 짧은 키 JSON
+                cbor: 열 기반 CBOR 바이너리
+                msgpack: 열 기반 MessagePack 바이너리 (msgpack 패키지 필요)
+            compress: zlib 압축 여부
+            compress_level: zlib 압축 레벨 (1-9)
+        """
+        encoding = encoding.lower()
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown payload encoding: {encoding} (choices: {list(ENCODINGS.keys())})")
+        if encoding == 'msgpack' and not MSGPACK_AVAILABLE:
+            raise RuntimeError("msgpack이 설치되지 않았습니다. pip install msgpack")
+
+        self.encoding = encoding
+        self.compress = compress
+        self.compress_level = compress_level
+
+        # 토픽 태그 (기존 JSON은 토픽 변경 없음)
+        tag = ENCODINGS[encoding]
+        if compress:
+            tag += '-z'
+        self.tag = None if tag == 'json' else tag
+
+    @property
+    def name(self) -> str:
+        """인코딩 이름 (예: cbor+zlib)"""
+        return self.encoding + ('+zlib' if self.compress else '')
+
+    def topic(self, topic: str) -> str:
+        """인코딩 태그를 붙인 토픽 (구독 측에서 <topic>/# 로 수신)"""
+        return f"{topic}/{self.tag}" if self.tag else topic
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        """페이로드 인코딩"""
+        if self.encoding == 'json':
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        elif self.encoding == 'cjson':
+            data = json.dumps(to_columnar(payload), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        elif self.encoding == 'cbor':
+            data = cbor_dumps(to_columnar(payload))
+        else:
+            data = msgpack.packb(to_columnar(payload), use_single_float=False)
+
+        if self.compress:
+            data = zlib.compress(data, self.compress_level)
+        return data
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """페이로드 디코딩 (검증 및 구독 측 참고용)"""
+        if self.compress:
+            data = zlib.decompress(data)
+
+        if self.encoding == 'json':
+            return json.loads(data)
+        if self.encoding == 'cjson':
+            return from_columnar(json.loads(data))
+        if self.encoding == 'cbor':
+            return from_columnar(cbor_loads(data))
+        return from_columnar(msgpack.unpackb(data))
+
+
+def available_codecs() -> List[PayloadCodec]:
+    """사용 가능한 모든 인코딩 조합"""
+    codecs = []
+    for encoding in ENCODINGS:
+        if encoding == 'msgpack' and not MSGPACK_AVAILABLE:
+            continue
+        for compress in (False, True):
+            codecs.append(PayloadCodec(encoding, compress))
+    return codecs
+
+
+def _sample_message(num_detections: int, num_frames: int = 0) -> Dict[str, Any]:
+    """측정용 감지 결과 메시지 생성 (num_frames > 0이면 배치 메시지)"""
+    import random
+    rng = random.Random(0)
+    classes = ['person', 'hardhat', 'safety_vest', 'no_hardhat', 'no_safety_vest']
+
+    def detections():
+        result = []
+        for _ in range(num_detections):
+            class_id = rng.randrange(len(classes))
+            x, y = rng.randrange(1800), rng.randrange(1000)
+            result.append({
+                'class': classes[class_id],
+                'class_id': class_id,
+                'confidence': round(rng.uniform(0.5, 1.0), 3),
+                'bbox': [x, y, x + rng.randrange(20, 300), y + rng.randrange(20, 400)]
+            })
+        return result
+
+    if num_frames <= 0:
+        dets = detections()
+        return {
+            'timestamp': '2024-01-01T12:00:00.000000',
+            'thing_name': 'RaspberryPi5-PPE',
+            'detections': dets,
+            'count': len(dets)
+        }
+
+    frames = []
+    for i in range(num_frames):
+        dets = detections()
+        frames.append({'timestamp': f'2024-01-01T12:{i // 60:02d}:{i % 60:02d}.000000',
+                       'detections': dets, 'count': len(dets)})
+    return {
+        'timestamp': frames[-1]['timestamp'],
+        'thing_name': 'RaspberryPi5-PPE',
+        'batch': True,
+        'window_start': frames[0]['timestamp'],
+        'window_end': frames[-1]['timestamp'],
+        'frame_count': len(frames),
+        'count': sum(f['count'] for f in frames),
+        'frames': frames
+    }
+
+
+def main():
+    """인코딩별 메시지 크기 및 인코딩 CPU 시간 측정"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Payload Encoding Benchmark')
+    parser.add_argument('--detections', type=int, default=5,
+                        help='Detections per frame')
+    parser.add_argument('--frames', type=int, default=0,
+                        help='Frames per batch message (0 = single-frame message)')
+    parser.add_argument('--iterations', type=int, default=1000,
+                        help='Encode iterations per encoding')
+    parser.add_argument('--input', type=str, default=None,
+                        help='JSON file with a real message to measure instead of synthetic data')
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            message = json.load(f)
+    else:
+        message = _sample_message(args.detections, args.frames)
+
+    baseline = None
+    print(f"{'encoding':<14} {'bytes':>9} {'ratio':>7} {'encode_us':>10} {'roundtrip':>10}")
+    for codec in available_codecs():
+        data = codec.encode(message)
+
+        start = time.process_time()
+        for _ in range(args.iterations):
+            codec.encode(message)
+        encode_us = (time.process_time() - start) / args.iterations * 1e6
+
+        if baseline is None:
+            baseline = len(data)
+
+        roundtrip = 'ok' if codec.decode(data) == message else 'MISMATCH'
+        print(f"{codec.name:<14} {len(data):>9} {len(data) / baseline:>7.2f} {encode_us:>10.1f} {roundtrip:>10}")
+
+    if not MSGPACK_AVAILABLE:
+        print("(msgpack not installed - skipped)")
+
+
+if __name__ == '__main__':
+    main()
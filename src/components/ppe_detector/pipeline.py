@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Detection Pipeline
+캡처 / 전처리 / 추론 / 후처리 / 발행 단계를 별도 스레드로 실행하는 모듈
+단계 사이는 가장 오래된 항목을 버리는 bounded 큐로 연결
+"""
+
+import logging
+import time
+from queue import Queue, Empty
+from threading import Thread, Event, Lock
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger('Pipeline')
+
+
+class DropOldestQueue(Queue):
+    """
+    가득 차면 가장 오래된 항목을 버리는 bounded 큐
+
+    keep(item)이 참인 항목(알림 등)은 버리지 않는다. 큐가 버릴 수 없는
+    항목으로만 차 있으면 새 항목이 버릴 수 있는 항목일 때는 새 항목을 버리고,
+    버릴 수 없는 항목이면 maxsize를 넘겨서라도 추가한다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        on_drop: Callable[[Any], None] = None,
+        keep: Callable[[Any], bool] = None,
+        on_enqueue: Callable[[Any], None] = None
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            on_drop: 버려진 항목에 대해 호출할 콜백 (버퍼 반환 등)
+            keep: 버리면 안 되는 항목 판별 함수
+            on_enqueue: 항목이 큐에 들어간 뒤 호출할 콜백 (넣는 스레드에서 호출)
+        """
+        super().__init__(maxsize=maxsize)
+        self.on_drop = on_drop
+        self.keep = keep
+        self.on_enqueue = on_enqueue
+        self.dropped = 0
+
+    def _droppable(self, item: Any) -> bool:
+        """버려도 되는 항목인지 확인"""
+        return self.keep is None or not self.keep(item)
+
+    def put_latest(self, item: Any) -> bool:
+        """
+        항목 추가 (가득 차면 버릴 수 있는 가장 오래된 항목 제거)
+
+        Returns:
+            bool: 항목이 큐에 들어갔는지 여부 (새 항목을 버렸으면 False)
+        """
+        dropped = None
+        with self.not_full:
+            if self.maxsize > 0 and self._qsize() >= self.maxsize:
+                dropped = next((queued for queued in self.queue if self._droppable(queued)), None)
+                if dropped is not None:
+                    self.queue.remove(dropped)
+                elif self._droppable(item):
+                    dropped = item  # 버릴 수 없는 항목만 대기 중 - 새 항목을 버림
+
+            enqueued = dropped is not item
+            if enqueued:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+
+        if dropped is not None:
+            self.dropped += 1
+            if self.on_drop:
+                self.on_drop(dropped)
+
+        if enqueued and self.on_enqueue:
+            self.on_enqueue(item)
+
+        return enqueued
+
+
+class PipelineStage:
+    """파이프라인 단계 - 입력 큐에서 꺼내 처리하고 출력 큐로 전달"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        input_queue: Optional[DropOldestQueue] = None,
+        output_queue: Optional[DropOldestQueue] = None,
+        poll_timeout: float = 0.5,
+        source: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Args:
+            name: 단계 이름
+            func: 처리 함수. 입력 큐가 없으면 인자 없이 호출되는 소스 함수.
+                None을 반환하면 다음 단계로 전달하지 않음
+            input_queue: 입력 큐 (None이면 소스 단계)
+            output_queue: 출력 큐 (None이면 마지막 단계)
+            poll_timeout: 입력 큐 대기 시간 (초)
+            source: 소스 단계의 입력 대기 함수 (항목 또는 None 반환). 입력 큐 대기처럼
+                처리 시간에서 제외되므로, 프레임/슬롯 대기가 병목으로 잡히지 않는다
+        """
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.poll_timeout = poll_timeout
+        self.source = source
+
+        self.running = Event()
+        self.thread = None
+        self.lock = Lock()
+
+        # 통계
+        self.stats = {
+            'processed': 0,
+            'errors': 0,
+            'avg_ms': 0.0,
+            'max_ms': 0.0,
+            'last_ms': 0.0
+        }
+
+    def start(self):
+        """단계 스레드 시작"""
+        self.running.set()
+        self.thread = Thread(target=self._run, name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float = 3.0):
+        """단계 스레드 종료"""
+        self.running.clear()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+
+    def _run(self):
+        """단계 처리 루프"""
+        while self.running.is_set():
+            if self.input_queue is not None:
+                try:
+                    item = self.input_queue.get(timeout=self.poll_timeout)
+                except Empty:
+                    continue
+                args = (item,)
+            elif self.source is not None:
+                try:
+                    item = self.source()
+                except Exception as e:
+                    logger.error(f"Stage '{self.name}' source error: {e}")
+                    self.stats['errors'] += 1
+                    time.sleep(0.1)
+                    continue
+                if item is None:
+                    continue
+                args = (item,)
+            else:
+                args = ()
+
+            start = time.perf_counter()
+            try:
+                result = self.func(*args)
+            except Exception as e:
+                logger.error(f"Stage '{self.name}' error: {e}")
+                self.stats['errors'] += 1
+                time.sleep(0.1)
+                continue
+
+            if result is None:
+                continue
+
+            self._record(time.perf_counter() - start)
+
+            if self.output_queue is not None:
+                self.output_queue.put_latest(result)
+
+    def _record(self, elapsed: float):
+        """처리 시간 기록 (지수 이동 평균)"""
+        elapsed_ms = elapsed * 1000
+        with self.lock:
+            self.stats['processed'] += 1
+            self.stats['last_ms'] = elapsed_ms
+            self.stats['max_ms'] = max(self.stats['max_ms'], elapsed_ms)
+            if self.stats['processed'] == 1:
+                self.stats['avg_ms'] = elapsed_ms
+            else:
+                self.stats['avg_ms'] += 0.1 * (elapsed_ms - self.stats['avg_ms'])
+
+    def get_stats(self) -> Dict:
+        """단계 통계 반환 (입력 큐 깊이 포함)"""
+        with self.lock:
+            stats = {k: round(v, 2) if isinstance(v, float) else v for k, v in self.stats.items()}
+
+        if self.input_queue is not None:
+            stats['queue_depth'] = self.input_queue.qsize()
+            stats['queue_dropped'] = self.input_queue.dropped
+
+        return stats
+
+
+class DetectionPipeline:
+    """단계별 스레드로 구성된 감지 파이프라인"""
+
+    def __init__(self, queue_size: int = 2):
+        """
+        Args:
+            queue_size: 단계 사이 큐 크기
+        """
+        self.queue_size = queue_size
+        self.stages: List[PipelineStage] = []
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable,
+        on_drop: Callable[[Any], None] = None,
+        keep: Callable[[Any], bool] = None,
+        on_enqueue: Callable[[Any], None] = None,
+        source: Callable[[], Any] = None
+    ) -> PipelineStage:
+        """
+        단계 추가 (첫 단계는 소스 단계)
+
+        Args:
+            name: 단계 이름
+            func: 처리 함수
+            on_drop: 이 단계의 입력 큐에서 항목이 버려질 때 호출할 콜백
+            keep: 이 단계의 입력 큐에서 버리면 안 되는 항목 판별 함수
+            on_enqueue: 이 단계의 입력 큐에 항목이 들어간 뒤 호출할 콜백
+            source: 소스 단계의 입력 대기 함수 (처리 시간에서 제외)
+
+        Returns:
+            PipelineStage: 추가된 단계
+        """
+        input_queue = None
+        if self.stages:
+            input_queue = DropOldestQueue(self.queue_size, on_drop=on_drop, keep=keep, on_enqueue=on_enqueue)
+            self.stages[-1].output_queue = input_queue
+
+        stage = PipelineStage(name, func, input_queue=input_queue, source=source)
+        self.stages.append(stage)
+        return stage
+
+    def start(self):
+        """모든 단계 시작"""
+        for stage in self.stages:
+            stage.start()
+        logger.info(f"Pipeline started: {' -> '.join(s.name for s in self.stages)}")
+
+    def stop(self):
+        """모든 단계 종료 (소스 단계부터)"""
+        for stage in self.stages:
+            stage.stop()
+        logger.info("Pipeline stopped")
+
+    def is_alive(self) -> bool:
+        """모든 단계 스레드 실행 여부"""
+        return all(s.thread is not None and s.thread.is_alive() for s in self.stages)
+
+    def get_stats(self) -> Dict:
+        """단계별 통계 반환"""
+        return {stage.name: stage.get_stats() for stage in self.stages}
+
+    def get_bottleneck(self) -> Optional[str]:
+        """평균 처리 시간(입력 대기 제외)이 가장 긴 단계 이름"""
+        stats = self.get_stats()
+        if not stats:
+            return None
+        return max(stats, key=lambda name: stats[name]['avg_ms'])
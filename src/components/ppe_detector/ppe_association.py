@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+PPE Association
+사람과 PPE 감지 결과를 연결하는 모듈
+사람 박스의 머리/몸통 영역 규칙과 교차 면적 비율(IoA) 행렬을 NumPy로 계산하고
+PPE 1개는 최대 1명에게만 할당
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('PPEAssociation')
+
+# PPE 클래스별 사람 박스 내 세로 영역 (위쪽 기준 비율, 시작/끝)
+# 안전모는 사람 박스 위로 조금 벗어날 수 있으므로 음수 시작 허용
+PPE_REGIONS = {
+    'hardhat': (-0.15, 0.33),        # 머리 (상단 1/3)
+    'no_hardhat': (-0.15, 0.33),
+    'safety_glasses': (-0.05, 0.3),
+    'mask': (0.0, 0.35),
+    'safety_vest': (0.15, 0.75),     # 몸통
+    'no_safety_vest': (0.15, 0.75),
+    'gloves': (0.0, 1.0),            # 손 위치는 자세에 따라 달라 전체 영역
+}
+
+# 영역 규칙이 없는 클래스는 사람 박스 전체
+FULL_REGION = (0.0, 1.0)
+
+
+def intersection_over_area(
+    person_boxes: np.ndarray,
+    item_boxes: np.ndarray,
+    region_top: np.ndarray,
+    region_bottom: np.ndarray
+) -> np.ndarray:
+    """
+    사람 영역과 PPE 박스의 교차 면적 / PPE 박스 면적 행렬
+
+    Args:
+        person_boxes: (P, 4) 사람 박스 x1, y1, x2, y2
+        item_boxes: (Q, 4) PPE 박스 x1, y1, x2, y2
+        region_top: (Q,) PPE별 영역 시작 (사람 박스 높이 대비 비율)
+        region_bottom: (Q,) PPE별 영역 끝
+
+    Returns:
+        np.ndarray: (P, Q) IoA
+    """
+    heights = person_boxes[:, 3] - person_boxes[:, 1]
+
+    # PPE 종류별로 사람 박스의 세로 영역을 잘라서 비교
+    ry1 = person_boxes[:, 1, None] + region_top[None, :] * heights[:, None]
+    ry2 = person_boxes[:, 1, None] + region_bottom[None, :] * heights[:, None]
+
+    x1 = np.maximum(person_boxes[:, 0, None], item_boxes[None, :, 0])
+    x2 = np.minimum(person_boxes[:, 2, None], item_boxes[None, :, 2])
+    y1 = np.maximum(ry1, item_boxes[None, :, 1])
+    y2 = np.minimum(ry2, item_boxes[None, :, 3])
+
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    areas = (item_boxes[:, 2] - item_boxes[:, 0]) * (item_boxes[:, 3] - item_boxes[:, 1])
+
+    return intersection / np.maximum(areas, 1.0)[None, :]
+
+
+class PPEAssociator:
+    """사람 <-> PPE 할당기"""
+
+    def __init__(self, regions: Dict[str, Tuple[float, float]] = None, min_overlap: float = 0.3):
+        """
+        Args:
+            regions: 클래스별 사람 박스 세로 영역 (기본 PPE_REGIONS)
+            min_overlap: 할당에 필요한 최소 IoA
+        """
+        self.regions = regions or PPE_REGIONS
+        self.min_overlap = min_overlap
+
+    def associate(self, persons: List[Dict], items: List[Dict]) -> np.ndarray:
+        """
+        PPE를 사람에게 할당
+
+        IoA가 높은 쌍부터 탐욕적으로 할당하며, PPE 1개는 최대 1명에게,
+        사람 1명은 클래스별로 최대 1개의 PPE만 받는다.
+
+        Args:
+            persons: 사람 감지 결과
+            items: PPE 감지 결과
+
+        Returns:
+            np.ndarray: (Q,) PPE별 할당된 사람 인덱스 (미할당 -1)
+        """
+        assignment = np.full(len(items), -1, dtype=np.int64)
+        if not persons or not items:
+            return assignment
+
+        person_boxes = np.array([p['bbox'] for p in persons], dtype=np.float32)
+        item_boxes = np.array([i['bbox'] for i in items], dtype=np.float32)
+        regions = np.array([self.regions.get(i['class'], FULL_REGION) for i in items], dtype=np.float32)
+
+        overlap = intersection_over_area(person_boxes, item_boxes, regions[:, 0], regions[:, 1])
+
+        rows, cols = np.nonzero(overlap >= self.min_overlap)
+        order = np.argsort(-overlap[rows, cols], kind='stable')
+
+        taken = set()  # (사람 인덱스, 클래스)
+        for k in order:
+            p, q = int(rows[k]), int(cols[k])
+            if assignment[q] >= 0:
+                continue
+            slot = (p, items[q]['class'])
+            if slot in taken:
+                continue
+            taken.add(slot)
+            assignment[q] = p
+
+        return assignment
@@ -13,6 +13,9 @@ from typing import List, Dict, Optional, Tuple
 import cv2
 import numpy as np
 
+from inference_engine import InferenceEngine, OpenCVDNNEngine, create_engine
+from ppe_association import PPEAssociator
+
 logger = logging.getLogger('PPEDetector')
 
 # PPE 클래스 정의 (PPE 전용 모델용)
@@ -45,9 +48,19 @@ PPE_COLORS = {
     'mask': (128, 255, 128),       # 연두
 }
 
+# 고정 batch 모델에 배치 입력 시 엔진 오류 메시지 키워드
+# (ONNX Runtime: "Got invalid dimensions", OpenCV DNN: reshape/shape assertion)
+BATCH_SHAPE_ERROR_KEYWORDS = ('dimension', 'shape')
+
+
+def _is_batch_shape_error(error: Exception) -> bool:
+    """배치 차원/shape 불일치로 인한 추론 오류인지 판별"""
+    message = str(error).lower()
+    return any(keyword in message for keyword in BATCH_SHAPE_ERROR_KEYWORDS)
+
 
 class PPEDetector:
-    """OpenCV DNN 기반 ONNX 모델 PPE 인식기"""
+    """ONNX 모델 PPE 인식기 (OpenCV DNN / ONNX Runtime)"""
 
     def __init__(
         self,
@@ -56,7 +69,11 @@ class PPEDetector:
         iou_threshold: float = 0.45,
         input_size: Tuple[int, int] = (640, 640),
         classes: Dict[int, str] = None,
-        use_cuda: bool = False
+        use_cuda: bool = False,
+        engine: str = 'opencv',
+        engine_options: Dict = None,
+        max_candidates: int = 3000,
+        max_detections: int = 300
     ):
         """
         Args:
@@ -66,6 +83,10 @@ class PPEDetector:
             input_size: 모델 입력 크기 (width, height)
             classes: 클래스 ID -> 이름 매핑 딕셔너리
             use_cuda: CUDA 백엔드 사용 여부 (라즈베리파이에서는 False)
+            engine: 추론 엔진 ('opencv' 또는 'onnxruntime')
+            engine_options: 엔진별 옵션 (예: ONNX Runtime 스레드 수)
+            max_candidates: NMS에 넘길 최대 후보 수 (신뢰도 상위, 0이면 제한 없음)
+            max_detections: NMS 후 최대 감지 수 (0이면 제한 없음)
         """
         self.model_path = model_path
         self.confidence_threshold = confidence_threshold
@@ -73,9 +94,19 @@ class PPEDetector:
         self.input_size = input_size
         self.classes = classes or PPE_CLASSES
         self.use_cuda = use_cuda
-
-        self.net = None
-        self.output_layers = None
+        self.engine_name = (engine or 'opencv').lower()
+        self.engine_options = engine_options or {}
+        self.max_candidates = max_candidates
+        self.max_detections = max_detections
+
+        self.engine: Optional[InferenceEngine] = None
+        self.batch_supported = True  # 고정 batch 모델이면 첫 detect_batch 호출 시 False로 전환
+
+        # 전처리 버퍼 (원본 해상도별로 재사용)
+        self._buffer_key = None
+        self._geometry = None
+        self._canvas = None
+        self._blob = None
         self._load_model()
 
     def _load_model(self):
@@ -102,21 +133,13 @@ class PPEDetector:
                         f"모델 다운로드: python3 src/models/download_model.py --model yolov8n"
                     )
 
-            # OpenCV DNN으로 ONNX 모델 로드
-            self.net = cv2.dnn.readNetFromONNX(self.model_path)
+            # 추론 엔진 생성 및 모델 로드
+            options = dict(self.engine_options)
+            if self.engine_name == OpenCVDNNEngine.name:
+                options.setdefault('use_cuda', self.use_cuda)
 
-            # 백엔드 설정
-            if self.use_cuda and cv2.cuda.getCudaEnabledDeviceCount() > 0:
-                logger.info("Using CUDA backend")
-                self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
-            else:
-                logger.info("Using CPU backend")
-                self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
-                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
-
-            # 출력 레이어 이름 가져오기
-            self.output_layers = self.net.getUnconnectedOutLayersNames()
+            self.engine = create_engine(self.engine_name, self.model_path, options)
+            self.engine.load()
 
             # 워밍업 (첫 추론 속도 향상)
             logger.info("Warming up model...")
@@ -124,6 +147,7 @@ class PPEDetector:
             self._inference(dummy_input)
 
             logger.info(f"Model loaded successfully: {self.model_path}")
+            logger.info(f"Engine: {self.engine.get_info()}")
             logger.info(f"Input size: {self.input_size}")
             logger.info(f"Classes: {len(self.classes)}")
 
@@ -131,17 +155,18 @@ class PPEDetector:
             logger.error(f"Failed to load model: {e}")
             raise
 
-    def _preprocess(self, frame: np.ndarray) -> Tuple[np.ndarray, float, float, int, int]:
+    def _letterbox(self, frame: np.ndarray) -> Tuple[np.ndarray, float, int, int, int, int]:
         """
-        이미지 전처리 (YOLOv8 형식)
+        비율 유지 리사이즈 + 패딩 (letterbox)
 
         Args:
             frame: BGR 형식의 원본 이미지
 
         Returns:
-            blob: 모델 입력용 blob
-            x_factor, y_factor: 좌표 변환을 위한 스케일 팩터
+            padded: 모델 입력 크기의 letterbox 이미지
+            scale: 리사이즈 스케일
             pad_w, pad_h: 패딩 크기
+            new_w, new_h: 리사이즈된 이미지 크기
         """
         img_h, img_w = frame.shape[:2]
         input_w, input_h = self.input_size
@@ -160,15 +185,87 @@ class PPEDetector:
         padded = np.full((input_h, input_w, 3), 114, dtype=np.uint8)
         padded[pad_h:pad_h + new_h, pad_w:pad_w + new_w] = resized
 
-        # BGR -> RGB, HWC -> CHW, normalize
-        blob = cv2.dnn.blobFromImage(
-            padded,
-            scalefactor=1/255.0,
-            size=(input_w, input_h),
-            mean=(0, 0, 0),
-            swapRB=True,
-            crop=False
-        )
+        return padded, scale, pad_w, pad_h, new_w, new_h
+
+    def _prepare_buffers(self, img_w: int, img_h: int) -> Tuple[float, int, int, int, int]:
+        """
+        letterbox 캔버스와 blob 버퍼 준비 (원본 해상도가 바뀔 때만 재할당)
+
+        Args:
+            img_w, img_h: 원본 이미지 크기
+
+        Returns:
+            scale: 리사이즈 스케일
+            new_w, new_h: 리사이즈된 이미지 크기
+            pad_w, pad_h: 패딩 크기
+        """
+        if self._buffer_key == (img_w, img_h):
+            return self._geometry
+
+        input_w, input_h = self.input_size
+
+        # 비율 유지 리사이즈 크기 및 패딩 (letterbox)
+        scale = min(input_w / img_w, input_h / img_h)
+        new_w = int(img_w * scale)
+        new_h = int(img_h * scale)
+        pad_w = (input_w - new_w) // 2
+        pad_h = (input_h - new_h) // 2
+
+        # 패딩 영역은 해상도가 같으면 다시 쓸 필요 없음
+        if self._canvas is None:
+            self._canvas = np.empty((input_h, input_w, 3), dtype=np.uint8)
+            self._blob = np.empty((1, 3, input_h, input_w), dtype=np.float32)
+        self._canvas.fill(114)
+
+        self._buffer_key = (img_w, img_h)
+        self._geometry = (scale, new_w, new_h, pad_w, pad_h)
+
+        logger.debug(f"Preprocess buffers prepared for {img_w}x{img_h} (scale={scale:.4f})")
+
+        return self._geometry
+
+    def _preprocess(
+        self,
+        frame: np.ndarray,
+        blob: np.ndarray = None
+    ) -> Tuple[np.ndarray, float, float, int, int, float]:
+        """
+        이미지 전처리 (YOLOv8 형식)
+
+        검출기별 letterbox 캔버스와 blob 버퍼를 재사용한다. 원본 이미지를
+        캔버스의 ROI로 바로 리사이즈하고 blob 버퍼에 제자리 정규화하므로
+        프레임당 새 배열을 할당하지 않는다. 반환된 blob은 다음 호출에서
+        덮어쓰이므로 추론이 끝나기 전에 같은 인스턴스로 다시 호출하면 안 된다.
+        (파이프라인처럼 전처리와 추론이 겹치면 blob 버퍼를 직접 넘긴다.)
+
+        Args:
+            frame: BGR 형식의 원본 이미지
+            blob: 결과를 쓸 [1, 3, H, W] float32 버퍼 (None이면 내부 버퍼)
+
+        Returns:
+            blob: 모델 입력용 blob
+            x_factor, y_factor: 좌표 변환을 위한 스케일 팩터
+            pad_w, pad_h: 패딩 크기
+            scale: letterbox 축소 비율 (모델 입력 크기 / 원본 크기)
+        """
+        img_h, img_w = frame.shape[:2]
+        scale, new_w, new_h, pad_w, pad_h = self._prepare_buffers(img_w, img_h)
+
+        # 캔버스 ROI로 직접 리사이즈
+        roi = self._canvas[pad_h:pad_h + new_h, pad_w:pad_w + new_w]
+        cv2.resize(frame, (new_w, new_h), dst=roi, interpolation=cv2.INTER_LINEAR)
+
+        if blob is None:
+            blob = self._blob
+
+        # BGR -> RGB, HWC -> CHW, normalize (blob 버퍼에 제자리 연산)
+        for channel in range(3):
+            np.multiply(
+                self._canvas[:, :, 2 - channel],
+                np.float32(1/255.0),
+                out=blob[0, channel],
+                dtype=np.float32
+            )
 
         # 좌표 변환을 위한 팩터
         x_factor = img_w / (new_w)
@@ -187,10 +284,122 @@ class PPEDetector:
             outputs: 모델 출력
         """
         blob, x_factor, y_factor, pad_w, pad_h, scale = self._preprocess(frame)
-        self.net.setInput(blob)
-        outputs = self.net.forward(self.output_layers)
+        outputs = self.engine.infer(blob)
         return outputs, x_factor, y_factor, pad_w, pad_h, scale
 
+    def _decode_candidates(
+        self,
+        output: np.ndarray,
+        pad_w: int,
+        pad_h: int,
+        scale: float,
+        img_w: int,
+        img_h: int
+    ) -> Tuple[List[List[int]], List[float], List[int]]:
+        """
+        후보 박스 디코딩 (전체 배열 단위 벡터 연산)
+
+        앵커 행마다 Python 루프를 돌지 않고 임계값 마스크, argmax,
+        cxcywh -> xyxy 변환, letterbox 복원, 경계 클리핑을 한 번에 수행한다.
+
+        Args:
+            output: [num_anchors, 4 + num_classes] 형태의 모델 출력
+            pad_w, pad_h: 패딩 크기
+            scale: 리사이즈 스케일
+            img_w, img_h: 원본 이미지 크기
+
+        Returns:
+            boxes: NMS용 [x, y, w, h] 리스트
+            confidences: 신뢰도 리스트
+            class_ids: 클래스 ID 리스트
+        """
+        class_scores = output[:, 4:]
+
+        # 최대 점수와 클래스 ID
+        class_id_all = np.argmax(class_scores, axis=1)
+        max_scores = class_scores[np.arange(class_scores.shape[0]), class_id_all]
+
+        keep = np.flatnonzero(max_scores >= self.confidence_threshold)
+        if keep.size == 0:
+            return [], [], []
+
+        # 밀집 장면에서 NMS 비용 제한 - 신뢰도 상위 후보만 유지 (앵커 순서 유지)
+        if self.max_candidates and keep.size > self.max_candidates:
+            top = np.argpartition(-max_scores[keep], self.max_candidates - 1)[:self.max_candidates]
+            keep = keep[np.sort(top)]
+
+        max_scores = max_scores[keep]
+        class_id_all = class_id_all[keep]
+        cx, cy, w, h = output[keep, :4].T
+
+        # 패딩 제거 및 원본 좌표로 변환 (int() 와 동일하게 0 방향 절삭)
+        x1 = (((cx - w / 2) - pad_w) / scale).astype(np.int64)
+        y1 = (((cy - h / 2) - pad_h) / scale).astype(np.int64)
+        x2 = (((cx + w / 2) - pad_w) / scale).astype(np.int64)
+        y2 = (((cy + h / 2) - pad_h) / scale).astype(np.int64)
+
+        # 경계 체크
+        np.clip(x1, 0, img_w, out=x1)
+        np.clip(y1, 0, img_h, out=y1)
+        np.clip(x2, 0, img_w, out=x2)
+        np.clip(y2, 0, img_h, out=y2)
+
+        # NMS용 데이터 (x, y, w, h 형식)
+        boxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1)
+
+        return (
+            boxes.tolist(),
+            max_scores.astype(np.float64).tolist(),
+            class_id_all.tolist()
+        )
+
+    def _batched_nms(
+        self,
+        boxes: List[List[int]],
+        confidences: List[float],
+        class_ids: List[int],
+        img_w: int,
+        img_h: int
+    ) -> List[int]:
+        """
+        클래스별 NMS (좌표 오프셋 방식)
+
+        클래스마다 박스를 이미지 크기 이상 떨어진 위치로 옮긴 뒤 NMS를 한 번만
+        실행하므로 다른 클래스끼리는 서로 억제하지 않는다 (예: 안전모가 겹친
+        사람 박스를 지우지 않음).
+
+        Args:
+            boxes: [x, y, w, h] 리스트
+            confidences: 신뢰도 리스트
+            class_ids: 클래스 ID 리스트
+            img_w, img_h: 원본 이미지 크기
+
+        Returns:
+            List[int]: 유지할 후보 인덱스 (신뢰도 내림차순, 최대 max_detections개)
+        """
+        offsets = np.asarray(class_ids, dtype=np.int32) * (max(img_w, img_h) + 1)
+        shifted = np.asarray(boxes, dtype=np.int32)
+        shifted[:, 0] += offsets
+        shifted[:, 1] += offsets
+
+        indices = cv2.dnn.NMSBoxes(
+            shifted,
+            confidences,
+            self.confidence_threshold,
+            self.iou_threshold
+        )
+
+        # OpenCV 버전에 따른 indices 처리
+        if isinstance(indices, np.ndarray):
+            indices = indices.flatten().tolist()
+        else:
+            indices = [i[0] if isinstance(i, (list, tuple)) else i for i in indices]
+
+        if self.max_detections:
+            indices = indices[:self.max_detections]
+
+        return indices
+
     def _postprocess(
         self,
         outputs: np.ndarray,
@@ -232,60 +441,15 @@ class PPEDetector:
         if output.shape[0] < output.shape[1]:
             output = output.T
 
-        num_detections = output.shape[0]
-        num_classes = output.shape[1] - 4  # bbox 4개 제외
-
-        boxes = []
-        confidences = []
-        class_ids = []
-
-        for i in range(num_detections):
-            # 클래스별 점수
-            class_scores = output[i, 4:]
-
-            # 최대 점수와 클래스 ID
-            max_score = np.max(class_scores)
-            class_id = np.argmax(class_scores)
-
-            if max_score < self.confidence_threshold:
-                continue
-
-            # 바운딩 박스 (cx, cy, w, h) -> (x1, y1, x2, y2)
-            cx, cy, w, h = output[i, :4]
-
-            # 패딩 제거 및 원본 좌표로 변환
-            x1 = int(((cx - w/2) - pad_w) / scale)
-            y1 = int(((cy - h/2) - pad_h) / scale)
-            x2 = int(((cx + w/2) - pad_w) / scale)
-            y2 = int(((cy + h/2) - pad_h) / scale)
-
-            # 경계 체크
-            x1 = max(0, min(x1, img_w))
-            y1 = max(0, min(y1, img_h))
-            x2 = max(0, min(x2, img_w))
-            y2 = max(0, min(y2, img_h))
-
-            # NMS용 데이터 저장
-            boxes.append([x1, y1, x2 - x1, y2 - y1])  # x, y, w, h 형식
-            confidences.append(float(max_score))
-            class_ids.append(int(class_id))
+        boxes, confidences, class_ids = self._decode_candidates(
+            output, pad_w, pad_h, scale, img_w, img_h
+        )
 
-        # Non-Maximum Suppression
+        # 클래스별 Non-Maximum Suppression
         if len(boxes) > 0:
-            indices = cv2.dnn.NMSBoxes(
-                boxes,
-                confidences,
-                self.confidence_threshold,
-                self.iou_threshold
-            )
+            indices = self._batched_nms(boxes, confidences, class_ids, img_w, img_h)
 
-            # OpenCV 버전에 따른 indices 처리
             if len(indices) > 0:
-                if isinstance(indices, np.ndarray):
-                    indices = indices.flatten()
-                else:
-                    indices = [i[0] if isinstance(i, (list, tuple)) else i for i in indices]
-
                 for i in indices:
                     x, y, w, h = boxes[i]
                     class_id = class_ids[i]
@@ -315,7 +479,7 @@ class PPEDetector:
         Returns:
             List[Dict]: 감지 결과 목록
         """
-        if self.net is None:
+        if self.engine is None:
             logger.error("Model not loaded")
             return []
 
@@ -338,6 +502,123 @@ class PPEDetector:
             traceback.print_exc()
             return []
 
+    def new_blob_buffer(self) -> np.ndarray:
+        """preprocess()에 넘길 [1, 3, H, W] float32 blob 버퍼 생성"""
+        input_w, input_h = self.input_size
+        return np.empty((1, 3, input_h, input_w), dtype=np.float32)
+
+    def preprocess(self, frame: np.ndarray, blob: np.ndarray = None) -> Tuple[np.ndarray, Tuple]:
+        """
+        전처리 단계 (파이프라인용)
+
+        Args:
+            frame: BGR 형식의 이미지
+            blob: 결과를 쓸 blob 버퍼 (new_blob_buffer(), None이면 내부 버퍼)
+
+        Returns:
+            blob: 모델 입력용 blob
+            params: postprocess()에 넘길 좌표 변환 파라미터
+        """
+        img_h, img_w = frame.shape[:2]
+        blob, x_factor, y_factor, pad_w, pad_h, scale = self._preprocess(frame, blob)
+        return blob, (x_factor, y_factor, pad_w, pad_h, scale, img_w, img_h)
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """
+        추론 단계 (파이프라인용)
+
+        Args:
+            blob: preprocess()가 만든 blob
+
+        Returns:
+            List[np.ndarray]: 모델 출력
+        """
+        return self.engine.infer(blob)
+
+    def postprocess(self, outputs: List[np.ndarray], params: Tuple) -> List[Dict]:
+        """
+        후처리 단계 (파이프라인용)
+
+        Args:
+            outputs: infer() 결과
+            params: preprocess()가 반환한 좌표 변환 파라미터
+
+        Returns:
+            List[Dict]: 감지 결과
+        """
+        return self._postprocess(outputs, *params)
+
+    def detect_batch(self, frames: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        여러 프레임을 한 번의 추론으로 PPE 감지 (배치 추론)
+
+        N개 프레임을 하나의 NCHW blob으로 letterbox 한 뒤 한 번만 forward 하고
+        결과를 프레임별로 분리한다. 동적 batch 차원으로 내보낸 모델이 필요하며,
+        고정 batch 모델이면(배치 차원/shape 오류) 프레임별 detect()로 자동 전환한다.
+        컴포넌트 파이프라인은 프레임 단위 단계로 추론하므로 이 메서드를 사용하지 않는다.
+
+        Args:
+            frames: BGR 형식의 이미지 목록
+
+        Returns:
+            List[List[Dict]]: 입력 순서와 같은 프레임별 감지 결과 목록
+        """
+        if self.engine is None:
+            logger.error("Model not loaded")
+            return [[] for _ in frames]
+
+        if len(frames) == 0:
+            return []
+
+        if len(frames) == 1 or not self.batch_supported:
+            return [self.detect(frame) for frame in frames]
+
+        try:
+            letterboxed = [self._letterbox(frame) for frame in frames]
+
+            # BGR -> RGB, NHWC -> NCHW, normalize
+            blob = cv2.dnn.blobFromImages(
+                [lb[0] for lb in letterboxed],
+                scalefactor=1/255.0,
+                mean=(0, 0, 0),
+                swapRB=True,
+                crop=False
+            )
+
+            try:
+                outputs = self.engine.infer(blob)
+                if outputs[0].shape[0] != len(frames):
+                    raise ValueError(f"output batch shape {outputs[0].shape[0]} != {len(frames)}")
+            except Exception as e:
+                if not _is_batch_shape_error(e):
+                    raise  # 모델과 무관한 오류 - 배치 추론은 계속 사용
+                logger.warning(
+                    f"Batched inference not supported by model ({e}). "
+                    f"Falling back to per-frame inference"
+                )
+                self.batch_supported = False
+                return [self.detect(frame) for frame in frames]
+
+            # 프레임별 후처리
+            results = []
+            for i, (frame, (_, scale, pad_w, pad_h, new_w, new_h)) in enumerate(
+                zip(frames, letterboxed)
+            ):
+                img_h, img_w = frame.shape[:2]
+                frame_outputs = [output[i:i + 1] for output in outputs]
+                results.append(self._postprocess(
+                    frame_outputs, img_w / new_w, img_h / new_h,
+                    pad_w, pad_h, scale, img_w, img_h
+                ))
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Batch detection error: {e}")
+            import traceback
+            traceback.print_exc()
+            return [[] for _ in frames]
+
     def detect_and_draw(self, frame: np.ndarray) -> tuple:
         """
         감지 수행 및 결과를 이미지에 그리기
@@ -439,50 +720,94 @@ class PPEComplianceChecker:
     def __init__(
         self,
         required_ppe: List[str] = None,
-        detector: PPEDetector = None
+        detector: PPEDetector = None,
+        min_overlap: float = 0.3
     ):
         """
         Args:
             required_ppe: 필수 PPE 목록 (예: ['hardhat', 'safety_vest'])
             detector: PPEDetector 인스턴스
+            min_overlap: PPE를 사람에게 할당하기 위한 최소 교차 면적 비율
         """
         self.required_ppe = required_ppe or ['hardhat', 'safety_vest']
+        self.required_set = frozenset(self.required_ppe)
         self.detector = detector
+        self.associator = PPEAssociator(min_overlap=min_overlap)
 
-    def check_compliance(self, detections: List[Dict]) -> Dict:
+    def check_persons(self, detections: List[Dict]) -> List[Dict]:
         """
-        PPE 착용 규정 준수 확인
+        사람별 PPE 착용 상태 확인
+
+        필수 PPE와 "no_" 클래스(명시적 미착용)를 머리/몸통 영역 규칙으로
+        사람에게 할당한다. 명시적 미착용이 할당되면 해당 PPE는 누락으로 본다.
 
         Args:
             detections: 감지 결과 리스트
 
         Returns:
-            Dict: 규정 준수 결과
+            List[Dict]: [{'person', 'ppe', 'missing', 'violations'}]
         """
-        # 감지된 사람 수
         persons = [d for d in detections if d['class'] == 'person']
+        items = [
+            d for d in detections
+            if d['class'] in self.required_set
+            or (d['class'].startswith('no_') and d['class'][3:] in self.required_set)
+        ]
+
+        assignment = self.associator.associate(persons, items)
+
+        results = [{'person': p, 'ppe': set(), 'missing': set(), 'violations': []} for p in persons]
+        for item, person_index in zip(items, assignment):
+            if person_index < 0:
+                continue
+            result = results[person_index]
+            if item['class'].startswith('no_'):
+                result['violations'].append(item['class'])
+            else:
+                result['ppe'].add(item['class'])
+
+        for result in results:
+            explicit = {v[3:] for v in result['violations']}
+            result['missing'] = (self.required_set - result['ppe']) | explicit
 
-        # 감지된 PPE 종류
-        detected_ppe = set(d['class'] for d in detections
-                          if d['class'] in self.required_ppe)
+        return results
 
-        # 미착용 PPE
-        missing_ppe = set(self.required_ppe) - detected_ppe
+    def check_compliance(self, detections: List[Dict]) -> Dict:
+        """
+        PPE 착용 규정 준수 확인
+
+        Args:
+            detections: 감지 결과 리스트
+
+        Returns:
+            Dict: 규정 준수 결과
+        """
+        persons = self.check_persons(detections)
 
-        # "no_" prefix가 붙은 클래스 확인 (명시적 미착용)
-        explicit_violations = [d for d in detections
-                               if d['class'].startswith('no_')]
+        detected_ppe = set().union(*(p['ppe'] for p in persons)) if persons else set()
+        missing_ppe = set().union(*(p['missing'] for p in persons)) if persons else set()
+        violations = [v for p in persons for v in p['violations']]
+        violation_count = sum(1 for p in persons if p['missing'])
 
         result = {
-            'compliant': len(missing_ppe) == 0 and len(explicit_violations) == 0,
+            'compliant': violation_count == 0,
             'persons_detected': len(persons),
-            'detected_ppe': list(detected_ppe),
-            'missing_ppe': list(missing_ppe),
-            'violations': [d['class'] for d in explicit_violations],
+            'detected_ppe': sorted(detected_ppe),
+            'missing_ppe': sorted(missing_ppe),
+            'violations': violations,
+            'persons': [
+                {
+                    'bbox': p['person']['bbox'],
+                    'track_id': p['person'].get('track_id'),
+                    'ppe': sorted(p['ppe']),
+                    'missing_ppe': sorted(p['missing'])
+                }
+                for p in persons
+            ],
             'summary': {
                 'total_persons': len(persons),
-                'compliant_count': len(persons) - len(explicit_violations),
-                'violation_count': len(explicit_violations)
+                'compliant_count': len(persons) - violation_count,
+                'violation_count': violation_count
             }
         }
 
@@ -501,10 +826,14 @@ if __name__ == "__main__":
     parser.add_argument('--model', type=str, default='yolov8n.onnx', help='ONNX model path')
     parser.add_argument('--conf', type=float, default=0.5, help='Confidence threshold')
     parser.add_argument('--size', type=int, default=640, help='Input size')
+    parser.add_argument('--engine', type=str, default='opencv',
+                        choices=['opencv', 'onnxruntime'], help='Inference engine')
+    parser.add_argument('--threads', type=int, default=0,
+                        help='ONNX Runtime intra-op threads (0 = default)')
     args = parser.parse_args()
 
     print("=" * 50)
-    print("PPE Detector - OpenCV DNN + ONNX")
+    print(f"PPE Detector - ONNX ({args.engine})")
     print("=" * 50)
 
     # 모델 초기화
@@ -512,7 +841,9 @@ if __name__ == "__main__":
         detector = PPEDetector(
             model_path=args.model,
             confidence_threshold=args.conf,
-            input_size=(args.size, args.size)
+            input_size=(args.size, args.size),
+            engine=args.engine,
+            engine_options={'intra_op_threads': args.threads} if args.engine == 'onnxruntime' else None
         )
     except FileNotFoundError as e:
         print(f"\n오류: {e}")
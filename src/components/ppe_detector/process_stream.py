@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Process Stream Reader
+RTSP 디코더를 별도 프로세스에서 실행하고 공유 메모리 링 버퍼로 프레임을 전달하는 모듈
+메인 프로세스는 최신 슬롯을 복사 없이 매핑하며, 디코더(FFmpeg)가 죽어도
+모델을 다시 로드하지 않고 디코더 프로세스만 재시작
+"""
+
+import logging
+import multiprocessing as mp
+import signal
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from inference_pool import _attach
+from rtsp_stream import RTSPStreamReader, mask_url
+
+logger = logging.getLogger('ProcessStreamReader')
+
+# 제어 블록 (int64 배열) 인덱스 - 디코더 프로세스가 쓰고 메인 프로세스가 읽음
+CTRL_WRITE_SEQ = 0       # 마지막으로 게시된 시퀀스
+CTRL_FRAMES_READ = 1
+CTRL_FRAMES_GRABBED = 2
+CTRL_FRAMES_SKIPPED = 3
+CTRL_ERRORS = 4
+CTRL_SLOTS = 8           # 이후 ring_size개: 슬롯별 게시 시퀀스 (-1 = 쓰는 중)
+# 슬롯 시퀀스 다음 (ring_size, 3): 슬롯별 캡처 monotonic ns, 캡처 epoch ns, PTS us
+SLOT_META_FIELDS = 3
+
+
+def control_size(ring_size: int) -> int:
+    """제어 블록 int64 개수"""
+    return CTRL_SLOTS + ring_size * (1 + SLOT_META_FIELDS)
+
+
+def slot_meta(control: np.ndarray, ring_size: int) -> np.ndarray:
+    """제어 블록의 슬롯별 메타데이터 뷰 (ring_size, 3)"""
+    return control[CTRL_SLOTS + ring_size:].reshape(ring_size, SLOT_META_FIELDS)
+
+
+def _decoder_main(
+    rtsp_url: str,
+    timeout: int,
+    resize: Optional[tuple],
+    frame_stride: int,
+    sample_interval: float,
+    ring_size: int,
+    control_name: str,
+    conn,
+    frame_ready,
+    stop
+):
+    """
+    디코더 프로세스
+
+    스트림을 열고 프레임 크기를 알리면 ('open', shape, fps), 부모가 링 버퍼를
+    만들어 이름을 보낸다 ('ring', name). 이후 RTSPStreamReader와 같은 방식으로
+    grab()으로 스트림을 진행하고 필요한 프레임만 링 슬롯에 직접 디코드한다.
+    """
+    # 종료는 부모가 stop 이벤트로 알림 (Ctrl+C 시 디코더가 먼저 죽지 않도록)
+    # SIGTERM은 그대로 둔다 (부모 terminate() 및 인터프리터 종료 시 정리)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import cv2
+    from rtsp_stream import open_capture
+
+    control_shm = _attach(control_name)
+    control = np.ndarray((control_size(ring_size),), dtype=np.int64, buffer=control_shm.buf)
+    meta = slot_meta(control, ring_size)
+    cap = None
+    ring_shm = None
+    ring = None
+
+    try:
+        cap = open_capture(rtsp_url, timeout)
+        if not cap.isOpened():
+            conn.send(('error', "Failed to open RTSP stream"))
+            return
+
+        ret, frame = cap.read()
+        if not ret or frame is None:
+            conn.send(('error', "Failed to read initial frame"))
+            return
+
+        shape = (resize[1], resize[0], 3) if resize else frame.shape
+        conn.send(('open', shape, cap.get(cv2.CAP_PROP_FPS)))
+
+        if not conn.poll(timeout):
+            return
+        _, ring_name = conn.recv()
+        ring_shm = _attach(ring_name)
+        ring = np.ndarray((ring_size,) + shape, dtype=np.uint8, buffer=ring_shm.buf)
+
+        decode_buffer = None
+        grab_count = 0
+        last_retrieve_time = 0.0
+        seq = int(control[CTRL_WRITE_SEQ])  # 재시작해도 시퀀스는 이어서 증가
+
+        while not stop.is_set():
+            if not cap.grab():
+                control[CTRL_ERRORS] += 1
+                time.sleep(0.1)
+                continue
+            captured_mono_ns = time.monotonic_ns()
+            control[CTRL_FRAMES_GRABBED] += 1
+
+            # 소비자 샘플링 속도 (RTSPStreamReader._should_retrieve와 동일)
+            grab_count += 1
+            now = time.monotonic()
+            if grab_count % frame_stride != 0 or now - last_retrieve_time < sample_interval:
+                control[CTRL_FRAMES_SKIPPED] += 1
+                continue
+            last_retrieve_time = now
+
+            idx = (seq + 1) % ring_size
+            slot = ring[idx]
+            control[CTRL_SLOTS + idx] = -1  # 쓰는 중 표시
+
+            if resize:
+                ret, decoded = cap.retrieve(image=decode_buffer)
+                if not ret or decoded is None:
+                    control[CTRL_ERRORS] += 1
+                    continue
+                decode_buffer = decoded
+                cv2.resize(decoded, resize, dst=slot)
+            else:
+                ret, decoded = cap.retrieve(image=slot)
+                if not ret or decoded is None:
+                    control[CTRL_ERRORS] += 1
+                    continue
+                if decoded.shape != shape:
+                    # 링 버퍼 크기가 고정이므로 재연결로 새 링 할당
+                    logger.warning(f"Stream resolution changed to {decoded.shape}, restarting decoder")
+                    return
+                if decoded.ctypes.data != slot.ctypes.data:
+                    np.copyto(slot, decoded)
+
+            meta[idx] = (
+                captured_mono_ns,
+                time.time_ns() - (time.monotonic_ns() - captured_mono_ns),
+                int(cap.get(cv2.CAP_PROP_POS_MSEC) * 1000)
+            )
+            seq += 1
+            control[CTRL_SLOTS + idx] = seq
+            control[CTRL_WRITE_SEQ] = seq
+            control[CTRL_FRAMES_READ] += 1
+            frame_ready.set()
+
+    except (EOFError, OSError):
+        pass  # 부모 종료
+    finally:
+        if cap is not None:
+            cap.release()
+        del ring, meta, control
+        if ring_shm is not None:
+            ring_shm.close()
+        control_shm.close()
+        conn.close()
+
+
+class ProcessStreamReader(RTSPStreamReader):
+    """
+    프로세스 분리 RTSP 스트림 리더
+
+    디코더 프로세스가 공유 메모리 링 슬롯에 프레임을 쓰고 시퀀스 번호로
+    게시하면, read_frame(copy=False)는 해당 슬롯을 복사 없이 그대로 반환한다.
+    연결 상태 머신은 RTSPStreamReader와 같으며, 디코더가 죽거나 멈추면
+    디코더 프로세스만 새로 띄운다 (감지 모델과 메인 프로세스 상태는 그대로).
+    """
+
+    def __init__(self, rtsp_url: str, buffer_size: int = 2, **kwargs):
+        """
+        Args:
+            rtsp_url: RTSP 스트림 URL
+            buffer_size: 프레임 버퍼 크기 (링 슬롯 수 = buffer_size + 2)
+            **kwargs: RTSPStreamReader 인자 (timeout, resize, frame_stride, ...)
+        """
+        super().__init__(rtsp_url, buffer_size=buffer_size, **kwargs)
+
+        # 스레드가 있는 부모 프로세스를 fork하지 않도록 spawn 사용
+        self.context = mp.get_context('spawn')
+        self.process: Optional[mp.Process] = None
+        self._stop = self.context.Event()
+        self._frame_ready = self.context.Event()
+
+        # 제어 블록 (시퀀스/통계, 디코더 재시작 후에도 유지)
+        size = control_size(self.ring_size)
+        self._control_shm = shared_memory.SharedMemory(create=True, size=8 * size)
+        self._control = np.ndarray((size,), dtype=np.int64, buffer=self._control_shm.buf)
+        self._control[:] = 0
+
+        # 프레임 링 버퍼 (첫 연결에서 프레임 크기에 맞춰 생성, 해상도가 바뀌면 재생성)
+        self._ring_shm: Optional[shared_memory.SharedMemory] = None
+        self._ring: Optional[np.ndarray] = None
+        self._retired: List[shared_memory.SharedMemory] = []  # 아직 참조 중인 이전 링
+        self._shape: Optional[Tuple[int, int, int]] = None
+
+        self.stats['decoder_starts'] = 0
+        self.stats['decoder_exits'] = 0
+
+    def _open(self) -> bool:
+        """디코더 프로세스를 시작하고 스트림 연결 대기 (연결 관리 스레드)"""
+        logger.info(f"Starting decoder process: {mask_url(self.rtsp_url)}")
+
+        self._stop.clear()
+        self._frame_ready.clear()
+        parent_conn, child_conn = self.context.Pipe()
+
+        try:
+            self.process = self.context.Process(
+                target=_decoder_main,
+                args=(self.rtsp_url, self.timeout, tuple(self.resize) if self.resize else None,
+                      self.frame_stride, self.sample_interval, self.ring_size,
+                      self._control_shm.name, child_conn, self._frame_ready, self._stop),
+                name="stream-decoder",
+                daemon=True
+            )
+            self.process.start()
+            self.stats['decoder_starts'] += 1
+            child_conn.close()
+
+            # 스트림 열기 대기 (VideoCapture 타임아웃 + 프로세스 시작 여유)
+            if not parent_conn.poll(self.timeout + 10):
+                logger.error("Decoder process did not open stream in time")
+                return False
+
+            message = parent_conn.recv()
+            if message[0] == 'error':
+                logger.error(message[1])
+                return False
+
+            _, shape, fps = message
+            self._prepare_ring(tuple(shape))
+            parent_conn.send(('ring', self._ring_shm.name))
+
+        except (EOFError, OSError) as e:
+            logger.error(f"Decoder process error: {e}")
+            self.stats['errors'] += 1
+            return False
+        finally:
+            parent_conn.close()
+
+        height, width = self._shape[:2]
+        logger.info(f"Connected! Stream info: {width}x{height} @ {fps:.1f} FPS (decoder pid {self.process.pid})")
+        return True
+
+    def _prepare_ring(self, shape: Tuple[int, int, int]):
+        """프레임 크기에 맞는 링 버퍼 준비 (크기가 같으면 재사용)"""
+        self._release_retired()
+        if self._ring_shm is not None and self._shape == shape:
+            return
+
+        if self._ring_shm is not None:
+            self._ring = None
+            self._ring_shm.unlink()
+            self._retired.append(self._ring_shm)
+            self._release_retired()
+
+        nbytes = self.ring_size * int(np.prod(shape))
+        self._ring_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._ring = np.ndarray((self.ring_size,) + shape, dtype=np.uint8, buffer=self._ring_shm.buf)
+        self._shape = shape
+        self._control[CTRL_SLOTS:CTRL_SLOTS + self.ring_size] = 0
+        # 이전 링에 게시된 시퀀스는 새 링에 없으므로 읽은 것으로 처리
+        self._read_seq = max(self._read_seq, self._latest_seq())
+
+    def _release_retired(self):
+        """더 이상 참조되지 않는 이전 링 버퍼 해제"""
+        for shm in list(self._retired):
+            try:
+                shm.close()
+                self._retired.remove(shm)
+            except BufferError:
+                pass  # 파이프라인이 아직 이전 링의 프레임을 사용 중
+
+    def _stream(self):
+        """
+        디코더 감시 루프 (STREAMING 상태)
+
+        디코더의 프레임 게시를 로컬 Event로 중계한다. 디코더 프로세스가
+        종료되거나 stall_timeout 동안 grab()이 진행되지 않으면 반환한다.
+        """
+        last_grabbed = int(self._control[CTRL_FRAMES_GRABBED])
+        last_progress = time.monotonic()
+
+        while self.running.is_set() and not self._reconnect_requested.is_set():
+            if self._frame_ready.wait(0.5):
+                self._frame_ready.clear()
+                self._notify_frame()
+
+            if not self.running.is_set():
+                return
+
+            process = self.process
+            if not process.is_alive():
+                logger.warning(f"Decoder process exited ({process.exitcode})")
+                self.stats['decoder_exits'] += 1
+                return
+
+            now = time.monotonic()
+            grabbed = int(self._control[CTRL_FRAMES_GRABBED])
+            if grabbed != last_grabbed:
+                last_grabbed = grabbed
+                last_progress = now
+            elif now - last_progress >= self.stall_timeout:
+                logger.warning(f"Decoder made no progress for {self.stall_timeout:.0f}s, restarting")
+                self.stats['stalls'] += 1
+                return
+
+    def _close(self):
+        """디코더 프로세스 종료"""
+        self._stop.set()
+        process = self.process
+        if process is None:
+            return
+
+        process.join(timeout=3)
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout=1)
+        self.process = None
+
+    def _latest_seq(self) -> int:
+        """디코더가 마지막으로 게시한 시퀀스"""
+        return int(self._control[CTRL_WRITE_SEQ])
+
+    def _read_slot(self, seq: int, copy: bool) -> Optional[np.ndarray]:
+        """시퀀스 번호로 공유 메모리 슬롯 읽기 (덮어쓰였으면 None)"""
+        idx = seq % self.ring_size
+        ring = self._ring
+
+        if ring is None or self._control[CTRL_SLOTS + idx] != seq:
+            return None
+
+        frame = ring[idx]
+        if copy:
+            frame = frame.copy()
+            if self._control[CTRL_SLOTS + idx] != seq:
+                return None
+
+        return frame
+
+    def _read_info(self, seq: int) -> Optional[dict]:
+        """시퀀스 번호의 프레임 메타데이터 (디코더가 기록한 캡처 시각/PTS)"""
+        idx = seq % self.ring_size
+        captured_mono_ns, captured_at_ns, pts_us = (
+            int(v) for v in slot_meta(self._control, self.ring_size)[idx]
+        )
+        if self._control[CTRL_SLOTS + idx] != seq:
+            return None
+
+        return {
+            'seq': seq,
+            'captured_mono': captured_mono_ns / 1e9,
+            'captured_at': captured_at_ns / 1e9,
+            'pts_ms': pts_us / 1000
+        }
+
+    def release(self):
+        """리소스 해제 (디코더 종료, 공유 메모리 해제)"""
+        super().release()
+        self._close()
+
+        self._ring = None
+        if self._ring_shm is not None:
+            self._ring_shm.unlink()
+            self._retired.append(self._ring_shm)
+            self._ring_shm = None
+        self._release_retired()
+
+        self._control = self._control.copy()  # 매핑 해제 후에도 통계 조회 가능
+        self._control_shm.close()
+        self._control_shm.unlink()
+
+    def get_stats(self) -> dict:
+        """통계 반환 (디코더 프로세스 통계 포함)"""
+        stats = super().get_stats()
+        control = self._control
+        stats['frames_read'] = int(control[CTRL_FRAMES_READ])
+        stats['frames_grabbed'] = int(control[CTRL_FRAMES_GRABBED])
+        stats['frames_skipped'] = int(control[CTRL_FRAMES_SKIPPED])
+        stats['errors'] += int(control[CTRL_ERRORS])
+        process = self.process
+        stats['decoder_pid'] = process.pid if process is not None else None
+        return stats
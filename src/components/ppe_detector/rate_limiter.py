@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter
+MQTT 발행 속도 제한 모듈
+전역/토픽별 토큰 버킷과 발행 지연 기반 적응형 감속(AIMD) 지원
+"""
+
+import logging
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+logger = logging.getLogger('RateLimiter')
+
+
+class TokenBucket:
+    """토큰 버킷 (rate 토큰/초로 충전, 최대 burst개 보관)"""
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        Args:
+            rate: 초당 충전 토큰 수
+            burst: 최대 토큰 수 (None이면 rate와 같음, 최소 1)
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def refill(self, now: float, factor: float = 1.0):
+        """경과 시간만큼 토큰 충전 (factor로 충전 속도 조절)"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate * factor)
+        self.updated = now
+
+    def wait_time(self, factor: float = 1.0) -> float:
+        """토큰 1개가 생길 때까지 남은 시간 (초)"""
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / (self.rate * factor)
+
+
+class RateLimiter:
+    """전역 + 토픽별 토큰 버킷 발행 속도 제한기"""
+
+    OVERFLOW_POLICIES = ('queue', 'coalesce', 'drop')
+
+    def __init__(
+        self,
+        global_rate: float = 50.0,
+        global_burst: float = None,
+        topic_limits: Dict[str, Dict] = None,
+        latency_target: float = 2.0,
+        min_factor: float = 0.1,
+        adjust_interval: float = 5.0
+    ):
+        """
+        Args:
+            global_rate: 전체 발행 속도 상한 (메시지/초, 0이면 제한 없음)
+            global_burst: 전체 버스트 크기 (None이면 global_rate * 2)
+            topic_limits: 토픽별 제한 {토픽: {'rate', 'burst', 'overflow'}}
+                토픽은 정확히 같거나 하위 토픽(인코딩 태그 등)이면 적용
+                overflow: 속도 초과 시 정책
+                    queue: 큐에서 대기 (기본)
+                    coalesce: 같은 토픽의 대기 중 메시지를 최신 메시지로 교체
+                    drop: 새 메시지 폐기
+            latency_target: 목표 발행 지연 (초). 평균이 넘으면 속도를 절반으로 감속
+            min_factor: 감속 하한 (설정 속도 대비 비율)
+            adjust_interval: 속도 조정 최소 간격 (초)
+        """
+        self.global_bucket = None
+        if global_rate > 0:
+            self.global_bucket = TokenBucket(
+                global_rate, global_burst if global_burst is not None else global_rate * 2
+            )
+
+        self.topic_buckets: Dict[str, TokenBucket] = {}
+        self.topic_overflow: Dict[str, str] = {}
+        for topic, limit in (topic_limits or {}).items():
+            overflow = limit.get('overflow', 'queue')
+            if overflow not in self.OVERFLOW_POLICIES:
+                raise ValueError(f"Unknown overflow policy: {overflow} (choices: {self.OVERFLOW_POLICIES})")
+            self.topic_overflow[topic] = overflow
+            if limit.get('rate', 0) > 0:
+                self.topic_buckets[topic] = TokenBucket(limit['rate'], limit.get('burst'))
+
+        self.latency_target = latency_target
+        self.min_factor = min_factor
+        self.adjust_interval = adjust_interval
+
+        self.lock = Lock()
+        self.factor = 1.0  # 적응형 감속 비율 (1.0 = 설정 속도)
+        self.latency_ewma = None
+        self.last_adjust = time.monotonic()
+
+        # 통계
+        self.stats = {
+            'allowed': 0,
+            'throttled': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'backoffs': 0,
+            'recoveries': 0
+        }
+
+    def _match(self, topic: str) -> Optional[str]:
+        """토픽에 적용할 제한 키 (정확히 같거나 하위 토픽)"""
+        for key in self.topic_overflow:
+            if topic == key or topic.startswith(key + '/'):
+                return key
+        return None
+
+    def _buckets(self, topic: str):
+        """토픽에 적용되는 버킷 목록 (충전 후)"""
+        now = time.monotonic()
+        buckets = []
+        if self.global_bucket:
+            buckets.append(self.global_bucket)
+        key = self._match(topic)
+        if key in self.topic_buckets:
+            buckets.append(self.topic_buckets[key])
+        for bucket in buckets:
+            bucket.refill(now, self.factor)
+        return buckets
+
+    def overflow_policy(self, topic: str) -> str:
+        """토픽의 속도 초과 정책"""
+        return self.topic_overflow.get(self._match(topic), 'queue')
+
+    def is_limited(self, topic: str) -> bool:
+        """지금 발행하면 속도 제한에 걸리는지 여부 (토큰 소비 없음)"""
+        with self.lock:
+            return any(b.tokens < 1.0 for b in self._buckets(topic))
+
+    def try_acquire(self, topic: str) -> bool:
+        """
+        발행 토큰 획득 (모든 버킷에 토큰이 있을 때만 소비)
+
+        Returns:
+            bool: 획득 여부
+        """
+        with self.lock:
+            buckets = self._buckets(topic)
+            if any(b.tokens < 1.0 for b in buckets):
+                self.stats['throttled'] += 1
+                return False
+            for bucket in buckets:
+                bucket.tokens -= 1.0
+            self.stats['allowed'] += 1
+            return True
+
+    def wait_time(self, topic: str) -> float:
+        """토픽 발행 토큰이 생길 때까지 남은 시간 (초)"""
+        with self.lock:
+            buckets = self._buckets(topic)
+            return max((b.wait_time(self.factor) for b in buckets), default=0.0)
+
+    def acquire(self, topic: str, timeout: float) -> bool:
+        """발행 토큰을 얻을 때까지 대기 (동기 발행용)"""
+        deadline = time.monotonic() + timeout
+        while not self.try_acquire(topic):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.wait_time(topic), remaining))
+        return True
+
+    def record_overflow(self, policy: str):
+        """속도 초과로 교체/폐기된 메시지 기록"""
+        with self.lock:
+            if policy == 'coalesce':
+                self.stats['coalesced'] += 1
+            elif policy == 'drop':
+                self.stats['dropped'] += 1
+
+    def record_latency(self, latency: float, success: bool = True):
+        """
+        발행 지연 기록 및 적응형 속도 조정 (AIMD)
+
+        평균 지연이 목표를 넘거나 발행이 실패하면 속도를 절반으로 줄이고,
+        목표의 절반 아래로 내려가면 10%씩 복구한다.
+        """
+        with self.lock:
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += 0.2 * (latency - self.latency_ewma)
+
+            now = time.monotonic()
+            if now - self.last_adjust < self.adjust_interval:
+                return
+
+            if not success or self.latency_ewma > self.latency_target:
+                if self.factor > self.min_factor:
+                    self.factor = max(self.min_factor, self.factor * 0.5)
+                    self.stats['backoffs'] += 1
+                    logger.warning(
+                        f"Publish latency {self.latency_ewma * 1000:.0f}ms, "
+                        f"throttling to {self.factor:.0%} of configured rate"
+                    )
+            elif self.latency_ewma < self.latency_target * 0.5 and self.factor < 1.0:
+                self.factor = min(1.0, self.factor + 0.1)
+                self.stats['recoveries'] += 1
+                logger.info(f"Publish latency recovered, rate at {self.factor:.0%}")
+            else:
+                return
+
+            self.last_adjust = now
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        with self.lock:
+            stats = self.stats.copy()
+            stats['rate_factor'] = round(self.factor, 2)
+            stats['latency_ewma_ms'] = round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None
+            if self.global_bucket:
+                stats['global_rate'] = round(self.global_bucket.rate * self.factor, 2)
+            stats['topics'] = {
+                topic: {
+                    'rate': round(bucket.rate * self.factor, 2),
+                    'tokens': round(bucket.tokens, 2),
+                    'overflow': self.topic_overflow[topic]
+                }
+                for topic, bucket in self.topic_buckets.items()
+            }
+        return stats
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Tracker
+NumPy만 사용하는 경량 다중 객체 추적 모듈 (ByteTrack 방식)
+칼만 필터로 박스를 예측하여 감지기를 N 프레임마다 실행해도 추적 ID 유지
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from detection_delta import iou_matrix
+
+logger = logging.getLogger('Tracker')
+
+
+class KalmanBoxFilter:
+    """
+    등속 모델 칼만 필터
+
+    상태: [cx, cy, w, h, vcx, vcy, vw, vh] (속도는 프레임당 픽셀)
+    측정: [cx, cy, w, h]
+
+    노이즈 가중치는 ByteTrack 기본값으로 1 프레임 시간 간격 기준이므로
+    예측 간격은 초가 아닌 프레임 수로 받는다.
+    """
+
+    # 박스 크기에 비례하는 노이즈 가중치 (ByteTrack 기본값, 프레임당)
+    STD_POSITION = 1.0 / 20
+    STD_VELOCITY = 1.0 / 160
+
+    H = np.hstack([np.eye(4), np.zeros((4, 4))])
+
+    def __init__(self, box: np.ndarray):
+        """
+        Args:
+            box: 초기 박스 [cx, cy, w, h]
+        """
+        self.mean = np.concatenate([box, np.zeros(4)])
+        size = max(box[2], box[3])
+        std = np.array([
+            2 * self.STD_POSITION * size, 2 * self.STD_POSITION * size,
+            2 * self.STD_POSITION * size, 2 * self.STD_POSITION * size,
+            10 * self.STD_VELOCITY * size, 10 * self.STD_VELOCITY * size,
+            10 * self.STD_VELOCITY * size, 10 * self.STD_VELOCITY * size,
+        ])
+        self.covariance = np.diag(std ** 2)
+
+    def predict(self, steps: float):
+        """steps 프레임 후 상태 예측 (프레임 단위 노이즈를 steps만큼 누적)"""
+        F = np.eye(8)
+        F[:4, 4:] = np.eye(4) * steps
+
+        size = max(self.mean[2], self.mean[3])
+        std = np.concatenate([
+            np.full(4, self.STD_POSITION * size),
+            np.full(4, self.STD_VELOCITY * size)
+        ])
+        Q = np.diag(std ** 2) * steps
+
+        self.mean = F @ self.mean
+        self.covariance = F @ self.covariance @ F.T + Q
+
+        # 폭/높이가 음수가 되지 않도록 제한
+        self.mean[2:4] = np.maximum(self.mean[2:4], 1.0)
+
+    def seed_velocity(self, first_box: np.ndarray, box: np.ndarray, steps: float):
+        """
+        처음 두 감지로 속도 초기화
+
+        정지 상태(속도 0)에서 시작하면 감지 간격이 길 때 속도 추정이 느려
+        예측 박스가 이동하는 객체를 놓치므로 두 번째 매칭에서 바로 설정한다.
+        """
+        if steps > 0:
+            self.mean[4:] = (box - first_box) / steps
+
+    def update(self, box: np.ndarray):
+        """측정값으로 상태 보정"""
+        size = max(self.mean[2], self.mean[3])
+        R = np.diag(np.full(4, self.STD_POSITION * size) ** 2)
+
+        S = self.H @ self.covariance @ self.H.T + R
+        K = np.linalg.solve(S, self.H @ self.covariance).T
+        self.mean = self.mean + K @ (box - self.H @ self.mean)
+        self.covariance = (np.eye(8) - K @ self.H) @ self.covariance
+
+    def box(self) -> np.ndarray:
+        """현재 상태의 박스 [x1, y1, x2, y2]"""
+        cx, cy, w, h = self.mean[:4]
+        return np.array([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2])
+
+
+def _to_cxcywh(bbox) -> np.ndarray:
+    """[x1, y1, x2, y2] -> [cx, cy, w, h]"""
+    x1, y1, x2, y2 = bbox
+    return np.array([(x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1], dtype=np.float64)
+
+
+class Track:
+    """단일 객체 추적 상태"""
+
+    def __init__(self, track_id: int, detection: dict, timestamp: float, frame_interval: float):
+        self.track_id = track_id
+        self.class_name = detection['class']
+        self.class_id = detection['class_id']
+        self.confidence = detection['confidence']
+        self.frame_interval = frame_interval
+        self.first_box = _to_cxcywh(detection['bbox'])
+        self.first_update = timestamp
+        self.filter = KalmanBoxFilter(self.first_box)
+        self.hits = 1
+        self.last_update = timestamp
+        self.last_predict = timestamp
+
+    def predict(self, timestamp: float):
+        """timestamp 시점으로 상태 예측"""
+        dt = timestamp - self.last_predict
+        if dt > 0:
+            self.filter.predict(dt / self.frame_interval)
+            self.last_predict = timestamp
+
+    def update(self, detection: dict, timestamp: float):
+        """감지 결과로 상태 보정"""
+        box = _to_cxcywh(detection['bbox'])
+        self.filter.update(box)
+        if self.hits == 1:
+            self.filter.seed_velocity(
+                self.first_box, box, (timestamp - self.first_update) / self.frame_interval
+            )
+        self.confidence = detection['confidence']
+        self.hits += 1
+        self.last_update = timestamp
+
+    def to_detection(self) -> dict:
+        """예측 박스를 감지 결과 형식으로 변환"""
+        x1, y1, x2, y2 = self.filter.box()
+        return {
+            'class': self.class_name,
+            'class_id': self.class_id,
+            'confidence': self.confidence,
+            'bbox': [max(0, int(x1)), max(0, int(y1)), max(0, int(x2)), max(0, int(y2))],
+            'track_id': self.track_id,
+            'predicted': True
+        }
+
+
+class ByteTracker:
+    """
+    ByteTrack 방식 다중 객체 추적기
+
+    신뢰도 높은 감지를 먼저 매칭하고, 남은 추적은 낮은 신뢰도 감지와 다시
+    매칭하여 가려짐 등으로 신뢰도가 떨어진 객체의 ID를 유지한다.
+    매칭은 같은 클래스끼리만 IoU 기준 탐욕적 1:1로 수행하며, 속도를 아직
+    모르는 새 추적만 중심 거리로 한 번 더 매칭한다.
+    """
+
+    def __init__(
+        self,
+        high_threshold: float = 0.5,
+        low_threshold: float = 0.1,
+        match_iou: float = 0.3,
+        low_match_iou: float = 0.5,
+        tentative_max_shift: float = 1.0,
+        min_hits: int = 2,
+        max_age: float = 3.0,
+        frame_interval: float = 1.0
+    ):
+        """
+        Args:
+            high_threshold: 1차 매칭 및 새 추적 생성에 사용할 최소 신뢰도
+            low_threshold: 2차 매칭에 사용할 최소 신뢰도 (감지기는 이 값 이하로 실행)
+            match_iou: 1차 매칭 최소 IoU
+            low_match_iou: 2차 매칭(낮은 신뢰도 감지) 최소 IoU
+            tentative_max_shift: 3차 매칭(감지 1회 추적)의 최대 중심 이동 (박스 긴 변 대비)
+            min_hits: 예측 박스를 내보내기 위한 최소 매칭 횟수
+            max_age: 매칭되지 않은 추적을 유지하는 시간 (초)
+            frame_interval: 칼만 필터 1 스텝에 해당하는 시간 (초, 처리 프레임 간격)
+        """
+        self.high_threshold = high_threshold
+        self.low_threshold = low_threshold
+        self.match_iou = match_iou
+        self.low_match_iou = low_match_iou
+        self.tentative_max_shift = tentative_max_shift
+        self.min_hits = min_hits
+        self.max_age = max_age
+        self.frame_interval = max(frame_interval, 1e-3)
+
+        self.tracks: List[Track] = []
+        self.next_id = 1
+
+        # 통계
+        self.stats = {
+            'tracks_created': 0,
+            'tracks_removed': 0,
+            'updates': 0,
+            'predictions': 0
+        }
+
+    @staticmethod
+    def _associate(
+        tracks: List[Track],
+        detections: List[dict],
+        min_iou: float
+    ) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+        """
+        추적과 감지 매칭 (클래스가 같고 IoU가 높은 순으로 1:1)
+
+        Returns:
+            (매칭 [(추적 인덱스, 감지 인덱스)], 미매칭 추적 인덱스, 미매칭 감지 인덱스)
+        """
+        if not tracks or not detections:
+            return [], list(range(len(tracks))), list(range(len(detections)))
+
+        track_boxes = np.array([t.filter.box() for t in tracks], dtype=np.float32)
+        detection_boxes = np.array([d['bbox'] for d in detections], dtype=np.float32)
+        track_classes = np.array([t.class_id for t in tracks])
+        detection_classes = np.array([d['class_id'] for d in detections])
+
+        ious = iou_matrix(track_boxes, detection_boxes)
+        ious[track_classes[:, None] != detection_classes[None, :]] = 0.0
+
+        matches = []
+        used_tracks = set()
+        used_detections = set()
+        rows, cols = np.nonzero(ious >= min_iou)
+        for k in np.argsort(-ious[rows, cols], kind='stable'):
+            t, d = int(rows[k]), int(cols[k])
+            if t in used_tracks or d in used_detections:
+                continue
+            used_tracks.add(t)
+            used_detections.add(d)
+            matches.append((t, d))
+
+        unmatched_tracks = [t for t in range(len(tracks)) if t not in used_tracks]
+        unmatched_detections = [d for d in range(len(detections)) if d not in used_detections]
+        return matches, unmatched_tracks, unmatched_detections
+
+    @staticmethod
+    def _associate_nearest(
+        tracks: List[Track],
+        detections: List[dict],
+        max_shift: float
+    ) -> List[Tuple[int, int]]:
+        """
+        추적과 감지 매칭 (클래스가 같고 중심 거리가 가까운 순으로 1:1)
+
+        중심 거리가 추적 박스 크기(긴 변) * max_shift 이하인 쌍만 매칭한다.
+
+        Returns:
+            매칭 [(추적 인덱스, 감지 인덱스)]
+        """
+        if not tracks or not detections:
+            return []
+
+        track_boxes = np.array([t.filter.mean[:4] for t in tracks])
+        detection_boxes = np.array([_to_cxcywh(d['bbox']) for d in detections])
+        track_classes = np.array([t.class_id for t in tracks])
+        detection_classes = np.array([d['class_id'] for d in detections])
+
+        distances = np.linalg.norm(track_boxes[:, None, :2] - detection_boxes[None, :, :2], axis=2)
+        limits = np.maximum(track_boxes[:, 2], track_boxes[:, 3])[:, None] * max_shift
+        distances[(distances > limits) | (track_classes[:, None] != detection_classes[None, :])] = np.inf
+
+        matches = []
+        used_tracks = set()
+        used_detections = set()
+        rows, cols = np.nonzero(np.isfinite(distances))
+        for k in np.argsort(distances[rows, cols], kind='stable'):
+            t, d = int(rows[k]), int(cols[k])
+            if t in used_tracks or d in used_detections:
+                continue
+            used_tracks.add(t)
+            used_detections.add(d)
+            matches.append((t, d))
+        return matches
+
+    def _expire(self, timestamp: float):
+        """max_age 동안 매칭되지 않은 추적 제거"""
+        alive = [t for t in self.tracks if timestamp - t.last_update <= self.max_age]
+        self.stats['tracks_removed'] += len(self.tracks) - len(alive)
+        self.tracks = alive
+
+    def update(self, detections: List[dict], timestamp: float) -> List[dict]:
+        """
+        감지 결과로 추적 갱신 (감지기를 실행한 프레임)
+
+        Args:
+            detections: 감지 결과 목록
+            timestamp: 프레임 시각 (초)
+
+        Returns:
+            List[dict]: track_id가 추가된 감지 결과 (입력 순서 유지)
+                신뢰도 낮은 감지는 기존 추적에 매칭된 것만 포함
+        """
+        for track in self.tracks:
+            track.predict(timestamp)
+
+        high = [i for i, d in enumerate(detections) if d['confidence'] >= self.high_threshold]
+        low = [
+            i for i, d in enumerate(detections)
+            if self.low_threshold <= d['confidence'] < self.high_threshold
+        ]
+
+        # 1차: 신뢰도 높은 감지와 모든 추적 매칭
+        matches, unmatched_tracks, unmatched_high = self._associate(
+            self.tracks, [detections[i] for i in high], self.match_iou
+        )
+        assigned = {high[d]: self.tracks[t] for t, d in matches}
+
+        # 2차: 남은 추적과 신뢰도 낮은 감지 매칭
+        remaining = [self.tracks[t] for t in unmatched_tracks]
+        low_matches, _, _ = self._associate(
+            remaining, [detections[i] for i in low], self.low_match_iou
+        )
+        assigned.update({low[d]: remaining[t] for t, d in low_matches})
+
+        # 3차: 속도를 아직 모르는 추적(감지 1회)과 남은 신뢰도 높은 감지를 중심 거리로 매칭
+        # (감지 간격이 길면 이동한 박스가 정지 예측 박스와 IoU로 매칭되지 않음)
+        low_matched = {t for t, _ in low_matches}
+        tentative = [
+            track for t, track in enumerate(remaining)
+            if t not in low_matched and track.hits == 1
+        ]
+        left = [high[d] for d in unmatched_high]
+        nearest = self._associate_nearest(tentative, [detections[i] for i in left], self.tentative_max_shift)
+        assigned.update({left[d]: tentative[t] for t, d in nearest})
+
+        for index, track in assigned.items():
+            track.update(detections[index], timestamp)
+
+        # 매칭되지 않은 신뢰도 높은 감지로 새 추적 생성
+        for index in left:
+            if index in assigned:
+                continue
+            track = Track(self.next_id, detections[index], timestamp, self.frame_interval)
+            self.next_id += 1
+            self.tracks.append(track)
+            assigned[index] = track
+            self.stats['tracks_created'] += 1
+
+        self._expire(timestamp)
+        self.stats['updates'] += 1
+
+        # 추적에 매칭되지 않은 신뢰도 낮은 감지는 결과에서 제외
+        return [
+            {**d, 'track_id': assigned[i].track_id} if i in assigned else d
+            for i, d in enumerate(detections)
+            if i in assigned or d['confidence'] >= self.high_threshold
+        ]
+
+    def predict(self, timestamp: float) -> List[dict]:
+        """
+        감지기를 실행하지 않은 프레임의 추적 박스 예측
+
+        Args:
+            timestamp: 프레임 시각 (초)
+
+        Returns:
+            List[dict]: 확정된 추적의 예측 박스 (predicted=True)
+        """
+        self._expire(timestamp)
+        self.stats['predictions'] += 1
+
+        results = []
+        for track in self.tracks:
+            track.predict(timestamp)
+            if track.hits >= self.min_hits:
+                results.append(track.to_detection())
+        return results
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        stats = self.stats.copy()
+        stats['active_tracks'] = len(self.tracks)
+        return stats
+
+
+def walking_detections(
+    frame_index: int,
+    frame_interval: float,
+    speed: float,
+    count: int = 1
+) -> List[dict]:
+    """
+    등속으로 걷는 사람 감지 결과 생성 (추적 확인용)
+
+    사람 i는 수평으로 speed(px/s)로 이동하며 짝수/홀수 번째는 반대 방향으로 걷는다.
+    """
+    timestamp = frame_index * frame_interval
+    detections = []
+    for i in range(count):
+        direction = 1 if i % 2 == 0 else -1
+        x = 100 + 600 * (i % 2) + direction * speed * timestamp
+        y = 100 + 40 * i
+        detections.append({
+            'class': 'person',
+            'class_id': 0,
+            'confidence': 0.9,
+            'bbox': [int(x), y, int(x) + 60, y + 160]
+        })
+    return detections
+
+
+def main():
+    """등속 이동 객체가 감지 간격과 속도에 관계없이 추적 ID 1개를 유지하는지 확인"""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description='Tracker ID Stability Check')
+    parser.add_argument('--frame-interval', type=float, default=0.05,
+                        help='Processed frame interval in seconds')
+    parser.add_argument('--frames', type=int, default=100,
+                        help='Frames per scenario')
+    parser.add_argument('--speeds', type=str, default='50,100,200,400',
+                        help='Walking speeds in px/s (comma separated)')
+    parser.add_argument('--detect-intervals', type=str, default='1,2,3,4,5',
+                        help='Detector intervals in frames (comma separated)')
+    parser.add_argument('--persons', type=int, default=2,
+                        help='People walking in opposite directions')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'speed':>6} {'interval':>9} {'ids':>5} {'max_boxes':>10}")
+    for speed in (float(s) for s in args.speeds.split(',')):
+        for interval in (int(n) for n in args.detect_intervals.split(',')):
+            tracker = ByteTracker(frame_interval=args.frame_interval)
+            ids = set()
+            max_boxes = 0
+            for frame in range(args.frames):
+                timestamp = frame * args.frame_interval
+                if frame % interval == 0:
+                    detections = walking_detections(frame, args.frame_interval, speed, args.persons)
+                    results = tracker.update(detections, timestamp)
+                else:
+                    results = tracker.predict(timestamp)
+                ids.update(d['track_id'] for d in results if 'track_id' in d)
+                max_boxes = max(max_boxes, len(results))
+
+            ok = len(ids) == args.persons and max_boxes <= args.persons
+            failed = failed or not ok
+            print(f"{speed:>6.0f} {interval:>9} {len(ids):>5} {max_boxes:>10}{'' if ok else '  FAIL'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Violation Events
+추적 중인 사람별 PPE 미착용 이벤트 수명 주기 관리 모듈
+K 프레임 연속 미착용이면 열고, 미착용 항목이 바뀌면 갱신, 착용하거나 사라지면 닫음
+상태가 바뀔 때만 메시지 1건 발행
+"""
+
+import itertools
+import logging
+from typing import Dict, FrozenSet, List
+
+logger = logging.getLogger('ViolationEvents')
+
+# 이벤트 상태 전이
+EVENT_OPENED = 'opened'
+EVENT_UPDATED = 'updated'
+EVENT_CLOSED = 'closed'
+
+
+class ViolationEvent:
+    """사람 1명의 진행 중인 미착용 이벤트"""
+
+    def __init__(self, event_id: int, track_id: int, missing: FrozenSet[str], person: dict, timestamp: float):
+        self.event_id = event_id
+        self.track_id = track_id
+        self.missing = missing
+        self.opened_at = timestamp
+        self.last_seen = timestamp
+        self.bbox = person['bbox']
+        self.confidence = person['confidence']
+        self.compliant_frames = 0
+
+    def observe(self, person: dict, timestamp: float):
+        """현재 프레임 위치 반영"""
+        self.last_seen = timestamp
+        self.bbox = person['bbox']
+        self.confidence = person['confidence']
+
+
+class ViolationEventEngine:
+    """추적 ID 기준 미착용 이벤트 엔진"""
+
+    def __init__(
+        self,
+        open_frames: int = 3,
+        close_frames: int = 3,
+        lost_timeout: float = 5.0
+    ):
+        """
+        Args:
+            open_frames: 이벤트를 열기 위한 연속 미착용 프레임 수
+            close_frames: 이벤트를 닫기 위한 연속 착용 프레임 수
+            lost_timeout: 사람이 보이지 않은 채 이 시간(초)이 지나면 이벤트 닫음
+        """
+        self.open_frames = open_frames
+        self.close_frames = close_frames
+        self.lost_timeout = lost_timeout
+
+        self.events: Dict[int, ViolationEvent] = {}  # track_id -> 이벤트
+        self.streaks: Dict[int, int] = {}  # track_id -> 연속 미착용 프레임 수
+        self.event_ids = itertools.count(1)
+
+        # 통계
+        self.stats = {
+            'opened': 0,
+            'updated': 0,
+            'closed': 0
+        }
+
+    def _transition(self, state: str, event: ViolationEvent, timestamp: float, reason: str = None) -> dict:
+        """상태 전이 메시지 생성"""
+        self.stats[state] += 1
+        transition = {
+            'event': state,
+            'event_id': event.event_id,
+            'track_id': event.track_id,
+            'missing_ppe': sorted(event.missing),
+            'person_bbox': event.bbox,
+            'confidence': event.confidence,
+            'opened_at': event.opened_at,
+            'duration': round(timestamp - event.opened_at, 2)
+        }
+        if state == EVENT_CLOSED:
+            transition['closed_at'] = timestamp
+            transition['close_reason'] = reason
+        return transition
+
+    def update(self, persons: List[dict], timestamp: float) -> List[dict]:
+        """
+        프레임 관측 반영
+
+        Args:
+            persons: 추적 중인 사람 목록 [{'track_id', 'bbox', 'confidence', 'missing_ppe'}]
+                track_id가 없는 사람은 무시
+            timestamp: 프레임 시각 (초)
+
+        Returns:
+            List[dict]: 이번 프레임의 상태 전이 (opened, updated, closed)
+        """
+        transitions = []
+        seen = set()
+
+        for person in persons:
+            track_id = person.get('track_id')
+            if track_id is None:
+                continue
+            seen.add(track_id)
+
+            missing = frozenset(person['missing_ppe'])
+            event = self.events.get(track_id)
+
+            if missing:
+                if event is None:
+                    streak = self.streaks.get(track_id, 0) + 1
+                    self.streaks[track_id] = streak
+                    if streak >= self.open_frames:
+                        del self.streaks[track_id]
+                        event = ViolationEvent(next(self.event_ids), track_id, missing, person, timestamp)
+                        self.events[track_id] = event
+                        transitions.append(self._transition(EVENT_OPENED, event, timestamp))
+                else:
+                    event.observe(person, timestamp)
+                    event.compliant_frames = 0
+                    if missing != event.missing:
+                        event.missing = missing
+                        transitions.append(self._transition(EVENT_UPDATED, event, timestamp))
+            else:
+                self.streaks.pop(track_id, None)
+                if event is not None:
+                    event.observe(person, timestamp)
+                    event.compliant_frames += 1
+                    if event.compliant_frames >= self.close_frames:
+                        del self.events[track_id]
+                        transitions.append(self._transition(EVENT_CLOSED, event, timestamp, 'compliant'))
+
+        # 이번 프레임에 보이지 않은 사람은 연속 프레임 초기화
+        for track_id in [t for t in self.streaks if t not in seen]:
+            del self.streaks[track_id]
+
+        # 일정 시간 보이지 않은 사람의 이벤트 닫기
+        for track_id, event in list(self.events.items()):
+            if track_id not in seen and timestamp - event.last_seen >= self.lost_timeout:
+                del self.events[track_id]
+                transitions.append(self._transition(EVENT_CLOSED, event, timestamp, 'lost'))
+
+        return transitions
+
+    def close_all(self, timestamp: float, reason: str = 'shutdown') -> List[dict]:
+        """진행 중인 이벤트 모두 닫기 (종료 시)"""
+        transitions = [
+            self._transition(EVENT_CLOSED, event, timestamp, reason)
+            for event in self.events.values()
+        ]
+        self.events.clear()
+        self.streaks.clear()
+        return transitions
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        stats = self.stats.copy()
+        stats['active'] = len(self.events)
+        return stats
+
+
+def main():
+    """걷는 미착용 작업자마다 이벤트가 정확히 1건 열리는지 확인 (추적기와 연동)"""
+    import argparse
+    import sys
+
+    from tracker import ByteTracker, walking_detections
+
+    parser = argparse.ArgumentParser(description='Violation Event Check')
+    parser.add_argument('--frame-interval', type=float, default=0.05,
+                        help='Processed frame interval in seconds')
+    parser.add_argument('--frames', type=int, default=200,
+                        help='Frames to simulate')
+    parser.add_argument('--speeds', type=str, default='50,100,200',
+                        help='Walking speeds in px/s (comma separated)')
+    parser.add_argument('--detect-intervals', type=str, default='1,3,5',
+                        help='Detector intervals in frames (comma separated)')
+    parser.add_argument('--persons', type=int, default=2,
+                        help='Non-compliant people walking in opposite directions')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'speed':>6} {'interval':>9} {'opened':>7} {'updated':>8} {'closed':>7}")
+    for speed in (float(s) for s in args.speeds.split(',')):
+        for interval in (int(n) for n in args.detect_intervals.split(',')):
+            tracker = ByteTracker(frame_interval=args.frame_interval)
+            engine = ViolationEventEngine()
+            for frame in range(args.frames):
+                timestamp = frame * args.frame_interval
+                if frame % interval == 0:
+                    detections = walking_detections(frame, args.frame_interval, speed, args.persons)
+                    results = tracker.update(detections, timestamp)
+                else:
+                    results = tracker.predict(timestamp)
+                persons = [{**d, 'missing_ppe': {'hardhat'}} for d in results]
+                engine.update(persons, timestamp)
+
+            stats = engine.get_stats()
+            ok = stats['opened'] == args.persons and stats['closed'] == 0
+            failed = failed or not ok
+            print(f"{speed:>6.0f} {interval:>9} {stats['opened']:>7} {stats['updated']:>8} "
+                  f"{stats['closed']:>7}{'' if ok else '  FAIL'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,15 +11,27 @@ PPE 모델 다운로드 및 ONNX 변환 스크립트
 2. 라즈베리파이에서 실행 (PyTorch 없는 환경):
    - 사전 변환된 ONNX 모델을 GitHub에서 다운로드
    - 추가 의존성 없음
+
+선택: --quantize 옵션으로 현장 프레임을 사용한 INT8 정적 양자화 수행
+   - pip install onnxruntime 필요
+   - FP32/INT8 지연 시간 및 mAP 비교 리포트 생성 (--engine으로 측정 엔진 선택)
 """
 
 import os
 import sys
 import argparse
+import json
+import time
 import urllib.request
 import shutil
 from pathlib import Path
 
+# 컴포넌트 모듈 경로 (PPEDetector, 추론 엔진 재사용)
+COMPONENT_DIR = Path(__file__).resolve().parents[1] / 'components' / 'ppe_detector'
+
+# 캘리브레이션/평가용 이미지 확장자
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
 # 사전 변환된 ONNX 모델 URL (GitHub Releases 등에서 호스팅)
 ONNX_MODEL_URLS = {
     'yolov8n': 'https://github.com/ultralytics/assets/releases/download/v8.2.0/yolov8n.onnx',
@@ -78,7 +90,12 @@ def download_onnx_direct(model_name: str, output_dir: str) -> str:
         return None
 
 
-def convert_to_onnx(model_name: str, output_dir: str, input_size: int = 640) -> str:
+def convert_to_onnx(
+    model_name: str,
+    output_dir: str,
+    input_size: int = 640,
+    dynamic: bool = False
+) -> str:
     """
     YOLOv8 모델을 다운로드하고 ONNX로 변환 (개발 PC에서 실행)
 
@@ -86,6 +103,7 @@ def convert_to_onnx(model_name: str, output_dir: str, input_size: int = 640) ->
         model_name: 모델 이름 (yolov8n, yolov8s, yolov8m 등)
         output_dir: 저장 디렉토리
         input_size: 입력 이미지 크기
+        dynamic: 동적 batch 차원으로 내보내기 (PPEDetector.detect_batch용)
 
     Returns:
         저장된 ONNX 모델 경로
@@ -117,7 +135,7 @@ def convert_to_onnx(model_name: str, output_dir: str, input_size: int = 640) ->
     output_path = Path(output_dir) / f"{model_name}.onnx"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    print(f"ONNX로 변환 중... (입력 크기: {input_size}x{input_size})")
+    print(f"ONNX로 변환 중... (입력 크기: {input_size}x{input_size}, 동적 batch: {dynamic})")
 
     # ONNX 내보내기
     model.export(
@@ -125,7 +143,7 @@ def convert_to_onnx(model_name: str, output_dir: str, input_size: int = 640) ->
         imgsz=input_size,
         simplify=True,  # ONNX 그래프 단순화
         opset=12,       # ONNX opset 버전 (OpenCV DNN 호환성)
-        dynamic=False,  # 고정 입력 크기 (추론 최적화)
+        dynamic=dynamic,  # False: 고정 입력 크기 (추론 최적화), True: 배치 추론 지원
     )
 
     # 내보낸 파일 이동
@@ -185,6 +203,416 @@ def verify_onnx_model(model_path: str) -> bool:
         return False
 
 
+def _list_images(image_dir: str, limit: int = None) -> list:
+    """디렉토리 내 이미지 파일 목록 (정렬)"""
+    paths = sorted(
+        p for p in Path(image_dir).iterdir()
+        if p.suffix.lower() in IMAGE_EXTENSIONS
+    )
+    return paths[:limit] if limit else paths
+
+
+def _letterbox_blob(image, input_size: int):
+    """PPEDetector와 동일한 letterbox 전처리 ([1, 3, H, W] float32 blob)"""
+    import cv2
+    import numpy as np
+
+    img_h, img_w = image.shape[:2]
+    scale = min(input_size / img_w, input_size / img_h)
+    new_w = int(img_w * scale)
+    new_h = int(img_h * scale)
+
+    resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    pad_w = (input_size - new_w) // 2
+    pad_h = (input_size - new_h) // 2
+
+    padded = np.full((input_size, input_size, 3), 114, dtype=np.uint8)
+    padded[pad_h:pad_h + new_h, pad_w:pad_w + new_w] = resized
+
+    return cv2.dnn.blobFromImage(padded, 1/255.0, swapRB=True)
+
+
+def quantize_to_int8(
+    model_path: str,
+    calib_dir: str,
+    output_path: str = None,
+    input_size: int = 640,
+    calib_size: int = 200,
+    per_channel: bool = True,
+    exclude_nodes: list = None
+) -> str:
+    """
+    현장 프레임으로 캘리브레이션하여 INT8 정적 양자화 (QDQ 형식)
+
+    Args:
+        model_path: FP32 ONNX 모델 경로
+        calib_dir: 캘리브레이션 이미지 디렉토리 (현장 카메라 프레임)
+        output_path: INT8 모델 저장 경로 (기본: <모델명>_int8.onnx)
+        input_size: 입력 이미지 크기
+        calib_size: 캘리브레이션에 사용할 최대 이미지 수
+        per_channel: 채널별 가중치 양자화 여부
+        exclude_nodes: 양자화에서 제외할 노드 이름 목록 (예: 검출 헤드)
+
+    Returns:
+        저장된 INT8 모델 경로
+    """
+    try:
+        import cv2
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            CalibrationMethod,
+            QuantFormat,
+            QuantType,
+            quant_pre_process,
+            quantize_static,
+        )
+        import onnx
+        from onnx import version_converter
+    except ImportError:
+        print("오류: onnxruntime/onnx 패키지가 설치되지 않았습니다.")
+        print("  pip install onnxruntime onnx")
+        return None
+
+    images = _list_images(calib_dir, calib_size)
+    if not images:
+        print(f"오류: 캘리브레이션 이미지가 없습니다: {calib_dir}")
+        return None
+
+    if output_path is None:
+        model_file = Path(model_path)
+        output_path = str(model_file.with_name(f"{model_file.stem}_int8.onnx"))
+
+    class ImageFolderCalibrationReader(CalibrationDataReader):
+        """이미지 디렉토리 기반 캘리브레이션 데이터 리더"""
+
+        def __init__(self, input_name: str):
+            self.input_name = input_name
+            self.iterator = iter(images)
+
+        def get_next(self):
+            for path in self.iterator:
+                image = cv2.imread(str(path))
+                if image is None:
+                    print(f"  건너뜀 (읽기 실패): {path}")
+                    continue
+                return {self.input_name: _letterbox_blob(image, input_size)}
+            return None
+
+    model = onnx.load(model_path)
+    input_name = model.graph.input[0].name
+
+    print(f"INT8 정적 양자화 중: {model_path}")
+    print(f"캘리브레이션 이미지: {len(images)}장 ({calib_dir})")
+
+    # 채널별 양자화(DequantizeLinear axis)는 opset 13 이상 필요
+    # (convert_to_onnx는 OpenCV DNN 호환을 위해 opset 12로 내보냄)
+    source_path = model_path
+    upgraded_path = str(Path(output_path).with_suffix('.opset13.onnx'))
+    opset = next((o.version for o in model.opset_import if o.domain in ('', 'ai.onnx')), 0)
+    if per_channel and opset < 13:
+        print(f"  opset {opset} -> 13 변환 (채널별 양자화)")
+        onnx.save(version_converter.convert_version(model, 13), upgraded_path)
+        source_path = upgraded_path
+
+    # 양자화 전처리 (shape inference + 그래프 최적화)
+    preprocessed_path = str(Path(output_path).with_suffix('.pre.onnx'))
+    try:
+        quant_pre_process(source_path, preprocessed_path, skip_symbolic_shape=True)
+        source_path = preprocessed_path
+    except Exception as e:
+        print(f"  양자화 전처리 건너뜀: {e}")
+
+    start = time.time()
+    quantize_static(
+        model_input=source_path,
+        model_output=output_path,
+        calibration_data_reader=ImageFolderCalibrationReader(input_name),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=per_channel,
+        calibrate_method=CalibrationMethod.MinMax,
+        nodes_to_exclude=exclude_nodes or [],
+    )
+
+    for temp_path in (upgraded_path, preprocessed_path):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    fp32_size = os.path.getsize(model_path) / (1024 * 1024)
+    int8_size = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"INT8 모델 저장됨: {output_path} ({time.time() - start:.1f}초)")
+    print(f"모델 크기: {fp32_size:.2f} MB -> {int8_size:.2f} MB")
+
+    return output_path
+
+
+def measure_latency(
+    model_path: str,
+    input_size: int = 640,
+    runs: int = 50,
+    threads: int = 0,
+    engine: str = 'opencv'
+) -> dict:
+    """
+    CPU 추론 지연 시간 측정 (컴포넌트와 같은 추론 엔진 사용)
+
+    Args:
+        model_path: ONNX 모델 경로
+        input_size: 입력 이미지 크기
+        runs: 측정 반복 횟수
+        threads: 스레드 수 (0 = 기본값, onnxruntime: intra-op, opencv: cv2.setNumThreads)
+        engine: 추론 엔진 ('opencv', 'onnxruntime') - 컴포넌트 INFERENCE_ENGINE과 동일하게
+
+    Returns:
+        지연 시간 통계 (ms)
+    """
+    import cv2
+    import numpy as np
+
+    sys.path.insert(0, str(COMPONENT_DIR))
+    from inference_engine import create_engine
+
+    options = None
+    if threads > 0:
+        if engine == 'onnxruntime':
+            options = {'intra_op_threads': threads}
+        else:
+            cv2.setNumThreads(threads)
+
+    runner = create_engine(engine, model_path, options)
+    runner.load()
+    dummy = np.random.default_rng(0).random((1, 3, input_size, input_size), dtype=np.float32)
+
+    # 워밍업
+    for _ in range(3):
+        runner.infer(dummy)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        runner.infer(dummy)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings = np.array(timings)
+    return {
+        'mean_ms': round(float(timings.mean()), 2),
+        'p50_ms': round(float(np.percentile(timings, 50)), 2),
+        'p95_ms': round(float(np.percentile(timings, 95)), 2),
+    }
+
+
+def _average_precision(recall, precision) -> float:
+    """101점 보간 AP (COCO 방식)"""
+    import numpy as np
+
+    # 정밀도 포락선 (오른쪽에서 누적 최대)
+    precision = np.flip(np.maximum.accumulate(np.flip(precision)))
+
+    points = np.linspace(0, 1, 101)
+    indices = np.searchsorted(recall, points, side='left')
+    values = np.where(indices < len(precision),
+                      precision[np.minimum(indices, len(precision) - 1)], 0.0)
+
+    return float(values.mean())
+
+
+def _box_iou(boxes1, boxes2):
+    """[N, 4] x [M, 4] xyxy 박스 IoU 행렬"""
+    import numpy as np
+
+    x1 = np.maximum(boxes1[:, None, 0], boxes2[None, :, 0])
+    y1 = np.maximum(boxes1[:, None, 1], boxes2[None, :, 1])
+    x2 = np.minimum(boxes1[:, None, 2], boxes2[None, :, 2])
+    y2 = np.minimum(boxes1[:, None, 3], boxes2[None, :, 3])
+
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area1 = (boxes1[:, 2] - boxes1[:, 0]) * (boxes1[:, 3] - boxes1[:, 1])
+    area2 = (boxes2[:, 2] - boxes2[:, 0]) * (boxes2[:, 3] - boxes2[:, 1])
+
+    return inter / np.maximum(area1[:, None] + area2[None, :] - inter, 1e-9)
+
+
+def evaluate_map(
+    model_path: str,
+    eval_dir: str,
+    input_size: int = 640,
+    confidence_threshold: float = 0.001,
+    engine: str = 'opencv'
+) -> dict:
+    """
+    라벨링된 평가 세트에서 mAP 측정
+
+    eval_dir 구조 (YOLO 형식):
+        eval_dir/images/*.jpg
+        eval_dir/labels/*.txt   (class cx cy w h, 0~1 정규화)
+
+    Args:
+        model_path: ONNX 모델 경로
+        eval_dir: 평가 세트 디렉토리
+        input_size: 입력 이미지 크기
+        confidence_threshold: 평가용 최소 신뢰도
+        engine: 추론 엔진 ('opencv', 'onnxruntime')
+
+    Returns:
+        mAP@0.5, mAP@0.5:0.95 및 클래스별 AP@0.5
+    """
+    import cv2
+    import numpy as np
+
+    sys.path.insert(0, str(COMPONENT_DIR))
+    from ppe_model import PPEDetector
+
+    detector = PPEDetector(
+        model_path=model_path,
+        confidence_threshold=confidence_threshold,
+        input_size=(input_size, input_size),
+        engine=engine
+    )
+
+    image_dir = Path(eval_dir) / 'images'
+    label_dir = Path(eval_dir) / 'labels'
+
+    predictions = []   # (image_idx, class_id, confidence, box)
+    ground_truths = {}  # (image_idx, class_id) -> [M, 4]
+
+    images = _list_images(str(image_dir))
+    for image_idx, path in enumerate(images):
+        image = cv2.imread(str(path))
+        if image is None:
+            continue
+        img_h, img_w = image.shape[:2]
+
+        label_path = label_dir / f"{path.stem}.txt"
+        if label_path.exists():
+            labels = np.loadtxt(label_path, ndmin=2)
+            for class_id, cx, cy, w, h in labels[:, :5]:
+                box = [(cx - w / 2) * img_w, (cy - h / 2) * img_h,
+                       (cx + w / 2) * img_w, (cy + h / 2) * img_h]
+                ground_truths.setdefault((image_idx, int(class_id)), []).append(box)
+
+        for det in detector.detect(image):
+            predictions.append((image_idx, det['class_id'], det['confidence'], det['bbox']))
+
+    class_ids = sorted(set(c for _, c in ground_truths))
+    iou_thresholds = np.linspace(0.5, 0.95, 10)
+    ap_table = {}
+
+    for class_id in class_ids:
+        gts = {k[0]: np.array(v, dtype=np.float64)
+               for k, v in ground_truths.items() if k[1] == class_id}
+        num_gt = sum(len(v) for v in gts.values())
+        preds = sorted((p for p in predictions if p[1] == class_id), key=lambda p: -p[2])
+
+        aps = []
+        for iou_threshold in iou_thresholds:
+            matched = {k: np.zeros(len(v), dtype=bool) for k, v in gts.items()}
+            tp = np.zeros(len(preds))
+
+            for i, (image_idx, _, _, box) in enumerate(preds):
+                if image_idx not in gts:
+                    continue
+                ious = _box_iou(np.array([box], dtype=np.float64), gts[image_idx])[0]
+                ious[matched[image_idx]] = 0
+                best = int(np.argmax(ious))
+                if ious[best] >= iou_threshold:
+                    matched[image_idx][best] = True
+                    tp[i] = 1
+
+            tp_cum = np.cumsum(tp)
+            fp_cum = np.cumsum(1 - tp)
+            recall = tp_cum / max(num_gt, 1)
+            precision = tp_cum / np.maximum(tp_cum + fp_cum, 1e-9)
+            aps.append(_average_precision(recall, precision) if len(preds) else 0.0)
+
+        ap_table[detector.classes.get(class_id, f'class_{class_id}')] = aps
+
+    if not ap_table:
+        return {'images': len(images), 'map50': 0.0, 'map50_95': 0.0, 'per_class_ap50': {}}
+
+    return {
+        'images': len(images),
+        'map50': round(float(np.mean([aps[0] for aps in ap_table.values()])), 4),
+        'map50_95': round(float(np.mean([np.mean(aps) for aps in ap_table.values()])), 4),
+        'per_class_ap50': {name: round(aps[0], 4) for name, aps in ap_table.items()},
+    }
+
+
+def write_quantization_report(
+    fp32_path: str,
+    int8_path: str,
+    eval_dir: str = None,
+    input_size: int = 640,
+    runs: int = 50,
+    threads: int = 0,
+    engine: str = 'opencv',
+    report_path: str = None
+) -> dict:
+    """
+    FP32 / INT8 모델 지연 시간 및 mAP 비교 리포트 작성
+
+    Args:
+        fp32_path: FP32 ONNX 모델 경로
+        int8_path: INT8 ONNX 모델 경로
+        eval_dir: 라벨링된 평가 세트 디렉토리 (None이면 mAP 생략)
+        input_size: 입력 이미지 크기
+        runs: 지연 시간 측정 반복 횟수
+        threads: 스레드 수 (0 = 기본값)
+        engine: 지연 시간/mAP 측정에 사용할 추론 엔진 ('opencv', 'onnxruntime')
+        report_path: 리포트 JSON 경로 (기본: <INT8 모델>_report.json)
+
+    Returns:
+        리포트 딕셔너리
+    """
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'input_size': input_size,
+        'engine': engine,
+        'fp32': {'path': fp32_path, 'size_mb': round(os.path.getsize(fp32_path) / (1024 * 1024), 2)},
+        'int8': {'path': int8_path, 'size_mb': round(os.path.getsize(int8_path) / (1024 * 1024), 2)},
+    }
+
+    print(f"지연 시간 측정 중 ({engine} CPU)...")
+    for key, path in (('fp32', fp32_path), ('int8', int8_path)):
+        report[key]['latency'] = measure_latency(path, input_size, runs, threads, engine)
+
+    report['speedup'] = round(
+        report['fp32']['latency']['mean_ms'] / report['int8']['latency']['mean_ms'], 2
+    )
+
+    if eval_dir:
+        print(f"mAP 평가 중: {eval_dir}")
+        for key, path in (('fp32', fp32_path), ('int8', int8_path)):
+            report[key]['accuracy'] = evaluate_map(path, eval_dir, input_size, engine=engine)
+        report['map50_drop'] = round(
+            report['fp32']['accuracy']['map50'] - report['int8']['accuracy']['map50'], 4
+        )
+
+    if report_path is None:
+        report_path = str(Path(int8_path).with_name(f"{Path(int8_path).stem}_report.json"))
+
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    # 요약 출력
+    print("")
+    print(f"{'':8}{'크기(MB)':>10}{'평균(ms)':>10}{'p95(ms)':>10}{'mAP50':>8}{'mAP50-95':>10}")
+    for key in ('fp32', 'int8'):
+        entry = report[key]
+        accuracy = entry.get('accuracy', {})
+        print(f"{key.upper():8}{entry['size_mb']:>10.2f}"
+              f"{entry['latency']['mean_ms']:>10.1f}{entry['latency']['p95_ms']:>10.1f}"
+              f"{accuracy.get('map50', float('nan')):>8.3f}"
+              f"{accuracy.get('map50_95', float('nan')):>10.3f}")
+    print(f"속도 향상: {report['speedup']:.2f}x")
+    if 'map50_drop' in report:
+        print(f"mAP50 하락: {report['map50_drop']:.4f}")
+    print(f"리포트 저장됨: {report_path}")
+
+    return report
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='PPE 인식 ONNX 모델 다운로드/변환',
@@ -197,8 +625,19 @@ def main():
   # 개발 PC: PyTorch 모델을 ONNX로 변환
   python3 download_model.py --model yolov8n --convert
 
+  # 개발 PC: 배치 추론(detect_batch)용 동적 batch 모델 변환
+  python3 download_model.py --model yolov8n --convert --dynamic
+
   # 모델 검증
   python3 download_model.py --model yolov8n --verify
+
+  # INT8 정적 양자화 (현장 프레임으로 캘리브레이션, 평가 세트로 mAP 비교)
+  python3 download_model.py --model yolov8n --quantize \\
+      --calib-dir ./site_frames --eval-dir ./site_eval
+
+  # 기존 ONNX 모델(예: 커스텀 PPE 모델)을 양자화
+  python3 download_model.py --source ./models/ppe_yolov8n.onnx --quantize \\
+      --calib-dir ./site_frames
         """
     )
     parser.add_argument(
@@ -219,6 +658,11 @@ def main():
         action='store_true',
         help='PyTorch 모델을 ONNX로 변환 (ultralytics 필요, 개발 PC용)'
     )
+    parser.add_argument(
+        '--dynamic',
+        action='store_true',
+        help='동적 batch 차원으로 변환 (--convert와 함께 사용, 배치 추론용)'
+    )
     parser.add_argument(
         '--verify', '-v',
         action='store_true',
@@ -230,25 +674,90 @@ def main():
         default=640,
         help='입력 이미지 크기 (기본: 640)'
     )
+    parser.add_argument(
+        '--source',
+        type=str,
+        default=None,
+        help='다운로드/변환 대신 사용할 기존 ONNX 모델 경로'
+    )
+    parser.add_argument(
+        '--quantize', '-q',
+        action='store_true',
+        help='INT8 정적 양자화 수행 (onnxruntime 필요, --calib-dir 필수)'
+    )
+    parser.add_argument(
+        '--calib-dir',
+        type=str,
+        default=None,
+        help='캘리브레이션 이미지 디렉토리 (현장 카메라 프레임)'
+    )
+    parser.add_argument(
+        '--calib-size',
+        type=int,
+        default=200,
+        help='캘리브레이션에 사용할 최대 이미지 수 (기본: 200)'
+    )
+    parser.add_argument(
+        '--eval-dir',
+        type=str,
+        default=None,
+        help='mAP 평가 세트 디렉토리 (images/, labels/ YOLO 형식)'
+    )
+    parser.add_argument(
+        '--exclude-nodes',
+        type=str,
+        default='',
+        help='양자화에서 제외할 노드 이름 (쉼표 구분, 예: 검출 헤드)'
+    )
+    parser.add_argument(
+        '--bench-runs',
+        type=int,
+        default=50,
+        help='지연 시간 측정 반복 횟수 (기본: 50)'
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=0,
+        help='지연 시간 측정 시 스레드 수 (0 = 기본값)'
+    )
+    parser.add_argument(
+        '--engine',
+        type=str,
+        default='opencv',
+        choices=['opencv', 'onnxruntime'],
+        help='지연 시간/mAP 측정 추론 엔진 (기본: opencv, 컴포넌트 INFERENCE_ENGINE과 동일하게)'
+    )
 
     args = parser.parse_args()
 
+    if args.quantize and not args.calib_dir:
+        parser.error("--quantize 사용 시 --calib-dir이 필요합니다")
+
     print("=" * 50)
     print("  PPE 인식 ONNX 모델 다운로드")
     print("=" * 50)
     print("")
     print(f"모델: {args.model}")
     print(f"저장 경로: {args.output}")
-    print(f"모드: {'변환 (개발 PC)' if args.convert else '직접 다운로드'}")
+    if args.source:
+        print(f"모드: 기존 모델 사용 ({args.source})")
+    else:
+        print(f"모드: {'변환 (개발 PC)' if args.convert else '직접 다운로드'}")
+    if args.quantize:
+        print(f"양자화: INT8 (캘리브레이션: {args.calib_dir})")
     print("")
 
     # 출력 디렉토리 생성
     os.makedirs(args.output, exist_ok=True)
 
     # 모델 다운로드/변환
-    if args.convert:
+    if args.source:
+        # 기존 ONNX 모델 사용
+        model_path = args.source if os.path.exists(args.source) else None
+    elif args.convert:
         # 개발 PC: ultralytics로 변환
-        model_path = convert_to_onnx(args.model, args.output, args.size)
+        model_path = convert_to_onnx(args.model, args.output, args.size, args.dynamic)
     else:
         # 라즈베리파이: 사전 변환된 ONNX 직접 다운로드
         model_path = download_onnx_direct(args.model, args.output)
@@ -266,6 +775,36 @@ def main():
         if not verify_onnx_model(model_path):
             sys.exit(1)
 
+    # INT8 양자화
+    if args.quantize:
+        print("")
+        print("-" * 50)
+        print("INT8 양자화")
+        print("-" * 50)
+        exclude_nodes = [n.strip() for n in args.exclude_nodes.split(',') if n.strip()]
+        int8_path = quantize_to_int8(
+            model_path,
+            args.calib_dir,
+            input_size=args.size,
+            calib_size=args.calib_size,
+            exclude_nodes=exclude_nodes
+        )
+        if int8_path is None:
+            print("\nINT8 양자화 실패")
+            sys.exit(1)
+
+        print("")
+        write_quantization_report(
+            model_path,
+            int8_path,
+            eval_dir=args.eval_dir,
+            input_size=args.size,
+            runs=args.bench_runs,
+            threads=args.threads,
+            engine=args.engine
+        )
+        model_path = int8_path
+
     print("")
     print("=" * 50)
     print("  완료!")